@@ -53,6 +53,9 @@ class SettingsManager:
             "default_translation_mode": "auto",
             "default_source_language": "auto",  # Default source language (auto = auto-detect)
             "force_cpu": False,  # Force CPU to bypass GPU issues
+            "precision": "auto",  # Decoding precision (auto = FP16 on CUDA/MPS, fp16, fp32)
+            "translation_cache": True,  # Keep translations on disk (~/.cache/transcribe_ro) between runs
+            "print_segments": False,  # Print Whisper's segment lines to the console while transcribing
         },
         "ui": {
             "window_width": 1200,
@@ -234,6 +237,9 @@ class PreferencesDialog:
         self.default_translation_var = tk.StringVar()
         self.default_source_lang_var = tk.StringVar()
         self.force_cpu_var = tk.BooleanVar()
+        self.precision_var = tk.StringVar()
+        self.translation_cache_var = tk.BooleanVar()
+        self.print_segments_var = tk.BooleanVar()
         
         # Language options for source language dropdown
         self.language_options = {
@@ -459,10 +465,10 @@ class PreferencesDialog:
         row2.pack(fill=tk.X, pady=5)
         ttk.Label(row2, text="Dispozitiv (Device):", width=30).pack(side=tk.LEFT)
         device_combo = ttk.Combobox(row2, textvariable=self.default_device_var,
-                                    values=["auto", "cpu", "mps", "cuda"],
+                                    values=["auto", "cpu", "cpu-int8", "mps", "cuda"],
                                     state="readonly", width=15)
         device_combo.pack(side=tk.LEFT, padx=(0, 10))
-        ttk.Label(row2, text="(auto = detectează cel mai bun)", font=("Helvetica", 8),
+        ttk.Label(row2, text="(auto = detectează cel mai bun, cpu-int8 = CPU rapid)", font=("Helvetica", 8),
                   foreground="gray").pack(side=tk.LEFT)
         
         # Force CPU checkbox
@@ -489,6 +495,31 @@ class PreferencesDialog:
         ttk.Label(row4, text="(auto = online mai întâi, apoi offline)", font=("Helvetica", 8),
                   foreground="gray").pack(side=tk.LEFT)
         
+        # Persistent translation cache
+        row4b = ttk.Frame(settings_section)
+        row4b.pack(fill=tk.X, pady=5)
+        ttk.Checkbutton(row4b, text="💾 Memorează traducerile pe disc (Cache translations on disk)",
+                        variable=self.translation_cache_var).pack(side=tk.LEFT)
+        
+        # Whisper console output
+        row4c = ttk.Frame(settings_section)
+        row4c.pack(fill=tk.X, pady=5)
+        ttk.Checkbutton(row4c, text="🖨️ Afișează segmentele în consolă (Print segments to console)",
+                        variable=self.print_segments_var).pack(side=tk.LEFT)
+        ttk.Label(row4c, text="(mai lent pe fișiere lungi)", font=("Helvetica", 8),
+                  foreground="gray").pack(side=tk.LEFT, padx=(10, 0))
+        
+        # Decoding precision
+        row5 = ttk.Frame(settings_section)
+        row5.pack(fill=tk.X, pady=5)
+        ttk.Label(row5, text="Precizie (Precision):", width=30).pack(side=tk.LEFT)
+        precision_combo = ttk.Combobox(row5, textvariable=self.precision_var,
+                                       values=["auto", "fp16", "fp32"],
+                                       state="readonly", width=15)
+        precision_combo.pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Label(row5, text="(auto = FP16 pe GPU, fp32 dacă apar erori NaN)", font=("Helvetica", 8),
+                  foreground="gray").pack(side=tk.LEFT)
+        
         # Note about defaults
         note_frame = ttk.Frame(defaults_frame)
         note_frame.pack(fill=tk.X, pady=(10, 0))
@@ -535,6 +566,9 @@ class PreferencesDialog:
         self.default_device_var.set(self.settings_manager.get("transcription", "default_device", "auto"))
         self.default_translation_var.set(self.settings_manager.get("transcription", "default_translation_mode", "auto"))
         self.force_cpu_var.set(self.settings_manager.get("transcription", "force_cpu", False))
+        self.precision_var.set(self.settings_manager.get("transcription", "precision", "auto"))
+        self.translation_cache_var.set(self.settings_manager.get("transcription", "translation_cache", True))
+        self.print_segments_var.set(self.settings_manager.get("transcription", "print_segments", False))
         
         # Source language - convert code to display name
         source_lang_code = self.settings_manager.get("transcription", "default_source_language", "auto")
@@ -740,12 +774,8 @@ class PreferencesDialog:
                             "   Va fi salvat oricum / Will be saved anyway.")
         
         # Convert source language display name back to code
-        source_lang_name = self.default_source_lang_var.get()
-        source_lang_code = "auto"
-        for code, name in self.language_options.items():
-            if name == source_lang_name:
-                source_lang_code = code
-                break
+        language_codes = {name: code for code, name in self.language_options.items()}
+        source_lang_code = language_codes.get(self.default_source_lang_var.get(), "auto")
         
         # Save all settings
         self.settings_manager.set("general", "hf_token", token)
@@ -756,6 +786,9 @@ class PreferencesDialog:
         self.settings_manager.set("transcription", "default_translation_mode", self.default_translation_var.get())
         self.settings_manager.set("transcription", "default_source_language", source_lang_code)
         self.settings_manager.set("transcription", "force_cpu", self.force_cpu_var.get())
+        self.settings_manager.set("transcription", "precision", self.precision_var.get())
+        self.settings_manager.set("transcription", "translation_cache", self.translation_cache_var.get())
+        self.settings_manager.set("transcription", "print_segments", self.print_segments_var.get())
         
         # Save to file
         if self.settings_manager.save_settings():
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Test script for the reusable float32 sample buffer used when decoding audio.
+"""
+
+import os
+import sys
+
+import numpy as np
+
+# Add the project directory to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _pcm_bytes(samples):
+    return np.asarray(samples, dtype='<i2').tobytes()
+
+
+def test_matches_legacy_conversion():
+    """The conversion gives the same samples as the old astype/divide path."""
+    print("="*80)
+    print("TEST 1: Conversion Matches Legacy Path")
+    print("="*80)
+
+    from transcribe_ro import SampleBuffer, _pcm16_to_float32
+
+    raw = _pcm_bytes(np.arange(-32768, 32768, 7))
+    legacy = np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+
+    for buffer in (None, SampleBuffer()):
+        audio = _pcm16_to_float32(raw, buffer)
+        assert audio.dtype == np.float32, f"Unexpected dtype: {audio.dtype}"
+        assert np.array_equal(audio, legacy), "Samples differ from the legacy conversion!"
+
+    print("  ✓ Fresh and buffered conversions match the legacy samples")
+
+
+def test_second_conversion_reuses_buffer():
+    """A second conversion that fits is written into the same storage."""
+    print("\n" + "="*80)
+    print("TEST 2: Buffer Reuse")
+    print("="*80)
+
+    from transcribe_ro import SampleBuffer, _pcm16_to_float32
+
+    buffer = SampleBuffer()
+    first = _pcm16_to_float32(_pcm_bytes(range(100)), buffer)
+    storage = buffer.array
+    assert storage is not None, "Buffer was not filled by the first conversion!"
+
+    second = _pcm16_to_float32(_pcm_bytes(range(50)), buffer)
+    assert buffer.array is storage, "Second conversion reallocated the buffer!"
+    assert np.shares_memory(first, second), "Second conversion did not reuse the storage!"
+    assert len(second) == 50, f"Unexpected length: {len(second)}"
+    assert np.array_equal(second, np.arange(50, dtype=np.float32) / 32768.0), "Reused samples are wrong!"
+
+    print("  ✓ Second conversion reuses the first buffer")
+
+
+def test_buffer_grows_for_longer_audio():
+    """Longer audio reallocates once, and later shorter audio reuses the bigger buffer."""
+    print("\n" + "="*80)
+    print("TEST 3: Buffer Growth")
+    print("="*80)
+
+    from transcribe_ro import SampleBuffer, _pcm16_to_float32
+
+    buffer = SampleBuffer()
+    _pcm16_to_float32(_pcm_bytes(range(10)), buffer)
+    _pcm16_to_float32(_pcm_bytes(range(1000)), buffer)
+    grown = buffer.array
+    assert len(grown) == 1000, f"Buffer did not grow: {len(grown)}"
+
+    _pcm16_to_float32(_pcm_bytes(range(10)), buffer)
+    assert buffer.array is grown, "Shorter audio reallocated the grown buffer!"
+
+    print("  ✓ Buffer grows to the longest audio and is kept")
+
+
+def main():
+    """Run all tests."""
+    print("\n" + "="*80)
+    print("SAMPLE BUFFER TEST SUITE")
+    print("="*80)
+
+    try:
+        test_matches_legacy_conversion()
+        test_second_conversion_reuses_buffer()
+        test_buffer_grows_for_longer_audio()
+
+        print("\n" + "="*80)
+        print("✅ ALL TESTS PASSED!")
+        print("="*80)
+        return 0
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
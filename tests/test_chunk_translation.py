@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Test script for online chunk translation: each uncached chunk is its own request,
+so one chunk that cannot be translated does not cost the others.
+"""
+
+import os
+import sys
+
+# Add the project directory to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Keep the tests away from the user's on-disk translation cache
+os.environ['TRANSCRIBE_NO_TRANSLATION_CACHE'] = '1'
+
+
+class TranslationNotFound(Exception):
+    """Stand-in for deep_translator.exceptions.TranslationNotFound."""
+
+
+class FakeGoogleTranslator:
+    """Behaves like deep-translator: translate_batch() is one translate() per text."""
+
+    requests = []
+    fail = {}  # text -> exception raised for it
+
+    def __init__(self, source, target):
+        pass
+
+    def translate(self, text):
+        FakeGoogleTranslator.requests.append(text)
+        if text in self.fail:
+            raise self.fail[text]
+        return f"RO:{text}"
+
+    def translate_batch(self, texts):
+        return [self.translate(text) for text in texts]
+
+
+def _make_transcriber(fail):
+    import transcribe_ro
+
+    transcribe_ro.GoogleTranslator = FakeGoogleTranslator
+    transcribe_ro.ONLINE_TRANSLATOR_AVAILABLE = transcribe_ro.TRANSLATOR_AVAILABLE = True
+    transcribe_ro._retry_delay = lambda attempt: 0
+    FakeGoogleTranslator.requests = []
+    FakeGoogleTranslator.fail = fail
+
+    transcriber = transcribe_ro.AudioTranscriber(model_name="tiny", device="cpu", verbose=False,
+                                                 translation_mode="online")
+    # Each test starts from an empty cache
+    transcriber._translation_cache = transcribe_ro.TranslationCache(persistent=False)
+    return transcriber
+
+
+def test_failing_segment_keeps_only_its_original():
+    """One untranslatable segment out of eleven leaves the other ten translated."""
+    print("="*80)
+    print("TEST 1: Failure Isolation")
+    print("="*80)
+
+    segments = [f"Segment number {i}." for i in range(10)] + ["Bad segment."]
+    transcriber = _make_transcriber({"Bad segment.": TranslationNotFound("No translation was found")})
+
+    translated = transcriber.translate_to_romanian_batch(segments, source_lang="en")
+
+    assert translated[:10] == [f"RO:{s}" for s in segments[:10]], f"Good segments lost: {translated}"
+    assert translated[10] == "Bad segment.", "Failing segment should keep its original text!"
+    # Ten single requests plus max_retries attempts for the failing one
+    assert len(FakeGoogleTranslator.requests) == 13, f"Unexpected requests: {FakeGoogleTranslator.requests}"
+
+    print("  ✓ 10 of 11 segments translated; the failing one kept its original")
+
+
+def test_repeats_translated_once():
+    """Repeated segments go out once and are mapped back to every occurrence."""
+    print("\n" + "="*80)
+    print("TEST 2: Repeated Segments")
+    print("="*80)
+
+    transcriber = _make_transcriber({})
+    segments = ["Yes.", "No.", "Yes.", "42.", "Yes."]
+
+    translated = transcriber.translate_to_romanian_batch(segments, source_lang="en")
+
+    assert translated == ["RO:Yes.", "RO:No.", "RO:Yes.", "42.", "RO:Yes."], f"Unexpected: {translated}"
+    assert sorted(FakeGoogleTranslator.requests) == ["No.", "Yes."], \
+        f"Unexpected requests: {FakeGoogleTranslator.requests}"
+
+    print("  ✓ Each distinct segment requested once; numbers passed through")
+
+
+def test_parallel_requests_keep_order():
+    """Misses are translated on parallel workers and come back in input order."""
+    print("\n" + "="*80)
+    print("TEST 3: Parallel Requests")
+    print("="*80)
+
+    import threading
+
+    transcriber = _make_transcriber({})
+    transcriber.translate_concurrency = 4
+    threads = set()
+    translate = FakeGoogleTranslator.translate
+
+    def recording_translate(self, text):
+        threads.add(threading.current_thread().name)
+        return translate(self, text)
+
+    FakeGoogleTranslator.translate = recording_translate
+    try:
+        segments = [f"Sentence {i}." for i in range(40)]
+        translated = transcriber.translate_to_romanian_batch(segments, source_lang="en")
+    finally:
+        FakeGoogleTranslator.translate = translate
+
+    assert translated == [f"RO:{s}" for s in segments], "Translations out of order!"
+    assert all(name.startswith("transcribe-translate") for name in threads), f"Unexpected threads: {threads}"
+    assert 1 <= len(threads) <= 4, f"Worker count not bounded: {threads}"
+
+    print(f"  ✓ 40 segments translated in order on {len(threads)} worker(s)")
+
+
+def test_network_error_fails_whole_batch():
+    """An error that hits every chunk (network down) is not swallowed per chunk."""
+    print("\n" + "="*80)
+    print("TEST 4: Network Errors")
+    print("="*80)
+
+    transcriber = _make_transcriber({"Hello there.": ConnectionError("Connection refused")})
+
+    translated = transcriber.translate_to_romanian_batch(["Hello there.", "Goodbye."], source_lang="en")
+
+    assert translated == ["Hello there.", "Goodbye."], f"Expected originals back: {translated}"
+    assert transcriber.translation_status == "Failed - Translation error", \
+        f"Unexpected status: {transcriber.translation_status}"
+
+    print("  ✓ Network failure reported for the batch, originals kept")
+
+
+def main():
+    """Run all tests."""
+    print("\n" + "="*80)
+    print("CHUNK TRANSLATION TEST SUITE")
+    print("="*80)
+
+    try:
+        test_failing_segment_keeps_only_its_original()
+        test_repeats_translated_once()
+        test_parallel_requests_keep_order()
+        test_network_error_fails_whole_batch()
+
+        print("\n" + "="*80)
+        print("✅ ALL TESTS PASSED!")
+        print("="*80)
+        return 0
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
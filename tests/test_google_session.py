@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Test script for the keep-alive session proxy used for deep-translator's Google requests.
+"""
+
+import os
+import sys
+import threading
+import types
+
+# Add the project directory to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class FakeSession:
+    """Stand-in for requests.Session that records which thread created it."""
+
+    def __init__(self):
+        self.thread = threading.current_thread().name
+
+    def get(self, url, **kwargs):
+        return ('session', self)
+
+
+def _fake_requests():
+    return types.SimpleNamespace(get=lambda url, **kwargs: ('plain', None), Session=FakeSession,
+                                 codes=types.SimpleNamespace(ok=200))
+
+
+def _with_proxy(test):
+    """Run test(proxy) with _google_session() bound to a proxy over the fake requests module."""
+    import transcribe_ro
+
+    proxy = transcribe_ro._SessionRequests(_fake_requests())
+    real_install = transcribe_ro._install_google_requests
+    transcribe_ro._install_google_requests = lambda: proxy
+    try:
+        return test(proxy, transcribe_ro._google_session)
+    finally:
+        transcribe_ro._install_google_requests = real_install
+
+
+def test_plain_get_outside_block():
+    """Outside _google_session() the proxy is plain requests.get()."""
+    print("="*80)
+    print("TEST 1: Plain Requests Outside the Block")
+    print("="*80)
+
+    def run(proxy, google_session):
+        outside = proxy.get("https://example.invalid")
+        with google_session():
+            inside = proxy.get("https://example.invalid")
+        after = proxy.get("https://example.invalid")
+        return outside, inside, after, proxy.codes.ok
+
+    outside, inside, after, ok = _with_proxy(run)
+    assert outside[0] == 'plain' and after[0] == 'plain', "Session used outside the block!"
+    assert inside[0] == 'session', "Session not used inside the block!"
+    assert ok == 200, "Other requests attributes should pass through!"
+
+    print("  ✓ Only requests made inside the block use the session")
+
+
+def test_session_per_thread():
+    """Each thread gets its own Session, reused across its requests."""
+    print("\n" + "="*80)
+    print("TEST 2: One Session per Thread")
+    print("="*80)
+
+    def run(proxy, google_session):
+        sessions = {}
+
+        def worker(name):
+            with google_session():
+                first = proxy.get("https://example.invalid")[1]
+                second = proxy.get("https://example.invalid")[1]
+            sessions[name] = (first, second)
+
+        threads = [threading.Thread(target=worker, args=(f"w{i}",), name=f"w{i}") for i in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return sessions
+
+    sessions = _with_proxy(run)
+    assert all(first is second for first, second in sessions.values()), "Session not reused within a thread!"
+    assert len({id(first) for first, _ in sessions.values()}) == 3, "Threads shared a Session!"
+    assert all(first.thread == name for name, (first, _) in sessions.items()), "Session made on another thread!"
+
+    print("  ✓ Three threads, three sessions, each reused by its own thread")
+
+
+def main():
+    """Run all tests."""
+    print("\n" + "="*80)
+    print("GOOGLE SESSION TEST SUITE")
+    print("="*80)
+
+    try:
+        test_plain_get_outside_block()
+        test_session_per_thread()
+
+        print("\n" + "="*80)
+        print("✅ ALL TESTS PASSED!")
+        print("="*80)
+        return 0
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
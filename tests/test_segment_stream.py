@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Test script for the Whisper print hook that streams segments during transcription.
+
+A stand-in whisper.transcribe module prints and drives its progress bar the way
+Whisper does, so the hook is tested without loading a model.
+"""
+
+import io
+import os
+import sys
+import types
+from contextlib import redirect_stdout
+
+# Add the project directory to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class FakeBar:
+    """Records how Whisper's tqdm bar was created."""
+
+    created = []
+
+    def __init__(self, total=None, unit=None, disable=False):
+        FakeBar.created.append(disable)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def update(self, n=1):
+        pass
+
+
+def _fake_whisper_modules():
+    """Build whisper.transcribe / whisper.tokenizer stand-ins."""
+    transcribe_module = types.ModuleType('whisper.transcribe')
+    transcribe_module.tqdm = types.SimpleNamespace(tqdm=FakeBar)
+    source = '''
+def transcribe(verbose):
+    if verbose:
+        print("Detected language: English")
+    with tqdm.tqdm(total=300, unit="frames", disable=verbose is not False) as pbar:
+        for i, text in enumerate([" Hello there.", " How are you?"]):
+            if verbose:
+                print(f"[00:0{i}.000 --> 00:0{i + 1}.000]{text}")
+            pbar.update(100)
+'''
+    exec(source, transcribe_module.__dict__)
+
+    tokenizer_module = types.ModuleType('whisper.tokenizer')
+    tokenizer_module.TO_LANGUAGE_CODE = {'english': 'en', 'romanian': 'ro'}
+    return {'whisper.transcribe': transcribe_module, 'whisper.tokenizer': tokenizer_module}
+
+
+def _with_fake_whisper(test):
+    """Run test(transcribe_module) with the stand-in modules installed, then restore sys.modules."""
+    fakes = _fake_whisper_modules()
+    saved = {name: sys.modules.get(name) for name in fakes}
+    sys.modules.update(fakes)
+    try:
+        return test(fakes['whisper.transcribe'])
+    finally:
+        for name, module in saved.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+
+
+def test_segments_and_language_streamed():
+    """Segment text and the detected language reach the callbacks; segment lines are not printed."""
+    print("="*80)
+    print("TEST 1: Streamed Segments and Language")
+    print("="*80)
+
+    from transcribe_ro import _whisper_segment_stream
+
+    def run(transcribe_module):
+        segments, languages = [], []
+        out = io.StringIO()
+        with redirect_stdout(out), _whisper_segment_stream(segments.append, languages.append):
+            transcribe_module.transcribe(verbose=True)
+        return segments, languages, out.getvalue()
+
+    segments, languages, printed = _with_fake_whisper(run)
+
+    assert segments == ["Hello there.", "How are you?"], f"Unexpected segments: {segments}"
+    assert languages == ["en"], f"Unexpected languages: {languages}"
+    assert "Detected language: English" in printed, "Language line should still be printed!"
+    assert "-->" not in printed, f"Segment lines leaked to the console: {printed!r}"
+
+    print("  ✓ Segments and language code streamed; only the language line printed")
+
+
+def test_progress_bar_stays_visible():
+    """verbose=True for the hook does not hide Whisper's console progress bar."""
+    print("\n" + "="*80)
+    print("TEST 2: Console Progress Bar")
+    print("="*80)
+
+    from transcribe_ro import _whisper_segment_stream
+
+    def run(transcribe_module):
+        FakeBar.created = []
+        with redirect_stdout(io.StringIO()), _whisper_segment_stream(lambda text: None, lambda code: None):
+            transcribe_module.transcribe(verbose=True)
+        return list(FakeBar.created)
+
+    created = _with_fake_whisper(run)
+    assert created == [False], f"Progress bar was disabled: {created}"
+
+    print("  ✓ Progress bar drawn while segments are streamed")
+
+
+def test_echo_prints_segments():
+    """With echo (AudioTranscriber verbose=True) segment lines are printed as well as streamed."""
+    print("\n" + "="*80)
+    print("TEST 3: Echoed Segments")
+    print("="*80)
+
+    from transcribe_ro import _whisper_segment_stream
+
+    def run(transcribe_module):
+        segments = []
+        out = io.StringIO()
+        with redirect_stdout(out), _whisper_segment_stream(segments.append, echo=True):
+            transcribe_module.transcribe(verbose=True)
+        return segments, out.getvalue()
+
+    segments, printed = _with_fake_whisper(run)
+    assert segments == ["Hello there.", "How are you?"], f"Unexpected segments: {segments}"
+    assert "[00:00.000 --> 00:01.000] Hello there." in printed, f"Segment line not echoed: {printed!r}"
+
+    print("  ✓ Segment lines streamed and echoed")
+
+
+def test_hook_restored():
+    """print and tqdm are put back on the module afterwards, also after an error."""
+    print("\n" + "="*80)
+    print("TEST 4: Hook Restored")
+    print("="*80)
+
+    from transcribe_ro import _whisper_segment_stream
+
+    def run(transcribe_module):
+        tqdm_module = transcribe_module.tqdm
+        try:
+            with _whisper_segment_stream(lambda text: None):
+                raise RuntimeError("decode failed")
+        except RuntimeError:
+            pass
+        return 'print' in transcribe_module.__dict__, transcribe_module.tqdm is tqdm_module
+
+    has_print, same_tqdm = _with_fake_whisper(run)
+    assert not has_print, "Module print hook left installed!"
+    assert same_tqdm, "Module tqdm not restored!"
+
+    print("  ✓ Module print and tqdm restored")
+
+
+def main():
+    """Run all tests."""
+    print("\n" + "="*80)
+    print("WHISPER SEGMENT STREAM TEST SUITE")
+    print("="*80)
+
+    try:
+        test_segments_and_language_streamed()
+        test_progress_bar_stays_visible()
+        test_echo_prints_segments()
+        test_hook_restored()
+
+        print("\n" + "="*80)
+        print("✅ ALL TESTS PASSED!")
+        print("="*80)
+        return 0
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
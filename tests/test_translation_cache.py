@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Test script for the persistent translation cache (TranslationCache).
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+# Add the project directory to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def test_make_key():
+    """Keys separate backends, language pairs and texts, and are stable."""
+    print("="*80)
+    print("TEST 1: Cache Keys")
+    print("="*80)
+
+    from transcribe_ro import TranslationCache, TRANSLATION_CACHE_VERSION
+
+    key = TranslationCache.make_key("Hello world", "en")
+    assert key == TranslationCache.make_key("Hello world", "en"), "Key is not deterministic!"
+    assert key.startswith(f"v{TRANSLATION_CACHE_VERSION}|online|en|ro|"), f"Unexpected key layout: {key}"
+
+    others = {
+        TranslationCache.make_key("Hello world", "en", backend='offline'),
+        TranslationCache.make_key("Hello world", "fr"),
+        TranslationCache.make_key("Hello world", "en", target_lang='de'),
+        TranslationCache.make_key("Hello world!", "en"),
+    }
+    assert key not in others and len(others) == 4, "Distinct inputs produced the same key!"
+
+    print("  ✓ Keys are stable and distinct per backend, language pair and text")
+
+
+def test_round_trip_persists():
+    """A stored translation is served again, including after reopening the file."""
+    print("\n" + "="*80)
+    print("TEST 2: Get/Put Round Trip")
+    print("="*80)
+
+    from transcribe_ro import TranslationCache
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, 'cache', 'xl8.db')
+        key = TranslationCache.make_key("Good morning", "en")
+
+        cache = TranslationCache(path=path)
+        assert cache.get(key) is None, "Empty cache returned a hit!"
+        cache.put(key, "Bună dimineața")
+        assert cache.get(key) == "Bună dimineața", "Stored translation not returned!"
+        cache.close()
+
+        reopened = TranslationCache(path=path)
+        assert reopened.get(key) == "Bună dimineața", "Translation did not persist on disk!"
+        reopened.close()
+
+    print("  ✓ Translations round-trip in memory and on disk")
+
+
+def test_memory_only_fallback():
+    """An unusable path, or persistent=False, gives a working in-memory cache."""
+    print("\n" + "="*80)
+    print("TEST 3: Memory-Only Fallback")
+    print("="*80)
+
+    from transcribe_ro import TranslationCache
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # A regular file where the cache directory should be makes the shelf unopenable
+        blocker = os.path.join(tmpdir, 'not_a_dir')
+        open(blocker, 'w').close()
+        key = TranslationCache.make_key("Thank you", "en")
+
+        for cache in (TranslationCache(path=os.path.join(blocker, 'xl8.db')),
+                      TranslationCache(path=os.path.join(tmpdir, 'off', 'xl8.db'), persistent=False)):
+            assert cache._shelf is None, "Expected a memory-only cache!"
+            cache.put(key, "Mulțumesc")
+            assert cache.get(key) == "Mulțumesc", "Memory-only cache lost the translation!"
+
+        assert not os.path.exists(os.path.join(tmpdir, 'off')), "persistent=False touched the disk!"
+
+    print("  ✓ Memory-only caches store and serve translations without a shelf")
+
+
+def test_eviction_drops_oldest():
+    """Going over max_entries drops the oldest tenth of the entries."""
+    print("\n" + "="*80)
+    print("TEST 4: Eviction")
+    print("="*80)
+
+    from transcribe_ro import TranslationCache
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = TranslationCache(path=os.path.join(tmpdir, 'xl8.db'), max_entries=20)
+        keys = [TranslationCache.make_key(f"text {i}", "en") for i in range(21)]
+        for i, key in enumerate(keys):
+            cache.put(key, f"text RO {i}")
+            time.sleep(0.002)  # Distinct timestamps
+
+        on_disk = set(cache._shelf.keys())
+        assert keys[0] not in on_disk and keys[1] not in on_disk, "Oldest entries were not evicted!"
+        assert set(keys[2:]) <= on_disk, "A newer entry was evicted!"
+        assert cache._size == len(on_disk) == 19, f"Size out of sync: {cache._size} vs {len(on_disk)}"
+        cache.close()
+
+    print("  ✓ Oldest entries evicted, size kept in sync")
+
+
+def main():
+    """Run all tests."""
+    print("\n" + "="*80)
+    print("TRANSLATION CACHE TEST SUITE")
+    print("="*80)
+
+    try:
+        test_make_key()
+        test_round_trip_persists()
+        test_memory_only_fallback()
+        test_eviction_drops_oldest()
+
+        print("\n" + "="*80)
+        print("✅ ALL TESTS PASSED!")
+        print("="*80)
+        return 0
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
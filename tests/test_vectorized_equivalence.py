@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Test script checking the vectorized helpers against their scalar/legacy versions:
+speaker lookup, speaker timeline building, bulk timestamp formatting and file suffixes.
+"""
+
+import os
+import random
+import sys
+from itertools import accumulate
+from pathlib import Path
+
+# Add the project directory to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# (start, end, label) in diarization order: overlaps, equal starts, nesting and gaps
+SEGMENTS = [
+    (0.0, 2.0, "SPEAKER_00"),
+    (1.5, 4.0, "SPEAKER_01"),   # Overlaps the previous segment
+    (1.5, 3.0, "SPEAKER_02"),   # Same start as the previous segment
+    (2.5, 2.8, "SPEAKER_00"),   # Nested inside both
+    (6.0, 7.0, "SPEAKER_01"),   # After a gap (4.0 - 6.0)
+    (6.0, 6.5, "SPEAKER_00"),   # Same start, ends first
+    (9.0, 9.0, "SPEAKER_02"),   # Zero-length
+]
+
+
+def _legacy_timeline(segments):
+    """The old dict timeline: (start, end) -> speaker, inserted in start order."""
+    return {(start, end): label for start, end, label in sorted(segments, key=lambda s: s[0])}
+
+
+def _probe_times(segments):
+    """Every boundary, points just around them, midpoints and times in the gaps."""
+    times = {-1.0, 5.0, 8.0, 100.0}
+    for start, end, _ in segments:
+        times.update((start, end, start - 1e-9, end + 1e-9, (start + end) / 2))
+    return sorted(times)
+
+
+def test_speaker_lookup_matches_scalar():
+    """Bulk lookup agrees with the scalar lookup and the legacy dict timeline."""
+    print("="*80)
+    print("TEST 1: Bulk Speaker Lookup")
+    print("="*80)
+
+    from transcribe_ro import build_speaker_timeline, get_speaker_for_timestamp, get_speakers_for_timestamps
+
+    rng = random.Random(1234)
+    cases = [SEGMENTS]
+    for _ in range(200):
+        segments = []
+        for _ in range(rng.randint(1, 12)):
+            start = rng.choice([rng.uniform(0, 20), float(rng.randint(0, 20))])  # Whole numbers collide
+            segments.append((start, start + rng.choice([0.0, rng.uniform(0, 5)]), f"SPEAKER_{rng.randint(0, 3):02d}"))
+        # The legacy dict cannot hold two segments with the same (start, end)
+        cases.append(list({(s, e): (s, e, label) for s, e, label in segments}.values()))
+
+    for segments in cases:
+        starts, ends, labels = zip(*segments)
+        timeline = build_speaker_timeline(starts, ends, labels)
+        legacy = _legacy_timeline(segments)
+        times = _probe_times(segments)
+
+        bulk = get_speakers_for_timestamps(timeline, times)
+        scalar = [get_speaker_for_timestamp(timeline, t) for t in times]
+        expected = [get_speaker_for_timestamp(legacy, t) for t in times]
+        assert bulk == scalar == expected, f"Lookup mismatch for {segments}:\n{bulk}\n{scalar}\n{expected}"
+        assert get_speakers_for_timestamps(legacy, times) == expected, "Legacy dict path changed!"
+
+    # Spot checks on the hand-written timeline
+    timeline = build_speaker_timeline(*zip(*SEGMENTS))
+    assert get_speakers_for_timestamps(timeline, [1.75, 2.6, 3.5, 5.0, 6.25, 9.0]) == \
+        ["SPEAKER_00", "SPEAKER_01", "SPEAKER_01", None, "SPEAKER_01", "SPEAKER_02"], "Spot check failed!"
+    assert get_speakers_for_timestamps(timeline, []) == [], "Empty timestamps should give an empty list!"
+
+    print(f"  ✓ {len(cases)} timelines agree on every probed timestamp")
+
+
+def test_build_timeline_matches_sorted_tuples():
+    """build_speaker_timeline matches a stable sort of (start, end, label) tuples."""
+    print("\n" + "="*80)
+    print("TEST 2: Speaker Timeline Building")
+    print("="*80)
+
+    from transcribe_ro import build_speaker_timeline
+
+    rng = random.Random(42)
+    cases = [SEGMENTS, list(reversed(SEGMENTS))]
+    for _ in range(100):
+        cases.append([(float(rng.randint(0, 10)), float(rng.randint(0, 15)), f"S{i}") for i in range(rng.randint(1, 15))])
+
+    for segments in cases:
+        timeline = build_speaker_timeline(*zip(*segments))
+        ordered = sorted(segments, key=lambda s: s[0])  # Stable, like the old list-of-tuples timeline
+
+        assert timeline.starts.tolist() == [s[0] for s in ordered], "Starts out of order!"
+        assert timeline.ends.tolist() == [s[1] for s in ordered], "Ends not kept with their starts!"
+        assert timeline.labels == [s[2] for s in ordered], "Labels not kept with their segments!"
+        assert timeline.max_ends.tolist() == list(accumulate((s[1] for s in ordered), max)), "Running max wrong!"
+
+    assert not build_speaker_timeline([], [], []), "Empty timeline should be falsy!"
+
+    print(f"  ✓ {len(cases)} timelines match the stable tuple sort")
+
+
+def test_bulk_timestamps_match_scalar():
+    """_format_timestamps_bulk gives exactly what _format_timestamp gives per value."""
+    print("\n" + "="*80)
+    print("TEST 3: Bulk Timestamp Formatting")
+    print("="*80)
+
+    from transcribe_ro import AudioTranscriber
+
+    rng = random.Random(7)
+    values = [0.0, 0.001, 0.999, 0.9999999, 1.001, 59.999, 60.0, 61.5, 3599.999, 3600.0, 3661.123,
+              7322.5, 86399.999, 100000.25, 2.675, 4.35, 1e-9]
+    values += [rng.uniform(0, 20000) for _ in range(2000)]
+    values += [round(rng.uniform(0, 5000), 2) for _ in range(2000)]  # Whisper-style two-decimal times
+
+    for format_type in ('txt', 'srt', 'vtt'):
+        bulk = AudioTranscriber._format_timestamps_bulk(values, format_type)
+        scalar = [AudioTranscriber._format_timestamp(v, format_type) for v in values]
+        mismatches = [(v, b, s) for v, b, s in zip(values, bulk, scalar) if b != s]
+        assert not mismatches, f"{format_type}: bulk differs from scalar, e.g. {mismatches[:3]}"
+        assert AudioTranscriber._format_timestamps_bulk([], format_type) == [], "Empty input should give []!"
+
+    print(f"  ✓ {len(values)} values format identically for txt, srt and vtt")
+
+
+def test_file_suffix_matches_pathlib():
+    """_file_suffix gives Path(...).suffix.lower() without building a Path."""
+    print("\n" + "="*80)
+    print("TEST 4: File Suffix")
+    print("="*80)
+
+    from transcribe_ro import _file_suffix
+
+    names = [
+        "audio.mp3", "VIDEO.MP4", "clip.Mov", "archive.tar.gz", "noext", "",
+        ".bashrc", ".config.json", "..", "...txt", "file.", "file..",
+        "dir.d/file", "dir.d/.hidden", "dir.d/file.wav", "/abs/path.v2/track",
+        "/abs/path.v2/track.M4A", "./rel/.mp3", "a/b.c/d.e/f", "name with spaces.WAV",
+        "dots.in.name.flac", "/", "./", "x/.", "x/..",
+    ]
+
+    for name in names:
+        expected = Path(name).suffix.lower()
+        assert _file_suffix(name) == expected, f"{name!r}: got {_file_suffix(name)!r}, expected {expected!r}"
+        assert _file_suffix(Path(name)) == expected, f"Path({name!r}) input gave a different suffix!"
+
+    print(f"  ✓ {len(names)} names match Path.suffix (dotfiles and dotted directories included)")
+
+
+def main():
+    """Run all tests."""
+    print("\n" + "="*80)
+    print("VECTORIZED HELPERS EQUIVALENCE TEST SUITE")
+    print("="*80)
+
+    try:
+        test_speaker_lookup_matches_scalar()
+        test_build_timeline_matches_sorted_tuples()
+        test_bulk_timestamps_match_scalar()
+        test_file_suffix_matches_pathlib()
+
+        print("\n" + "="*80)
+        print("✅ ALL TESTS PASSED!")
+        print("="*80)
+        return 0
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,15 +10,35 @@ License: MIT
 """
 
 import argparse
+import atexit
+import contextlib
+import functools
+import gc
+import hashlib
+import heapq
 import os
 import sys
 import json
 import time
 import logging
+import operator
+import random
+import queue
+import importlib
+import socket
+import subprocess
+import tempfile
+from collections import ChainMap, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 import warnings
 import glob
+import re
+import shelve
+import shutil
+import threading
+import types
 
 # Set MPS-specific environment variables for stability
 # These help prevent NaN issues on Apple Silicon GPUs
@@ -33,6 +53,16 @@ os.environ['PYANNOTE_USE_TORCHAUDIO'] = '1'
 # Global debug flag
 DEBUG_MODE = False
 
+# Horizontal rule used to frame log sections and text output headers
+_RULE = "=" * 80
+
+# Pre-built header/separator lines for text output files
+_RULE_LINE = _RULE + "\n"
+_SUBRULE_LINE = "-" * 40 + "\n"
+
+# Write buffer for output files (transcripts often run to hundreds of KiB)
+_WRITE_BUFFER_SIZE = 1 << 20
+
 # Configure logging with console handler
 def setup_logging(debug=False):
     """Setup logging configuration."""
@@ -65,6 +95,28 @@ def setup_logging(debug=False):
     
     return logger
 
+class _LazyNow:
+    """Log argument that renders the current time only when the record is actually formatted."""
+    
+    __slots__ = ()
+    
+    def __str__(self):
+        return datetime.now().isoformat()
+
+
+_NOW = _LazyNow()
+
+
+@functools.lru_cache(maxsize=None)
+def _metadata_label(key):
+    """Turn a metadata key such as 'source_file' into its 'Source File' label."""
+    return key.replace('_', ' ').title()
+
+
+def _metadata_block(metadata):
+    """Render metadata as the "Label: value" lines of a text output file."""
+    return "".join([f"{_metadata_label(key)}: {value}\n" for key, value in metadata.items()])
+
 # Initialize logger (will be configured by setup_logging in main())
 logger = logging.getLogger(__name__)
 
@@ -109,10 +161,12 @@ except ImportError as e:
 except Exception as e:
     # Catch any other unexpected errors during import
     logger.error(f"Unexpected error importing whisper: {type(e).__name__}: {e}")
-    import traceback
-    logger.error(f"Traceback:\n{traceback.format_exc()}")
+    logger.error("Traceback:", exc_info=True)
     sys.exit(1)
 
+# numpy is a whisper dependency, so it is always importable at this point
+import numpy as np
+
 try:
     from deep_translator import GoogleTranslator
     ONLINE_TRANSLATOR_AVAILABLE = True
@@ -147,6 +201,12 @@ except ImportError:
     TORCH_AVAILABLE = False
     torch = None
 
+# Optional fast JSON encoder for JSON output; falls back to the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Try to import speaker diarization dependencies
 DIARIZATION_IMPORT_ERROR = None
 try:
@@ -186,27 +246,195 @@ except Exception as e:
     Pipeline = None
 
 
+# Heavy optional audio libraries (librosa, soundfile, soxr, scipy.signal) imported on first use
+_lazy_modules = {}
+
+
+def _lazy_import(name):
+    """
+    Import a module on first use and cache it for later calls.
+    
+    Args:
+        name: Dotted module name (e.g. 'scipy.signal')
+    
+    Returns:
+        module: The imported module
+    
+    Raises:
+        ImportError: If the module is not installed
+    """
+    module = _lazy_modules.get(name)
+    if module is None:
+        module = _lazy_modules[name] = importlib.import_module(name)
+    return module
+
+
 # =============================================================================
 # VIDEO SUPPORT - Extract audio from video files using ffmpeg
 # =============================================================================
 
 # Supported video formats
-VIDEO_EXTENSIONS = {'.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v', 
-                    '.mpeg', '.mpg', '.3gp', '.3g2', '.ts', '.mts', '.m2ts', '.vob'}
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v', 
+                              '.mpeg', '.mpg', '.3gp', '.3g2', '.ts', '.mts', '.m2ts', '.vob'})
 
 # Supported audio formats
-AUDIO_EXTENSIONS = {'.mp3', '.wav', '.m4a', '.flac', '.ogg', '.wma', '.aac', '.opus',
-                    '.aiff', '.aif', '.ape', '.wv', '.mka'}
+AUDIO_EXTENSIONS = frozenset({'.mp3', '.wav', '.m4a', '.flac', '.ogg', '.wma', '.aac', '.opus',
+                              '.aiff', '.aif', '.ape', '.wv', '.mka'})
+
+# Absolute path to ffmpeg, resolved once so each call skips the $PATH search (None if not installed)
+_FFMPEG_BIN = shutil.which('ffmpeg')
+
+# Hardware decoders ffmpeg can use for video input, in order of preference
+HWACCEL_BACKENDS = ('cuda', 'qsv', 'videotoolbox', 'vaapi')
+
+# Cached result of `ffmpeg -hwaccels` (probed once per process)
+_ffmpeg_hwaccels = None
+
+def get_ffmpeg_hwaccels():
+    """
+    Return the hardware acceleration methods supported by the local ffmpeg build.
+    
+    The probe runs `ffmpeg -hwaccels` once and caches the result for the
+    lifetime of the process.
+    
+    Returns:
+        frozenset: Names of available hwaccel methods (empty if ffmpeg is missing)
+    """
+    global _ffmpeg_hwaccels
+    if _ffmpeg_hwaccels is None:
+        if _FFMPEG_BIN is None:
+            _ffmpeg_hwaccels = frozenset()
+            return _ffmpeg_hwaccels
+        try:
+            result = subprocess.run([_FFMPEG_BIN, '-hide_banner', '-hwaccels'], capture_output=True, text=True)
+            # Output is a "Hardware acceleration methods:" header followed by one name per line
+            lines = result.stdout.splitlines()[1:] if result.returncode == 0 else []
+            _ffmpeg_hwaccels = frozenset(line.strip() for line in lines if line.strip())
+        except (subprocess.SubprocessError, FileNotFoundError):
+            _ffmpeg_hwaccels = frozenset()
+    return _ffmpeg_hwaccels
+
+def select_hwaccel(hwaccel):
+    """
+    Resolve a requested hwaccel setting to a backend supported by ffmpeg.
+    
+    Args:
+        hwaccel: None (CPU decode), 'auto' (best available), or a backend name
+    
+    Returns:
+        str or None: Backend to pass to `ffmpeg -hwaccel`, or None for CPU decode
+    """
+    if not hwaccel:
+        return None
+    available = get_ffmpeg_hwaccels()
+    if hwaccel == 'auto':
+        for backend in HWACCEL_BACKENDS:
+            if backend in available:
+                return backend
+        return None
+    if hwaccel not in available:
+        logger.warning(f"ffmpeg hwaccel '{hwaccel}' not available. Using CPU decode.")
+        return None
+    return hwaccel
+
+def _pick_tempdir():
+    """
+    Pick a directory for intermediate audio files.
+    
+    On Linux, /dev/shm is a RAM-backed tmpfs, so the extracted WAV never touches disk.
+    
+    Returns:
+        str or None: '/dev/shm' when usable, otherwise None (system default temp dir)
+    """
+    if sys.platform.startswith('linux') and os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+        return '/dev/shm'
+    return None
+
+def _file_suffix(file_path):
+    """Return the lowercased file extension (e.g. '.mp4') without building a Path object."""
+    name = os.fspath(file_path)
+    dot = name.rfind('.')
+    # Match Path.suffix: dots in directory names, leading dots (".bashrc") and trailing dots don't count
+    if dot <= max(name.rfind('/'), name.rfind(os.sep)) + 1 or dot == len(name) - 1:
+        return ''
+    return name[dot:].lower()
 
 def is_video_file(file_path):
     """Check if a file is a video file based on its extension."""
-    return Path(file_path).suffix.lower() in VIDEO_EXTENSIONS
+    return _file_suffix(file_path) in VIDEO_EXTENSIONS
 
 def is_audio_file(file_path):
     """Check if a file is an audio file based on its extension."""
-    return Path(file_path).suffix.lower() in AUDIO_EXTENSIONS
+    return _file_suffix(file_path) in AUDIO_EXTENSIONS
+
+class SampleBuffer:
+    """
+    Reusable float32 sample storage, grown to the longest audio converted into it.
+    
+    Arrays handed out by take() are views of the same storage, so one buffer
+    must only back one in-use audio array at a time.
+    """
+    
+    __slots__ = ('array',)
+    
+    def __init__(self):
+        self.array = None
+    
+    def take(self, length):
+        """Return a float32 view of `length` samples, reallocating only when too small."""
+        if self.array is None or len(self.array) < length:
+            self.array = np.empty(length, dtype=np.float32)
+        return self.array[:length]
+
+
+def _pcm16_to_float32(raw, buffer=None):
+    """
+    Convert 16-bit little-endian PCM bytes to float32 samples in [-1, 1).
+    
+    Args:
+        raw: Raw s16le bytes (e.g. ffmpeg stdout)
+        buffer: Optional SampleBuffer to convert into instead of a new array
+    
+    Returns:
+        np.ndarray: float32 samples (a view of buffer's storage when given)
+    """
+    pcm = np.frombuffer(raw, dtype=np.int16)
+    if buffer is None:
+        return np.divide(pcm, 32768.0, dtype=np.float32)
+    return np.divide(pcm, 32768.0, out=buffer.take(len(pcm)), dtype=np.float32)
+
 
-def extract_audio_from_video(video_path, output_path=None, debug=False):
+def decode_audio(audio_path, buffer=None):
+    """
+    Decode an audio or video file to 16kHz mono float32 samples.
+    
+    Runs the same ffmpeg command as whisper.load_audio(), so the samples are
+    identical, but can convert into a reusable SampleBuffer. The result is the
+    array transcribe_audio() accepts, so decoding can run on another thread
+    ahead of transcription.
+    
+    Args:
+        audio_path: Path to an audio or video file
+        buffer: Optional SampleBuffer to decode into
+    
+    Returns:
+        np.ndarray: float32 samples in [-1, 1)
+    
+    Raises:
+        RuntimeError: If ffmpeg is missing or cannot decode the file
+    """
+    if _FFMPEG_BIN is None:
+        raise RuntimeError("ffmpeg is not installed or not in PATH.")
+    cmd = [_FFMPEG_BIN, '-nostdin', '-threads', '0', '-i', str(audio_path),
+           '-f', 's16le', '-ac', '1', '-acodec', 'pcm_s16le', '-ar', '16000', '-']
+    result = subprocess.run(cmd, capture_output=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Failed to load audio: {result.stderr.decode('utf-8', errors='replace')}")
+    return _pcm16_to_float32(result.stdout, buffer)
+
+
+def extract_audio_from_video(video_path, output_path=None, debug=False, hwaccel=None, return_array=False,
+                             buffer=None):
     """
     Extract audio from a video file using ffmpeg.
     
@@ -214,22 +442,24 @@ def extract_audio_from_video(video_path, output_path=None, debug=False):
         video_path: Path to the video file
         output_path: Optional output path for the extracted audio (defaults to temp file)
         debug: Enable debug logging
+        hwaccel: Optional hardware decoder ('auto', 'cuda', 'qsv', 'videotoolbox', 'vaapi').
+                 Falls back to CPU decode if the hardware path fails.
+        return_array: Stream raw PCM from ffmpeg's stdout and return a float32 numpy array
+                      (16kHz mono) instead of writing a WAV file. output_path is ignored.
+        buffer: Optional SampleBuffer that return_array samples are converted into
     
     Returns:
-        tuple: (audio_path, is_temporary) - path to extracted audio and whether it's a temp file
+        tuple: (audio, is_temporary) - path to extracted audio (or numpy array when
+               return_array=True) and whether it's a temp file
     """
-    import subprocess
-    import tempfile
     
     video_path = Path(video_path)
     
     if not video_path.exists():
         raise FileNotFoundError(f"Video file not found: {video_path}")
     
-    # Check if ffmpeg is available
-    try:
-        subprocess.run(['ffmpeg', '-version'], capture_output=True, check=True)
-    except (subprocess.SubprocessError, FileNotFoundError):
+    # Check if ffmpeg is available (resolved once at import time)
+    if _FFMPEG_BIN is None:
         raise RuntimeError(
             "ffmpeg is not installed or not in PATH.\n"
             "Please install ffmpeg:\n"
@@ -239,17 +469,17 @@ def extract_audio_from_video(video_path, output_path=None, debug=False):
         )
     
     # Determine output path
-    is_temporary = output_path is None
+    is_temporary = output_path is None and not return_array
     if is_temporary:
-        # Create temp file with .wav extension (most compatible)
-        temp_fd, output_path = tempfile.mkstemp(suffix='.wav', prefix='transcribe_ro_')
+        # Create temp file with .wav extension (most compatible), in RAM when possible
+        temp_fd, output_path = tempfile.mkstemp(suffix='.wav', prefix='transcribe_ro_', dir=_pick_tempdir())
         os.close(temp_fd)
     
-    output_path = Path(output_path)
+    output_path = Path(output_path) if output_path and not return_array else None
     
     if debug:
         logger.debug(f"Extracting audio from video: {video_path}")
-        logger.debug(f"Output audio path: {output_path}")
+        logger.debug(f"Output audio path: {output_path if output_path else 'pipe (in-memory array)'}")
     
     try:
         # Extract audio using ffmpeg
@@ -259,30 +489,59 @@ def extract_audio_from_video(video_path, output_path=None, debug=False):
         # -ar 16000: 16kHz sample rate (optimal for Whisper)
         # -ac 1: mono channel
         # -y: overwrite output file
-        cmd = [
-            'ffmpeg',
+        # -f s16le pipe:1: raw PCM to stdout (return_array mode)
+        # -hwaccel: optional hardware decoder (must come before -i)
+        hwaccel_backend = select_hwaccel(hwaccel)
+        hwaccel_args = ['-hwaccel', hwaccel_backend] if hwaccel_backend else []
+        output_args = [
             '-i', str(video_path),
             '-vn',  # No video
             '-acodec', 'pcm_s16le',  # 16-bit PCM
             '-ar', '16000',  # 16kHz sample rate
             '-ac', '1',  # Mono
-            '-y',  # Overwrite
-            str(output_path)
         ]
+        if return_array:
+            output_args += ['-f', 's16le', 'pipe:1']  # Raw samples to stdout
+        else:
+            output_args += ['-y', str(output_path)]  # Overwrite
+        cmd = [_FFMPEG_BIN] + hwaccel_args + output_args
         
         if debug:
             logger.debug(f"Running: {' '.join(cmd)}")
         
+        # stdout carries binary PCM in return_array mode, so only decode text for file output
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True
+            text=not return_array
         )
         
+        if result.returncode != 0 and hwaccel_backend:
+            # Hardware decode can fail for unsupported codecs; retry on CPU
+            logger.warning(f"ffmpeg hwaccel '{hwaccel_backend}' failed. Retrying with CPU decode...")
+            cmd = [_FFMPEG_BIN] + output_args
+            if debug:
+                logger.debug(f"Running: {' '.join(cmd)}")
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=not return_array
+            )
+        
         if result.returncode != 0:
-            error_msg = result.stderr[:500] if result.stderr else "Unknown ffmpeg error"
+            stderr = result.stderr
+            if isinstance(stderr, bytes):
+                stderr = stderr.decode('utf-8', errors='replace')
+            error_msg = stderr[:500] if stderr else "Unknown ffmpeg error"
             raise RuntimeError(f"ffmpeg failed: {error_msg}")
         
+        if return_array:
+            audio = _pcm16_to_float32(result.stdout, buffer)
+            if audio.size == 0:
+                raise RuntimeError(f"ffmpeg produced no audio samples for: {video_path}")
+            logger.info(f"✓ Audio extracted from video: {video_path.name}")
+            return audio, False
+        
         if not output_path.exists():
             raise RuntimeError(f"ffmpeg did not create output file: {output_path}")
         
@@ -300,23 +559,261 @@ def extract_audio_from_video(video_path, output_path=None, debug=False):
         raise
 
 
+# How long a connectivity check result is reused before probing the network again
+CONNECTIVITY_CACHE_SECONDS = 30
+
+# Last connectivity check as (monotonic timestamp, result), or None before the first check
+_connectivity_cache = None
+
+
 def check_internet_connectivity(timeout=3):
     """
     Check if internet connection is available.
     
+    The result is cached for CONNECTIVITY_CACHE_SECONDS so repeated checks do not
+    re-probe the network.
+    
     Args:
         timeout: Connection timeout in seconds
     
     Returns:
         bool: True if internet is available, False otherwise
     """
+    global _connectivity_cache
+    now = time.monotonic()
+    if _connectivity_cache is not None and now - _connectivity_cache[0] < CONNECTIVITY_CACHE_SECONDS:
+        return _connectivity_cache[1]
+    
     try:
-        import socket
+        # Fast negative: connecting a UDP socket sends no packets but fails at once without a route
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as udp:
+            udp.connect(("8.8.8.8", 53))
         # Try to connect to Google's DNS server
-        socket.create_connection(("8.8.8.8", 53), timeout=timeout)
-        return True
-    except (socket.error, OSError):
-        return False
+        with socket.create_connection(("8.8.8.8", 53), timeout=timeout):
+            pass
+        connected = True
+    except OSError:
+        connected = False
+    
+    _connectivity_cache = (now, connected)
+    return connected
+
+
+class _SessionRequests:
+    """
+    Stand-in for the requests module inside deep_translator.google.
+    
+    Within a _google_session() block, get() goes through a keep-alive Session
+    owned by the calling thread (requests does not promise that a Session is
+    safe to share between threads). Everywhere else it is the plain
+    requests.get(), so other users of deep-translator in the process see no
+    difference.
+    """
+    
+    def __init__(self, requests_module):
+        self._requests = requests_module
+        self._local = threading.local()
+    
+    def get(self, *args, **kwargs):
+        local = self._local
+        if not getattr(local, 'depth', 0):
+            return self._requests.get(*args, **kwargs)
+        session = getattr(local, 'session', None)
+        if session is None:
+            session = local.session = self._requests.Session()
+        return session.get(*args, **kwargs)
+    
+    def __getattr__(self, name):
+        return getattr(self._requests, name)
+
+
+@functools.lru_cache(maxsize=1)
+def _install_google_requests():
+    """
+    Swap deep_translator.google's `requests` reference for a _SessionRequests proxy.
+    
+    deep-translator calls the module-level requests.get() for every translation,
+    which opens a new TCP/TLS connection each time. The proxy lets this module's
+    own calls reuse a per-thread keep-alive session between chunks and retries
+    (see _google_session()); see also the note in requirements.txt.
+    
+    Returns:
+        The installed proxy, or None if deep-translator is unavailable or does
+        not reference requests the way this expects
+    """
+    try:
+        import requests
+        google_module = importlib.import_module('deep_translator.google')
+    except ImportError:
+        return None
+    
+    if getattr(google_module, 'requests', None) is not requests:
+        return None
+    proxy = google_module.requests = _SessionRequests(requests)
+    return proxy
+
+
+@contextlib.contextmanager
+def _google_session():
+    """Send deep-translator Google requests made in this block over the thread's keep-alive session."""
+    proxy = _install_google_requests()
+    if proxy is None:
+        yield
+        return
+    local = proxy._local
+    local.depth = getattr(local, 'depth', 0) + 1
+    try:
+        yield
+    finally:
+        local.depth -= 1
+
+
+# Bump when the translation backend or model changes so stale entries are never served
+TRANSLATION_CACHE_VERSION = 1
+
+# Oldest entries are evicted once the on-disk cache grows past this size
+TRANSLATION_CACHE_MAX_ENTRIES = 100_000
+
+
+class TranslationCache:
+    """
+    Translation cache backed by a shelve file, shared across runs.
+    
+    Keys combine the cache version, the backend ('online' or 'offline'), the
+    language pair and a SHA-1 of the source text. An in-memory dict sits in
+    front of the shelf so repeated lookups within a run avoid disk reads.
+    """
+    
+    def __init__(self, path=None, max_entries=TRANSLATION_CACHE_MAX_ENTRIES, debug=False, persistent=True):
+        """
+        Open (or create) the on-disk cache.
+        
+        Args:
+            path: Shelf file path. Defaults to $TRANSCRIBE_CACHE_DIR, then
+                  ~/.cache/transcribe_ro, with the file name transcribe_ro_xl8.db
+            max_entries: Maximum number of entries kept on disk
+            debug: Enable debug logging
+            persistent: False keeps translations in memory only and never touches the disk
+        """
+        if path is None:
+            cache_dir = os.path.expanduser(os.environ.get('TRANSCRIBE_CACHE_DIR') or '~/.cache/transcribe_ro')
+            path = os.path.join(cache_dir, 'transcribe_ro_xl8.db')
+        self.path = path
+        self.max_entries = max_entries
+        self.debug = debug
+        self._memory = {}
+        self._lock = threading.Lock()
+        self._shelf = None
+        self._size = 0
+        self._evicting = False
+        
+        if not persistent:
+            if debug:
+                logger.debug("Persistent translation cache disabled; using in-memory cache only")
+            return
+        
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self._shelf = shelve.open(path, writeback=False)
+            self._size = len(self._shelf)
+            atexit.register(self.close)
+            if debug:
+                logger.debug(f"Translation cache opened at {path} ({self._size} entries)")
+        except Exception as e:
+            # Another process may hold the file, or the directory is read-only; run memory-only
+            logger.warning(f"Persistent translation cache unavailable ({e}); using in-memory cache only")
+    
+    @staticmethod
+    def make_key(text, source_lang, target_lang='ro', backend='online'):
+        """Build the cache key for a piece of source text."""
+        digest = hashlib.sha1(text.encode('utf-8')).hexdigest()
+        return f"v{TRANSLATION_CACHE_VERSION}|{backend}|{source_lang}|{target_lang}|{digest}"
+    
+    def get(self, key):
+        """Return the cached translation for key, or None."""
+        hit = self._memory.get(key)
+        if hit is not None or self._shelf is None:
+            return hit
+        with self._lock:
+            entry = self._shelf.get(key)
+        if entry is None:
+            return None
+        self._memory[key] = entry[1]
+        return entry[1]
+    
+    def put(self, key, translated):
+        """Store a translation in memory and on disk."""
+        self._memory[key] = translated
+        if self._shelf is None:
+            return
+        with self._lock:
+            if self._shelf is None:
+                return
+            if key not in self._shelf:
+                self._size += 1
+            # Stored with a timestamp so eviction can drop the oldest entries
+            self._shelf[key] = (time.time(), translated)
+            evict = self._size > self.max_entries and not self._evicting
+            self._evicting = self._evicting or evict
+        if evict:
+            try:
+                self._evict()
+            finally:
+                self._evicting = False
+    
+    def _evict(self):
+        """
+        Drop the oldest tenth of the on-disk entries.
+        
+        Only the keys are snapshotted; timestamps are then read and entries deleted
+        one at a time, so other threads keep using the cache during eviction, and
+        heapq.nsmallest keeps just the entries to drop instead of sorting them all.
+        """
+        with self._lock:
+            if self._shelf is None:
+                return
+            keys = list(self._shelf.keys())
+        drop = max(1, len(keys) // 10)
+        oldest = heapq.nsmallest(drop, self._stamped(keys))
+        dropped = 0
+        for _, key in oldest:
+            with self._lock:
+                if self._shelf is None:
+                    return
+                if key in self._shelf:
+                    del self._shelf[key]
+                    self._size -= 1
+                    dropped += 1
+        if self.debug:
+            logger.debug(f"Translation cache evicted {dropped} entries")
+    
+    def _stamped(self, keys):
+        """Yield (timestamp, key) for the keys still on disk."""
+        for key in keys:
+            with self._lock:
+                entry = self._shelf.get(key) if self._shelf is not None else None
+            if entry is not None:
+                yield entry[0], key
+    
+    def close(self):
+        """Flush and close the on-disk cache."""
+        with self._lock:
+            if self._shelf is not None:
+                self._shelf.close()
+                self._shelf = None
+
+
+@functools.lru_cache(maxsize=2)
+def get_translation_cache(persistent=True):
+    """
+    Return the process-wide TranslationCache, opening it on first use.
+    
+    Args:
+        persistent: False (or the TRANSCRIBE_NO_TRANSLATION_CACHE environment variable)
+                    returns an in-memory cache that never writes to disk
+    """
+    persistent = persistent and not os.environ.get('TRANSCRIBE_NO_TRANSLATION_CACHE')
+    return TranslationCache(debug=logger.isEnabledFor(logging.DEBUG), persistent=persistent)
 
 
 def get_marian_model_name(source_lang, target_lang='ro'):
@@ -357,24 +854,122 @@ def get_marian_model_name(source_lang, target_lang='ro'):
     return lang_map.get(source_lang)
 
 
+# Error messages that point at a network problem rather than a translation failure
+_NET_ERR_RE = re.compile(r'connection|network|timeout|dns|resolve|unreachable|nodename|servname|errno 8',
+                         re.IGNORECASE)
+
+# Errors that fail the same way on every attempt (bad language code, unsupported pair)
+_DETERMINISTIC_ERR_RE = re.compile(r'invalid (?:source|target)|unsupported language|not supported',
+                                   re.IGNORECASE)
+
+# Upper bound on a single retry wait, in seconds
+MAX_RETRY_WAIT = 30
+
+
+def _retry_delay(attempt):
+    """Exponential backoff with jitter: 2**attempt seconds plus up to 1s, capped at MAX_RETRY_WAIT."""
+    return min(MAX_RETRY_WAIT, 2 ** attempt + random.random())
+
+
+def _is_deterministic_error(error):
+    """Return True if retrying the request that raised error cannot help."""
+    return isinstance(error, ValueError) or _DETERMINISTIC_ERR_RE.search(str(error)) is not None
+
+
+# Text with nothing to translate: only digits, punctuation and whitespace
+_LANG_INDEPENDENT = re.compile(r'[\d\W]+')
+
+# Sentence boundary: whitespace following '.', '!' or '?'
+_SENT_SPLIT = re.compile(r'(?<=[.!?])\s+')
+
+
 class OfflineTranslator:
     """Offline translation using MarianMT models from transformers."""
     
-    def __init__(self, cache_dir=None, debug=False):
+    # Number of sentences passed to a single model.generate() call
+    BATCH_SIZE = 8
+    
+    # Number of (short) transcript segments passed to a single model.generate() call
+    SEGMENT_BATCH_SIZE = 32
+    
+    # Beam width for model.generate(); 1 = greedy decoding (roughly 4x fewer decode FLOPs
+    # than the 4-6 beams Marian checkpoints ship with)
+    NUM_BEAMS = 1
+    
+    def __init__(self, cache_dir=None, debug=False, default_source_lang=None):
         """
         Initialize offline translator.
         
         Args:
-            cache_dir: Directory to cache models (default: ~/.cache/huggingface)
+            cache_dir: Directory to cache models. Defaults to $TRANSCRIBE_HF_CACHE, then
+                       $HF_HOME/hub, then ~/.cache/huggingface/hub. Point several processes
+                       or containers at the same directory to share downloaded models.
             debug: Enable debug output
+            default_source_lang: Optional source language to resolve the model name for up front
         """
-        self.cache_dir = cache_dir or os.path.expanduser("~/.cache/huggingface/hub")
+        if not cache_dir:
+            cache_dir = os.environ.get('TRANSCRIBE_HF_CACHE')
+        if not cache_dir and os.environ.get('HF_HOME'):
+            cache_dir = os.path.join(os.environ['HF_HOME'], 'hub')
+        self.cache_dir = os.path.expanduser(cache_dir or "~/.cache/huggingface/hub")
         self.debug = debug
         self.models = {}  # Cache loaded models
         self.tokenizers = {}  # Cache loaded tokenizers
+        self.model_names = {}  # Cache resolved (source, target) -> (model_name, full_model_name)
+        self.pipelines = {}  # Cache (source, target) -> (model, tokenizer) once loaded
+        # Run translation on the GPU when CUDA is available
+        self.device = 'cuda' if TORCH_AVAILABLE and torch.cuda.is_available() else 'cpu'
         
         if debug:
             logger.debug(f"OfflineTranslator initialized with cache_dir: {self.cache_dir}")
+            logger.debug(f"OfflineTranslator device: {self.device}")
+        
+        if default_source_lang:
+            self._resolve_model_name(default_source_lang, 'ro')
+    
+    def _resolve_model_name(self, source_lang, target_lang):
+        """
+        Resolve and cache the MarianMT model for a language pair.
+        
+        Args:
+            source_lang: Source language code
+            target_lang: Target language code
+        
+        Returns:
+            tuple: (model_name, full_model_name), or (None, None) if no model is available
+        """
+        key = (source_lang, target_lang)
+        resolved = self.model_names.get(key)
+        if resolved is None:
+            model_name = get_marian_model_name(source_lang, target_lang)
+            full_model_name = f"Helsinki-NLP/{model_name}" if model_name else None
+            resolved = self.model_names[key] = (model_name, full_model_name)
+        return resolved
+    
+    def _from_pretrained(self, loader, full_model_name):
+        """
+        Load a model or tokenizer, preferring the local cache.
+        
+        The first attempt uses local_files_only=True so cached models load without any
+        network round-trips. Only on a cache miss (and with internet available) is the
+        model downloaded.
+        
+        Args:
+            loader: MarianMTModel or MarianTokenizer class
+            full_model_name: HuggingFace model id (e.g. Helsinki-NLP/opus-mt-fr-ro)
+        
+        Returns:
+            Loaded model or tokenizer
+        """
+        try:
+            return loader.from_pretrained(full_model_name, cache_dir=self.cache_dir, local_files_only=True)
+        except OSError:
+            if self.debug:
+                logger.debug(f"{full_model_name} not in local cache {self.cache_dir}")
+            if not check_internet_connectivity():
+                raise OSError(f"Model {full_model_name} is not cached and no internet connection is available. "
+                              f"Run download_offline_models.py while online.")
+            return loader.from_pretrained(full_model_name, cache_dir=self.cache_dir)
     
     def translate(self, text, source_lang='en', target_lang='ro', max_retries=1):
         """
@@ -392,44 +987,16 @@ class OfflineTranslator:
         if not text or not text.strip():
             return text
         
-        # Get model name for this language pair
-        model_name = get_marian_model_name(source_lang, target_lang)
-        
-        if not model_name:
-            logger.warning(f"No offline model available for {source_lang} -> {target_lang}")
-            return text
-        
-        full_model_name = f"Helsinki-NLP/{model_name}"
-        
-        if self.debug:
-            logger.debug(f"Using offline model: {full_model_name}")
-            logger.debug(f"Text length: {len(text)} characters")
-        
         try:
-            # Load model and tokenizer (cached if already loaded)
-            if full_model_name not in self.models:
-                if self.debug:
-                    logger.debug(f"Loading model {full_model_name}...")
-                    load_start = time.time()
-                
-                logger.info(f"Loading offline translation model: {model_name}...")
-                self.tokenizers[full_model_name] = MarianTokenizer.from_pretrained(
-                    full_model_name,
-                    cache_dir=self.cache_dir
-                )
-                self.models[full_model_name] = MarianMTModel.from_pretrained(
-                    full_model_name,
-                    cache_dir=self.cache_dir
-                )
-                
-                if self.debug:
-                    load_time = time.time() - load_start
-                    logger.debug(f"Model loaded in {load_time:.2f} seconds")
-                
-                logger.info("✓ Model loaded successfully")
+            pipeline = self._get_pipeline(source_lang, target_lang)
+            if pipeline is None:
+                logger.warning(f"No offline model available for {source_lang} -> {target_lang}")
+                return text
+            model, tokenizer = pipeline
             
-            model = self.models[full_model_name]
-            tokenizer = self.tokenizers[full_model_name]
+            if self.debug:
+                logger.debug(f"Using offline model: {self.model_names[(source_lang, target_lang)][1]}")
+                logger.debug(f"Text length: {len(text)} characters")
             
             # Translate text
             if self.debug:
@@ -441,17 +1008,8 @@ class OfflineTranslator:
             if len(text) > 2000:  # Rough estimate for characters
                 return self._translate_long_text(text, model, tokenizer)
             
-            # Tokenize
-            inputs = tokenizer(text, return_tensors="pt", padding=True, truncation=True, max_length=max_length)
-            
-            if self.debug:
-                logger.debug(f"Input tokens: {inputs['input_ids'].shape}")
-            
-            # Generate translation
-            translated_tokens = model.generate(**inputs)
-            
-            # Decode
-            translated_text = tokenizer.decode(translated_tokens[0], skip_special_tokens=True)
+            # Tokenize, generate and decode
+            translated_text = self._generate([text], model, tokenizer, max_length=max_length)[0]
             
             if self.debug:
                 translate_time = time.time() - translate_start
@@ -463,11 +1021,121 @@ class OfflineTranslator:
         except Exception as e:
             logger.error(f"Offline translation failed: {e}")
             if self.debug:
-                import traceback
-                logger.debug("Full traceback:")
-                logger.debug(traceback.format_exc())
+                logger.debug("Full traceback:", exc_info=True)
             return text
     
+    def _get_pipeline(self, source_lang, target_lang):
+        """
+        Return the loaded (model, tokenizer) for a language pair with a single lookup.
+        
+        The first call for a pair resolves the model name and loads it; later calls
+        skip both steps.
+        
+        Args:
+            source_lang: Source language code
+            target_lang: Target language code
+        
+        Returns:
+            tuple: (model, tokenizer), or None if no model is available for the pair
+        """
+        key = (source_lang, target_lang)
+        pipeline = self.pipelines.get(key)
+        if pipeline is None:
+            model_name, full_model_name = self._resolve_model_name(source_lang, target_lang)
+            if not model_name:
+                return None
+            pipeline = self.pipelines[key] = self._load_model(model_name, full_model_name)
+        return pipeline
+    
+    def _load_model(self, model_name, full_model_name):
+        """
+        Load a MarianMT model and tokenizer, caching them for later calls.
+        
+        Args:
+            model_name: Short model name (e.g. opus-mt-fr-ro), used for logging
+            full_model_name: HuggingFace model id (e.g. Helsinki-NLP/opus-mt-fr-ro)
+        
+        Returns:
+            tuple: (model, tokenizer)
+        """
+        if full_model_name not in self.models:
+            if self.debug:
+                logger.debug(f"Loading model {full_model_name}...")
+                load_start = time.time()
+            
+            logger.info(f"Loading offline translation model: {model_name}...")
+            self.tokenizers[full_model_name] = self._from_pretrained(MarianTokenizer, full_model_name)
+            model = self._from_pretrained(MarianMTModel, full_model_name)
+            if self.device != 'cpu':
+                model = model.to(self.device)
+            else:
+                # Dynamic int8 quantization of the Linear layers speeds up CPU inference
+                try:
+                    if self.debug:
+                        fp32_bytes = sum(p.numel() * p.element_size() for p in model.parameters())
+                    model = torch.quantization.quantize_dynamic(
+                        model, {torch.nn.Linear}, dtype=torch.qint8
+                    )
+                    if self.debug:
+                        # Quantized Linear weights live in packed params, so what remains are the float ones
+                        float_bytes = sum(p.numel() * p.element_size() for p in model.parameters())
+                        logger.debug(f"Quantized translation model to int8 for CPU inference "
+                                     f"({(fp32_bytes - float_bytes) / 2**20:.1f} MB of FP32 Linear weights packed)")
+                except Exception as e:
+                    logger.warning(f"int8 quantization failed, using FP32 model: {e}")
+            self.models[full_model_name] = model
+            
+            if self.debug:
+                load_time = time.time() - load_start
+                logger.debug(f"Model loaded in {load_time:.2f} seconds")
+            
+            logger.info("✓ Model loaded successfully")
+        
+        return self.models[full_model_name], self.tokenizers[full_model_name]
+    
+    def translate_batch(self, texts, source_lang='en', target_lang='ro'):
+        """
+        Translate many short texts (e.g. transcript segments) with batched generate() calls.
+        
+        Args:
+            texts: List of strings to translate
+            source_lang: Source language code
+            target_lang: Target language code (default: 'ro')
+        
+        Returns:
+            List of translated strings in input order; entries that could not be
+            translated are returned unchanged
+        """
+        try:
+            pipeline = self._get_pipeline(source_lang, target_lang)
+        except Exception as e:
+            logger.error(f"Offline translation failed: {e}")
+            return list(texts)
+        if pipeline is None:
+            logger.warning(f"No offline model available for {source_lang} -> {target_lang}")
+            return list(texts)
+        model, tokenizer = pipeline
+        
+        translated = list(texts)
+        # Only non-empty texts go to the model; blanks pass straight through
+        pending = [i for i, t in enumerate(texts) if t and t.strip()]
+        
+        for b in range(0, len(pending), self.SEGMENT_BATCH_SIZE):
+            batch_ids = pending[b:b + self.SEGMENT_BATCH_SIZE]
+            
+            if self.debug:
+                logger.debug(f"Translating segments {b+1}-{b+len(batch_ids)}/{len(pending)}...")
+            
+            try:
+                results = self._generate([texts[i] for i in batch_ids], model, tokenizer)
+            except Exception as e:
+                logger.warning(f"Failed to translate segments {b+1}-{b+len(batch_ids)}: {e}")
+                continue  # Keep original
+            for i, result in zip(batch_ids, results):
+                translated[i] = result
+        
+        return translated
+    
     def _translate_long_text(self, text, model, tokenizer):
         """
         Translate long text by splitting into sentences.
@@ -484,27 +1152,54 @@ class OfflineTranslator:
             logger.debug("Text is long, splitting into sentences...")
         
         # Split by sentences
-        sentences = text.replace('! ', '!|').replace('? ', '?|').replace('. ', '.|').split('|')
+        sentences = [sentence for sentence in _SENT_SPLIT.split(text.strip()) if sentence]
         translated_sentences = []
         
-        for i, sentence in enumerate(sentences):
-            sentence = sentence.strip()
-            if not sentence:
-                continue
+        # Translate in mini-batches so each generate() call covers several sentences
+        for i in range(0, len(sentences), self.BATCH_SIZE):
+            batch = sentences[i:i + self.BATCH_SIZE]
             
             if self.debug:
-                logger.debug(f"Translating sentence {i+1}/{len(sentences)}...")
+                logger.debug(f"Translating sentences {i+1}-{i+len(batch)}/{len(sentences)}...")
             
             try:
-                inputs = tokenizer(sentence, return_tensors="pt", padding=True, truncation=True, max_length=512)
-                translated_tokens = model.generate(**inputs)
-                translated = tokenizer.decode(translated_tokens[0], skip_special_tokens=True)
-                translated_sentences.append(translated)
+                translated_sentences.extend(self._generate(batch, model, tokenizer))
             except Exception as e:
-                logger.warning(f"Failed to translate sentence {i+1}: {e}")
-                translated_sentences.append(sentence)  # Keep original
+                logger.warning(f"Failed to translate sentences {i+1}-{i+len(batch)}: {e}")
+                translated_sentences.extend(batch)  # Keep original
         
         return " ".join(translated_sentences)
+    
+    def _generate(self, texts, model, tokenizer, max_length=512):
+        """
+        Translate a batch of texts with a single model.generate() call.
+        
+        Args:
+            texts: List of strings to translate
+            model: Loaded MarianMT model
+            tokenizer: Loaded MarianTokenizer
+            max_length: Maximum number of input tokens per text
+        
+        Returns:
+            List of translated strings, in the same order as texts
+        """
+        inputs = tokenizer(texts, return_tensors="pt", padding=True, truncation=True, max_length=max_length)
+        if self.device != 'cpu':
+            inputs = inputs.to(self.device)
+        
+        if self.debug:
+            logger.debug(f"Input tokens: {inputs['input_ids'].shape}")
+        
+        # Budget output at twice the padded input length (Romanian rarely runs longer),
+        # so short batches stop early instead of running to the 512-token ceiling
+        max_new_tokens = min(512, max(16, 2 * inputs['input_ids'].shape[1]))
+        
+        # No gradients are ever needed here; inference_mode skips autograd bookkeeping
+        with torch.inference_mode():
+            translated_tokens = model.generate(
+                **inputs, num_beams=self.NUM_BEAMS, do_sample=False, max_new_tokens=max_new_tokens
+            )
+        return tokenizer.batch_decode(translated_tokens, skip_special_tokens=True)
 
 
 def preload_model(model_name, debug=False):
@@ -520,7 +1215,6 @@ def preload_model(model_name, debug=False):
         bool: True if model is available, False otherwise
     """
     try:
-        import whisper
         model_path = whisper._download(whisper._MODELS[model_name])
         if debug:
             logger.debug(f"Model '{model_name}' is available at: {model_path}")
@@ -554,6 +1248,239 @@ def check_diarization_requirements():
     return True, None
 
 
+# Sentinel for getattr() lookups, so a missing attribute costs no raised AttributeError
+_MISSING = object()
+
+# Fetches (item.start, item.end) in one C-level call
+_START_END = operator.attrgetter('start', 'end')
+
+
+# One diarization segment: start/end in seconds plus an index into the label table
+_SEG_DTYPE = np.dtype([('start', 'f8'), ('end', 'f8'), ('label_id', 'i4')])
+
+
+class DiarizationSegments(namedtuple('DiarizationSegments', ['records', 'label_names'])):
+    """
+    Diarization segments as a structured array, in the order pyannote produced them.
+    
+    Fields:
+        records: _SEG_DTYPE array of (start, end, label_id)
+        label_names: Raw speaker labels (e.g. SPEAKER_00), indexed by label_id in first-seen order
+    """
+    
+    __slots__ = ()
+    
+    def __bool__(self):
+        return len(self.records) > 0
+    
+    @property
+    def starts(self):
+        return self.records['start']
+    
+    @property
+    def ends(self):
+        return self.records['end']
+    
+    @property
+    def labels(self):
+        """Raw speaker label of every segment, as a list."""
+        return list(map(self.label_names.__getitem__, self.records['label_id'].tolist()))
+
+
+class _SegmentBuffer:
+    """Growable _SEG_DTYPE buffer with an interned label table, preallocated from a length hint."""
+    
+    __slots__ = ('records', 'count', 'label_ids', 'label_names')
+    
+    def __init__(self, source):
+        self.records = np.empty(operator.length_hint(source, 0) or 64, dtype=_SEG_DTYPE)
+        self.count = 0
+        self.label_ids = {}
+        self.label_names = []
+    
+    def add(self, start, end, label):
+        label_id = self.label_ids.get(label)
+        if label_id is None:
+            label_id = self.label_ids[label] = len(self.label_names)
+            self.label_names.append(label)
+        i = self.count
+        if i == len(self.records):
+            # Length hint was too small: double the capacity
+            self.records = np.concatenate((self.records, np.empty(i, dtype=_SEG_DTYPE)))
+        self.records[i] = (start, end, label_id)
+        self.count = i + 1
+    
+    def finish(self):
+        return DiarizationSegments(self.records[:self.count], self.label_names)
+
+
+# Handle different pyannote.audio API versions
+# pyannote.audio 3.x+ returns DiarizeOutput which is a named tuple with .speaker_diarization attribute
+# We need to handle both old Annotation objects and new DiarizeOutput objects
+def _segments_from_annotation(annotation):
+    """Extract DiarizationSegments from a pyannote Annotation."""
+    buffer = _SegmentBuffer(annotation)
+    add = buffer.add
+    for turn, _, speaker in annotation.itertracks(yield_label=True):
+        add(turn.start, turn.end, speaker)
+    return buffer.finish()
+
+
+def _segments_from_iteration(diarization_result):
+    """Extract segments by iterating the result directly (some pyannote versions support this)."""
+    buffer = _SegmentBuffer(diarization_result)
+    add = buffer.add
+    start_end = _START_END
+    for item in diarization_result:
+        try:
+            start, end = start_end(item)
+        except AttributeError:
+            if isinstance(item, tuple) and len(item) >= 3:
+                turn = item[0]
+                add(getattr(turn, 'start', turn), getattr(turn, 'end', item[1]), item[2])
+            continue
+        # It's a segment with start/end, try to get the label
+        label = getattr(item, 'label', _MISSING)
+        if label is _MISSING:
+            label = getattr(item, 'speaker', 'SPEAKER')
+        add(start, end, label)
+    return buffer.finish()
+
+
+# Keys probed on dict-like diarization results, in order of preference
+_DICT_PROBE_KEYS = ('speaker_diarization', 'segments', 'tracks', 'diarization')
+
+
+def _segments_from_mapping(diarization_result):
+    """Extract segments from a dict-like result holding an Annotation (or segment list) under a known key."""
+    get = getattr(diarization_result, 'get', None)
+    if get is None:
+        raise AttributeError(f"{type(diarization_result).__name__} is not dict-like")
+    for key in _DICT_PROBE_KEYS:
+        value = get(key)
+        if value:
+            if hasattr(value, 'itertracks'):
+                return _segments_from_annotation(value)
+            return _segments_from_iteration(value)
+    raise KeyError(f"none of {_DICT_PROBE_KEYS} present")
+
+
+# Internal (timeline, labels) attribute pairs of Annotation-like objects, tried in order
+_INTERNAL_SEGMENT_ATTRS = (('_timeline', '_labels'),)
+
+
+def _segments_from_internals(diarization_result):
+    """Last resort: read the internal data structures of an Annotation-like object."""
+    # Collect the attribute names the object actually has, so absent pairs are pruned
+    # with set lookups instead of attribute probes
+    try:
+        keys = set(vars(diarization_result))
+    except TypeError:
+        keys = set()
+    for klass in type(diarization_result).__mro__:
+        keys.update(vars(klass))
+    
+    for timeline_attr, label_attr in _INTERNAL_SEGMENT_ATTRS:
+        if timeline_attr not in keys or label_attr not in keys:
+            continue
+        timeline = getattr(diarization_result, timeline_attr, _MISSING)
+        if timeline is _MISSING:
+            continue
+        labels = getattr(diarization_result, label_attr, _MISSING)
+        if labels is _MISSING:
+            continue
+        buffer = _SegmentBuffer(timeline)
+        for seg, lbl in zip(timeline, labels):
+            start = getattr(seg, 'start', _MISSING)
+            if start is _MISSING:
+                continue
+            buffer.add(start, seg.end, lbl)
+        segments = buffer.finish()
+        if segments:
+            return segments
+    raise AttributeError(f"{type(diarization_result).__name__} has no internal timeline/labels")
+
+
+# Segment extractors in order of preference, as (description, extractor) pairs.
+# Each extractor raises (e.g. AttributeError) when the result does not support it.
+_SEGMENT_EXTRACTORS = (
+    # pyannote.audio 3.x+ DiarizeOutput: .speaker_diarization holds the Annotation object
+    ('.speaker_diarization.itertracks()', lambda r: _segments_from_annotation(r.speaker_diarization)),
+    ('.exclusive_speaker_diarization.itertracks()',
+     lambda r: _segments_from_annotation(r.exclusive_speaker_diarization)),
+    # Annotation objects from older pyannote versions
+    ('.itertracks()', _segments_from_annotation),
+    # Some DiarizeOutput versions
+    ('.to_annotation()', lambda r: _segments_from_annotation(r.to_annotation())),
+    ('direct iteration', _segments_from_iteration),
+    # DiarizeOutput as NamedTuple
+    ('index [0]', lambda r: _segments_from_annotation(r[0])),
+    ('dict keys', _segments_from_mapping),
+    ('internal structures', _segments_from_internals),
+)
+
+# Extractor that worked for each diarization result type, so later calls skip the probing
+_segment_extractor_cache = {}
+
+
+def get_diarization_segments(diarization_result, debug=False):
+    """
+    Extract segments from a diarization result, handling pyannote API differences.
+    
+    The first call for a given result type probes the extractors in order; the one that
+    works is cached and used directly for later results of the same type.
+    
+    Args:
+        diarization_result: Output of the pyannote diarization pipeline
+        debug: Enable debug output
+    
+    Returns:
+        DiarizationSegments: Structured (start, end, label_id) records and the label table
+    
+    Raises:
+        AttributeError: If no extractor can read the result
+    """
+    # Skip building debug strings (including the dir() dump) when DEBUG records would be dropped
+    debug = debug and logger.isEnabledFor(logging.DEBUG)
+    result_type = type(diarization_result)
+    cached = _segment_extractor_cache.get(result_type)
+    if cached is not None:
+        try:
+            segments = cached[1](diarization_result)
+            if segments:
+                return segments
+        except Exception:
+            pass
+    
+    if debug:
+        logger.debug(f"Diarization result type: {result_type.__name__}")
+        logger.debug(f"Diarization result attributes: {dir(diarization_result)}")
+    
+    for description, extractor in _SEGMENT_EXTRACTORS:
+        try:
+            segments = extractor(diarization_result)
+        except Exception as e:
+            if debug:
+                logger.debug(f"Failed to extract via {description}: {e}")
+            continue
+        if segments:
+            if debug:
+                logger.debug(f"Extracted {len(segments.records)} segments via {description}")
+            _segment_extractor_cache[result_type] = (description, extractor)
+            return segments
+    
+    raise AttributeError("Unable to extract segments from diarization output. "
+                       f"Object type: {result_type.__name__}. "
+                       f"Available attributes: {[a for a in dir(diarization_result) if not a.startswith('_')]}")
+
+
+# Pretrained pyannote pipeline used for speaker diarization
+DIARIZATION_MODEL = "pyannote/speaker-diarization-community-1"
+
+# Loaded diarization pipelines keyed by (model, SHA-256 of the HF token), reused for the process lifetime
+_diarization_pipelines = {}
+
+
 def perform_speaker_diarization(audio_path, speaker_names=None, debug=False):
     """
     Perform speaker diarization on an audio file.
@@ -565,13 +1492,13 @@ def perform_speaker_diarization(audio_path, speaker_names=None, debug=False):
     
     Returns:
         tuple: (speaker_timeline, status_message)
-            - speaker_timeline: Dictionary mapping time ranges to speaker labels, or None if failed
+            - speaker_timeline: SpeakerTimeline of segments sorted by start, or None if failed
             - status_message: String describing the result or error
     """
     if debug:
-        logger.debug("="*80)
+        logger.debug(_RULE)
         logger.debug("SPEAKER DIARIZATION START")
-        logger.debug("="*80)
+        logger.debug(_RULE)
         logger.debug(f"Audio path: {audio_path}")
         logger.debug(f"Speaker names: {speaker_names}")
     
@@ -589,267 +1516,159 @@ def perform_speaker_diarization(audio_path, speaker_names=None, debug=False):
         logger.info("Performing speaker diarization...")
         if debug:
             logger.debug("Loading pyannote speaker-diarization-community-1 model...")
-            import time
             start_time = time.time()
         
         hf_token = os.environ.get('HF_TOKEN') or os.environ.get('HUGGING_FACE_TOKEN')
         
         # Load diarization pipeline (using community-1 model - recommended open-source model)
         # Handle API compatibility: pyannote.audio v3.1+ uses 'token', older versions use 'use_auth_token'
-        pipeline = None
-        try:
-            # Try new API first (pyannote.audio v3.1+)
-            pipeline = Pipeline.from_pretrained(
-                "pyannote/speaker-diarization-community-1",
-                token=hf_token
-            )
+        # Reuse a pipeline already loaded in this process (skips checkpoint load and graph init)
+        # Key on a digest so the raw token is not kept in a long-lived module dict
+        pipeline_key = (DIARIZATION_MODEL, hashlib.sha256((hf_token or '').encode()).hexdigest())
+        pipeline = _diarization_pipelines.get(pipeline_key)
+        if pipeline is not None:
             if debug:
-                logger.debug("Loaded diarization pipeline using new API (token parameter)")
-        except TypeError as e:
-            if "use_auth_token" in str(e) or "unexpected keyword argument" in str(e):
-                # Fall back to old API (pyannote.audio v3.0 and earlier)
+                logger.debug("Reusing cached diarization pipeline")
+        else:
+            try:
+                # Try new API first (pyannote.audio v3.1+)
                 pipeline = Pipeline.from_pretrained(
-                    "pyannote/speaker-diarization-community-1",
-                    use_auth_token=hf_token
+                    DIARIZATION_MODEL,
+                    token=hf_token
                 )
                 if debug:
-                    logger.debug("Loaded diarization pipeline using old API (use_auth_token parameter)")
-            else:
+                    logger.debug("Loaded diarization pipeline using new API (token parameter)")
+            except TypeError as e:
+                if "use_auth_token" in str(e) or "unexpected keyword argument" in str(e):
+                    # Fall back to old API (pyannote.audio v3.0 and earlier)
+                    pipeline = Pipeline.from_pretrained(
+                        DIARIZATION_MODEL,
+                        use_auth_token=hf_token
+                    )
+                    if debug:
+                        logger.debug("Loaded diarization pipeline using old API (use_auth_token parameter)")
+                else:
+                    raise
+            except NameError as e:
+                # Handle AudioDecoder not defined error from torchcodec incompatibility
+                error_str = str(e)
+                if 'AudioDecoder' in error_str:
+                    error_msg = ("Speaker diarization failed due to torchcodec/AudioDecoder incompatibility.\n"
+                               "FIX: Run 'pip uninstall torchcodec' in your terminal, then restart the application.\n"
+                               "This is a known issue with pyannote.audio 4.x and torchcodec.")
+                    logger.error(error_msg)
+                    return None, error_msg
                 raise
-        except NameError as e:
-            # Handle AudioDecoder not defined error from torchcodec incompatibility
-            error_str = str(e)
-            if 'AudioDecoder' in error_str:
-                error_msg = ("Speaker diarization failed due to torchcodec/AudioDecoder incompatibility.\n"
-                           "FIX: Run 'pip uninstall torchcodec' in your terminal, then restart the application.\n"
-                           "This is a known issue with pyannote.audio 4.x and torchcodec.")
-                logger.error(error_msg)
-                return None, error_msg
-            raise
+            # Run the pipeline's segmentation and embedding models on the GPU when available
+            if pipeline is not None and TORCH_AVAILABLE and torch.cuda.is_available():
+                pipeline.to(torch.device('cuda'))
+                if debug:
+                    logger.debug("Moved diarization pipeline to CUDA")
+            _diarization_pipelines[pipeline_key] = pipeline
         
         if debug:
             logger.debug(f"Model loaded in {time.time() - start_time:.2f}s")
             logger.debug("Running diarization pipeline...")
             start_time = time.time()
         
-        # Pre-load audio using librosa/soundfile to AVOID torchcodec/AudioDecoder issues in pyannote.audio 4.x
+        # Pre-load audio using soundfile/librosa to AVOID torchcodec/AudioDecoder issues in pyannote.audio 4.x
         # This is the FIX for the "torchcodec/AudioDecoder incompatibility" error
         # The pipeline accepts a dictionary with "waveform" and "sample_rate" keys
         audio_input = None
         try:
-            # Method 1: Use librosa (most reliable, avoids torchcodec entirely)
-            try:
-                import librosa
-                import numpy as np
-                
-                # Load audio with librosa at 16kHz (pyannote preferred sample rate)
-                audio_data, sample_rate = librosa.load(audio_path, sr=16000, mono=True)
-                
-                # Convert to torch tensor with correct shape [channels, samples]
-                waveform = torch.from_numpy(audio_data).unsqueeze(0).float()
-                audio_input = {"waveform": waveform, "sample_rate": sample_rate}
-                
-                if debug:
-                    logger.debug(f"Audio loaded via librosa: {waveform.shape}, {sample_rate}Hz")
-            except ImportError:
-                if debug:
-                    logger.debug("librosa not available, trying soundfile...")
-                raise
-                
-        except Exception as librosa_err:
-            # Method 2: Use soundfile as fallback
-            try:
-                import soundfile as sf
-                import numpy as np
-                
-                audio_data, sample_rate = sf.read(audio_path)
-                
-                # Handle stereo by averaging channels
-                if len(audio_data.shape) > 1:
-                    audio_data = np.mean(audio_data, axis=1)
-                
-                # Resample to 16kHz if needed
-                if sample_rate != 16000:
+            # Method 1: Use soundfile (libsndfile C decoder, no resample needed for 16kHz WAV)
+            sf = _lazy_import('soundfile')
+            
+            # Have libsndfile decode straight into a float32 buffer
+            audio_data, sample_rate = sf.read(audio_path, dtype='float32', always_2d=False)
+            
+            # Handle stereo by averaging channels (mono input is used as-is)
+            if audio_data.ndim > 1 and audio_data.shape[1] == 2:
+                # Fold stereo in a single pass into one preallocated float32 buffer
+                mono = np.empty(audio_data.shape[0], dtype=np.float32)
+                np.add(audio_data[:, 0], audio_data[:, 1], out=mono)
+                mono *= 0.5
+                audio_data = mono
+            elif audio_data.ndim > 1:
+                audio_data = np.mean(audio_data, axis=1, dtype=np.float32)
+            
+            # Resample to 16kHz if needed (pyannote preferred sample rate)
+            if sample_rate != 16000:
+                try:
+                    # soxr: SIMD-optimized C resampler
+                    soxr = _lazy_import('soxr')
+                    audio_data = soxr.resample(audio_data, sample_rate, 16000)
+                    sample_rate = 16000
+                except ImportError:
                     try:
-                        import librosa
+                        librosa = _lazy_import('librosa')
                         audio_data = librosa.resample(audio_data, orig_sr=sample_rate, target_sr=16000)
                         sample_rate = 16000
                     except ImportError:
                         # If librosa not available for resampling, use scipy
                         try:
-                            from scipy import signal
+                            signal = _lazy_import('scipy.signal')
                             num_samples = int(len(audio_data) * 16000 / sample_rate)
                             audio_data = signal.resample(audio_data, num_samples)
                             sample_rate = 16000
                         except ImportError:
                             if debug:
                                 logger.debug(f"Resampling not available, using original sample rate {sample_rate}Hz")
+            
+            # No-op when the buffer is already contiguous float32, so from_numpy shares memory
+            audio_data = np.ascontiguousarray(audio_data, dtype=np.float32)
+            waveform = torch.from_numpy(audio_data).unsqueeze_(0)
+            audio_input = {"waveform": waveform, "sample_rate": sample_rate}
+            
+            if debug:
+                logger.debug(f"Audio loaded via soundfile: {waveform.shape}, {sample_rate}Hz")
+                
+        except Exception as sf_err:
+            # Method 2: Use librosa as fallback (handles formats libsndfile cannot decode)
+            if debug:
+                logger.debug(f"soundfile load failed ({sf_err}), trying librosa...")
+            try:
+                librosa = _lazy_import('librosa')
+                
+                # Load audio with librosa at 16kHz (pyannote preferred sample rate)
+                audio_data, sample_rate = librosa.load(audio_path, sr=16000, mono=True)
                 
-                waveform = torch.from_numpy(audio_data.astype(np.float32)).unsqueeze(0)
+                # Convert to torch tensor with correct shape [channels, samples]
+                waveform = torch.from_numpy(audio_data).unsqueeze(0).float()
                 audio_input = {"waveform": waveform, "sample_rate": sample_rate}
                 
                 if debug:
-                    logger.debug(f"Audio loaded via soundfile: {waveform.shape}, {sample_rate}Hz")
+                    logger.debug(f"Audio loaded via librosa: {waveform.shape}, {sample_rate}Hz")
                     
-            except Exception as sf_err:
+            except Exception as librosa_err:
                 if debug:
-                    logger.debug(f"soundfile load failed ({sf_err}), falling back to file path")
+                    logger.debug(f"librosa load failed ({librosa_err}), falling back to file path")
                 # Last resort: pass file path directly (may trigger torchcodec issues)
                 audio_input = audio_path
         
-        # Run diarization
-        diarization = pipeline(audio_input)
+        # Run diarization without autograd, in FP16 autocast on CUDA GPUs
+        if torch.cuda.is_available():
+            autocast = torch.autocast('cuda', dtype=torch.float16)
+        else:
+            autocast = contextlib.nullcontext()
+        with torch.inference_mode(), autocast:
+            diarization = pipeline(audio_input)
         
         if debug:
             logger.debug(f"Diarization completed in {time.time() - start_time:.2f}s")
         
-        # Map speaker labels to custom names if provided
-        speaker_map = {}
+        diarization_segments = get_diarization_segments(diarization, debug=debug)
         
-        # Handle different pyannote.audio API versions
-        # pyannote.audio 3.x+ returns DiarizeOutput which is a named tuple with .annotation attribute
-        # We need to handle both old Annotation objects and new DiarizeOutput objects
-        def get_diarization_segments(diarization_result):
-            """Extract segments from diarization result, handling API differences."""
-            segments = []
-            
-            if debug:
-                logger.debug(f"Diarization result type: {type(diarization_result).__name__}")
-                logger.debug(f"Diarization result attributes: {dir(diarization_result)}")
-            
-            # For pyannote.audio 3.x+ DiarizeOutput: access the .speaker_diarization attribute
-            # DiarizeOutput has 'speaker_diarization' containing the Annotation object
-            if hasattr(diarization_result, 'speaker_diarization'):
-                try:
-                    annotation = diarization_result.speaker_diarization
-                    if debug:
-                        logger.debug(f"Found .speaker_diarization attribute, type: {type(annotation).__name__}")
-                    if hasattr(annotation, 'itertracks'):
-                        for turn, _, speaker in annotation.itertracks(yield_label=True):
-                            segments.append((turn.start, turn.end, speaker))
-                        if segments:
-                            if debug:
-                                logger.debug(f"Extracted {len(segments)} segments via .speaker_diarization.itertracks()")
-                            return segments
-                except Exception as e:
-                    if debug:
-                        logger.debug(f"Failed to extract via .speaker_diarization: {e}")
-                    pass
-            
-            # Fallback: try .exclusive_speaker_diarization attribute
-            if hasattr(diarization_result, 'exclusive_speaker_diarization'):
-                try:
-                    annotation = diarization_result.exclusive_speaker_diarization
-                    if debug:
-                        logger.debug(f"Found .exclusive_speaker_diarization attribute, type: {type(annotation).__name__}")
-                    if hasattr(annotation, 'itertracks'):
-                        for turn, _, speaker in annotation.itertracks(yield_label=True):
-                            segments.append((turn.start, turn.end, speaker))
-                        if segments:
-                            if debug:
-                                logger.debug(f"Extracted {len(segments)} segments via .exclusive_speaker_diarization.itertracks()")
-                            return segments
-                except Exception as e:
-                    if debug:
-                        logger.debug(f"Failed to extract via .exclusive_speaker_diarization: {e}")
-                    pass
-            
-            # Try itertracks() method directly (Annotation objects from older pyannote versions)
-            if hasattr(diarization_result, 'itertracks'):
-                try:
-                    for turn, _, speaker in diarization_result.itertracks(yield_label=True):
-                        segments.append((turn.start, turn.end, speaker))
-                    if segments:
-                        if debug:
-                            logger.debug(f"Extracted {len(segments)} segments via .itertracks()")
-                        return segments
-                except Exception as e:
-                    if debug:
-                        logger.debug(f"Failed to extract via .itertracks(): {e}")
-                    pass
-            
-            # Try accessing as a pyannote Annotation via .to_annotation() (some DiarizeOutput versions)
-            if hasattr(diarization_result, 'to_annotation'):
-                try:
-                    annotation = diarization_result.to_annotation()
-                    for turn, _, speaker in annotation.itertracks(yield_label=True):
-                        segments.append((turn.start, turn.end, speaker))
-                    if segments:
-                        if debug:
-                            logger.debug(f"Extracted {len(segments)} segments via .to_annotation()")
-                        return segments
-                except Exception as e:
-                    if debug:
-                        logger.debug(f"Failed to extract via .to_annotation(): {e}")
-                    pass
-            
-            # Try iterating directly (some pyannote versions support this)
-            try:
-                for item in diarization_result:
-                    if hasattr(item, 'start') and hasattr(item, 'end'):
-                        # It's a segment with start/end, try to get the label
-                        label = getattr(item, 'label', getattr(item, 'speaker', 'SPEAKER'))
-                        segments.append((item.start, item.end, label))
-                    elif isinstance(item, tuple) and len(item) >= 3:
-                        segments.append((item[0].start if hasattr(item[0], 'start') else item[0],
-                                       item[0].end if hasattr(item[0], 'end') else item[1],
-                                       item[2] if len(item) > 2 else 'SPEAKER'))
-                if segments:
-                    if debug:
-                        logger.debug(f"Extracted {len(segments)} segments via direct iteration")
-                    return segments
-            except Exception as e:
-                if debug:
-                    logger.debug(f"Failed to extract via direct iteration: {e}")
-                pass
-            
-            # Try accessing as tuple index [0] (DiarizeOutput as NamedTuple)
-            try:
-                if hasattr(diarization_result, '__getitem__'):
-                    annotation = diarization_result[0]
-                    if hasattr(annotation, 'itertracks'):
-                        for turn, _, speaker in annotation.itertracks(yield_label=True):
-                            segments.append((turn.start, turn.end, speaker))
-                        if segments:
-                            if debug:
-                                logger.debug(f"Extracted {len(segments)} segments via index [0]")
-                            return segments
-            except Exception as e:
-                if debug:
-                    logger.debug(f"Failed to extract via index [0]: {e}")
-                pass
-            
-            # Last resort: try to access internal data structures
-            if hasattr(diarization_result, '_timeline') and hasattr(diarization_result, '_labels'):
-                try:
-                    timeline = diarization_result._timeline
-                    labels = diarization_result._labels
-                    for seg, lbl in zip(timeline, labels):
-                        segments.append((seg.start, seg.end, lbl))
-                    if segments:
-                        if debug:
-                            logger.debug(f"Extracted {len(segments)} segments via internal structures")
-                        return segments
-                except Exception as e:
-                    if debug:
-                        logger.debug(f"Failed to extract via internal structures: {e}")
-                    pass
-            
-            raise AttributeError("Unable to extract segments from diarization output. "
-                               f"Object type: {type(diarization_result).__name__}. "
-                               f"Available attributes: {[a for a in dir(diarization_result) if not a.startswith('_')]}")
-        
-        diarization_segments = get_diarization_segments(diarization)
-        unique_speakers = sorted(set(seg[2] for seg in diarization_segments))
-        num_speakers_found = len(unique_speakers)
+        records, label_names = diarization_segments
         
         # Build speaker_first_appearance dictionary - track earliest start time for each speaker
-        speaker_first_appearance = {}
-        for start, end, speaker in diarization_segments:
-            if speaker not in speaker_first_appearance:
-                speaker_first_appearance[speaker] = start
-            else:
-                speaker_first_appearance[speaker] = min(speaker_first_appearance[speaker], start)
+        # (vectorized minimum of segment starts per label id)
+        first_starts = np.full(len(label_names), np.inf)
+        np.minimum.at(first_starts, records['label_id'], records['start'])
+        speaker_first_appearance = dict(zip(label_names, first_starts.tolist()))
+        
+        unique_speakers = sorted(speaker_first_appearance)
+        num_speakers_found = len(unique_speakers)
         
         if debug:
             logger.debug("Speaker first appearance times:")
@@ -862,39 +1681,43 @@ def perform_speaker_diarization(audio_path, speaker_names=None, debug=False):
         
         # Sort unique speakers by their first appearance time to ensure consistent numbering
         # Speaker who appears first becomes "Speaker 1", second becomes "Speaker 2", etc.
-        speakers_by_appearance = sorted(unique_speakers, key=lambda s: speaker_first_appearance.get(s, float('inf')))
+        # (label ids are in first-seen order, so the stable argsort also breaks ties by that order)
+        appearance_order = np.argsort(first_starts, kind='stable')
+        speakers_by_appearance = [label_names[i] for i in appearance_order.tolist()]
         
         # Always create default "Speaker 1", "Speaker 2" labels for all detected speakers
-        for idx, spk in enumerate(speakers_by_appearance):
-            default_label = f"Speaker {idx + 1}"
-            speaker_map[spk] = default_label
-            if debug:
+        speaker_map = {spk: f"Speaker {idx + 1}" for idx, spk in enumerate(speakers_by_appearance)}
+        if debug:
+            for spk, default_label in speaker_map.items():
                 logger.debug(f"Default mapping: {spk} -> {default_label}")
         
         # Override with custom names if provided
         if speaker_names:
-            for idx, custom_name in enumerate(speaker_names):
-                if idx < len(speakers_by_appearance) and custom_name:
-                    original_label = speakers_by_appearance[idx]
+            for original_label, custom_name in zip(speakers_by_appearance, speaker_names):
+                if custom_name:
                     speaker_map[original_label] = custom_name
                     logger.info(f"Custom mapping: {original_label} -> {custom_name}")
         
         logger.info(f"Speaker mappings: {speaker_map}")
         
-        # Convert to dictionary format
-        speaker_timeline = {}
-        for start, end, speaker in diarization_segments:
-            mapped_speaker = speaker_map.get(speaker, speaker)
-            speaker_timeline[(start, end)] = mapped_speaker
+        # Map labels (every detected speaker has an entry, so plain indexing is safe)
+        # and sort the segment arrays into the lookup timeline
+        mapped_names = [speaker_map[speaker] for speaker in label_names]
+        speaker_timeline = build_speaker_timeline(
+            records['start'],
+            records['end'],
+            list(map(mapped_names.__getitem__, records['label_id'].tolist()))
+        )
         
-        num_segments = len(speaker_timeline)
+        num_segments = len(speaker_timeline.labels)
         status_msg = f"Speaker diarization complete: {num_speakers_found} speakers, {num_segments} segments"
         logger.info(f"✓ {status_msg}")
         
         if debug:
             logger.debug(f"Speaker timeline entries: {num_segments}")
             logger.debug("First 5 entries:")
-            for i, ((start, end), spk) in enumerate(list(speaker_timeline.items())[:5]):
+            for start, end, spk in zip(speaker_timeline.starts[:5], speaker_timeline.ends[:5],
+                                       speaker_timeline.labels[:5]):
                 logger.debug(f"  [{start:.2f} -> {end:.2f}] {spk}")
         
         return speaker_timeline, status_msg
@@ -909,9 +1732,7 @@ def perform_speaker_diarization(audio_path, speaker_names=None, debug=False):
             error_msg = f"Speaker diarization failed: {error_str}"
         logger.error(error_msg)
         if debug:
-            import traceback
-            logger.debug("Full traceback:")
-            logger.debug(traceback.format_exc())
+            logger.debug("Full traceback:", exc_info=True)
         return None, error_msg
     except Exception as e:
         error_str = str(e)
@@ -923,36 +1744,192 @@ def perform_speaker_diarization(audio_path, speaker_names=None, debug=False):
             error_msg = f"Speaker diarization failed: {error_str}"
         logger.error(error_msg)
         if debug:
-            import traceback
-            logger.debug("Full traceback:")
-            logger.debug(traceback.format_exc())
+            logger.debug("Full traceback:", exc_info=True)
         return None, error_msg
 
 
-def get_speaker_for_timestamp(speaker_timeline, timestamp):
+class SpeakerTimeline(namedtuple('SpeakerTimeline', ['starts', 'ends', 'max_ends', 'labels'])):
+    """
+    Speaker diarization timeline stored as parallel arrays sorted by segment start.
+    
+    Fields:
+        starts: float64 array of segment start times (seconds, ascending)
+        ends: float64 array of segment end times
+        max_ends: Running maximum of ends, bounds the search for overlapping segments
+        labels: List of speaker labels
+    """
+    
+    __slots__ = ()
+    
+    def __bool__(self):
+        return bool(self.labels)
+
+
+def build_speaker_timeline(starts, ends, labels):
+    """
+    Build a SpeakerTimeline from parallel segment arrays.
+    
+    Args:
+        starts: Segment start times (array-like), in any order
+        ends: Segment end times, parallel to starts
+        labels: Speaker labels, parallel to starts
+    
+    Returns:
+        SpeakerTimeline: Segments sorted by start time
+    """
+    starts = np.asarray(starts, dtype=np.float64)
+    ends = np.asarray(ends, dtype=np.float64)
+    # Stable sort keeps the original order of segments that start at the same time
+    order = np.argsort(starts, kind='stable')
+    ends = ends[order]
+    return SpeakerTimeline(starts[order], ends, np.maximum.accumulate(ends),
+                           [labels[i] for i in order.tolist()])
+
+
+def get_speaker_for_timestamp(speaker_timeline, timestamp):
+    """
+    Get the speaker label for a given timestamp.
+    
+    If segments overlap, the earliest-starting one containing timestamp wins.
+    
+    Args:
+        speaker_timeline: SpeakerTimeline, or a legacy dictionary mapping time ranges to speakers
+        timestamp: Time in seconds
+    
+    Returns:
+        Speaker label or None
+    """
+    if not speaker_timeline:
+        return None
+    
+    if isinstance(speaker_timeline, SpeakerTimeline):
+        starts, ends, max_ends, labels = speaker_timeline
+        speaker = None
+        i = int(np.searchsorted(starts, timestamp, side='right')) - 1
+        # Walk back only while an earlier segment could still reach timestamp
+        while i >= 0 and max_ends[i] >= timestamp:
+            if ends[i] >= timestamp:
+                speaker = labels[i]
+            i -= 1
+        return speaker
+    
+    for (start, end), speaker in speaker_timeline.items():
+        if start <= timestamp <= end:
+            return speaker
+    
+    return None
+
+
+def get_speakers_for_timestamps(speaker_timeline, timestamps):
+    """
+    Look up the speaker for many timestamps at once.
+    
+    Same rule as get_speaker_for_timestamp (earliest-starting segment containing
+    the timestamp wins), resolved with two searchsorted calls: the last segment
+    starting at or before t, and the first whose running max end reaches t. That
+    first segment itself ends at or after t, so it is the answer whenever it does
+    not start after t.
+    
+    Args:
+        speaker_timeline: SpeakerTimeline, or a legacy dictionary mapping time ranges to speakers
+        timestamps: Sequence of times in seconds
+    
+    Returns:
+        List of speaker labels (None where no segment covers the timestamp)
+    """
+    if not isinstance(speaker_timeline, SpeakerTimeline):
+        return [get_speaker_for_timestamp(speaker_timeline, t) for t in timestamps]
+    
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+    if not speaker_timeline or timestamps.size == 0:
+        return [None] * len(timestamps)
+    
+    starts, _, max_ends, labels = speaker_timeline
+    last_started = np.searchsorted(starts, timestamps, side='right') - 1
+    first_reaching = np.searchsorted(max_ends, timestamps, side='left')
+    hit = first_reaching <= last_started
+    return [labels[i] if ok else None for i, ok in zip(first_reaching.tolist(), hit.tolist())]
+
+
+def label_segment_speakers(speaker_timeline, segments):
+    """
+    Set segment['speaker'] on each Whisper segment from its midpoint.
+    
+    Args:
+        speaker_timeline: SpeakerTimeline from perform_speaker_diarization
+        segments: List of Whisper segment dicts (modified in place)
+    """
+    mids = [(segment['start'] + segment['end']) * 0.5 for segment in segments]
+    for segment, speaker in zip(segments, get_speakers_for_timestamps(speaker_timeline, mids)):
+        segment['speaker'] = speaker if speaker else "Unknown"
+
+
+class SegmentColumns(namedtuple('SegmentColumns', ['starts', 'ends', 'texts', 'speakers'])):
     """
-    Get the speaker label for a given timestamp.
+    Whisper segments flattened into parallel lists for the output writers.
+    
+    Fields:
+        starts: Segment start times (seconds)
+        ends: Segment end times
+        texts: Segment text, stripped
+        speakers: Speaker label per segment, or None
+    """
+    
+    __slots__ = ()
+    
+    def __bool__(self):
+        return bool(self.texts)
+
+
+def _write_utf8(output_path, text):
+    """
+    Encode text once and write it in binary mode, bypassing the text-mode I/O layer.
+    
+    Newlines are still translated to the platform convention, as open(..., 'w') would.
     
     Args:
-        speaker_timeline: Dictionary mapping time ranges to speakers
-        timestamp: Time in seconds
+        output_path: Destination file
+        text: Complete file contents
     
     Returns:
-        Speaker label or None
+        int: Bytes written
     """
-    if not speaker_timeline:
-        return None
+    if os.linesep != "\n":
+        text = text.replace("\n", os.linesep)
+    data = text.encode('utf-8')
+    with open(output_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+        f.write(data)
+    return len(data)
+
+
+def segment_columns(segments):
+    """
+    Flatten Whisper segment dicts into a SegmentColumns, once per output pass.
     
-    for (start, end), speaker in speaker_timeline.items():
-        if start <= timestamp <= end:
-            return speaker
+    Args:
+        segments: List of Whisper segment dicts, or an existing SegmentColumns
     
-    return None
+    Returns:
+        SegmentColumns: Parallel start/end/text/speaker lists
+    """
+    if isinstance(segments, SegmentColumns):
+        return segments
+    return SegmentColumns(
+        [segment['start'] for segment in segments],
+        [segment['end'] for segment in segments],
+        [segment['text'].strip() for segment in segments],
+        [segment.get('speaker') for segment in segments],
+    )
 
 
-def process_directory(directory_path, transcriber, args, supported_formats):
+def iter_process_directory(directory_path, transcriber, args, supported_formats):
     """
-    Process all audio/video files in a directory.
+    Process all audio/video files in a directory, yielding a status entry per file.
+    
+    Transcripts are written to disk by process_audio as each file completes; the yielded
+    entries only carry output paths, so full transcription results are not kept alive.
+    Output files are written on a background thread while the next file is transcribed,
+    so each entry is yielded once its files have been written.
     
     Args:
         directory_path: Path to directory
@@ -960,73 +1937,181 @@ def process_directory(directory_path, transcriber, args, supported_formats):
         args: Command-line arguments
         supported_formats: List of supported file extensions
     
-    Returns:
-        List of results for each processed file
+    Yields:
+        dict: {'file', 'status': 'success', 'output_file', 'translated_output_file'}
+              or {'file', 'status': 'failed', 'error'}
     """
     directory = Path(directory_path)
     
     if not directory.exists() or not directory.is_dir():
         logger.error(f"Directory not found or not a directory: {directory_path}")
-        return []
+        return
     
-    # Find all supported files
-    all_files = []
-    for ext in supported_formats:
-        all_files.extend(directory.glob(f"*{ext}"))
+    # Find all supported files in a single directory scan
+    extensions = {ext.lower() for ext in supported_formats}
+    with os.scandir(directory) as entries:
+        all_files = sorted(
+            Path(entry.path) for entry in entries
+            if _file_suffix(entry.name) in extensions and entry.is_file()
+        )
     
     if not all_files:
         logger.warning(f"No supported audio/video files found in: {directory_path}")
         logger.info(f"Supported formats: {', '.join(supported_formats)}")
-        return []
+        return
     
     logger.info(f"Found {len(all_files)} files to process")
     
-    results = []
-    for i, file_path in enumerate(all_files, 1):
-        logger.info("=" * 80)
-        logger.info(f"Processing file {i}/{len(all_files)}: {file_path.name}")
-        logger.info("=" * 80)
-        
-        try:
-            # Process each file
-            result = transcriber.process_audio(
-                audio_path=str(file_path),
-                output_path=args.output,
-                translate=not args.no_translate,
-                include_timestamps=not args.no_timestamps,
-                output_format=args.format,
-                speaker_names=args.speakers.split(',') if args.speakers else None
-            )
-            results.append({'file': str(file_path), 'status': 'success', 'result': result})
-            logger.info(f"✓ Successfully processed: {file_path.name}")
+    def finish(entry, write_future):
+        """Wait for an entry's background write and mark the entry failed if it raised."""
+        if write_future is not None:
+            try:
+                write_future.result()
+            except Exception as e:
+                logger.error(f"✗ Failed to write output for {Path(entry['file']).name}: {e}")
+                entry = {'file': entry['file'], 'status': 'failed', 'error': str(e)}
+        return entry
+    
+    pending = None  # (entry, write_future) of the previous file
+    previous_mode = transcriber.background_writes
+    transcriber.background_writes = True
+    try:
+        for i, file_path in enumerate(all_files, 1):
+            logger.info(_RULE)
+            logger.info(f"Processing file {i}/{len(all_files)}: {file_path.name}")
+            logger.info(_RULE)
             
-        except Exception as e:
-            logger.error(f"✗ Failed to process {file_path.name}: {e}")
-            results.append({'file': str(file_path), 'status': 'failed', 'error': str(e)})
+            write_future = None
+            try:
+                # Process each file
+                result = transcriber.process_audio(
+                    audio_path=str(file_path),
+                    output_path=args.output,
+                    translate=not args.no_translate,
+                    include_timestamps=not args.no_timestamps,
+                    output_format=args.format,
+                    speaker_names=args.speakers
+                )
+                entry = {
+                    'file': str(file_path),
+                    'status': 'success',
+                    'output_file': result.get('output_file'),
+                    'translated_output_file': result.get('translated_output_file'),
+                }
+                write_future = result.get('write_future')
+                # Drop the transcript before the next file is processed
+                del result
+                logger.info(f"✓ Successfully processed: {file_path.name}")
+                
+            except Exception as e:
+                logger.error(f"✗ Failed to process {file_path.name}: {e}")
+                entry = {'file': str(file_path), 'status': 'failed', 'error': str(e)}
+                
+                if args.debug:
+                    logger.debug("Full traceback:", exc_info=True)
             
-            if args.debug:
-                import traceback
-                logger.debug(traceback.format_exc())
-        
-        # Add spacing between files
-        if i < len(all_files):
-            print()
+            # The previous file's write has had this whole transcription to complete
+            if pending is not None:
+                yield finish(*pending)
+            pending = (entry, write_future)
+            
+            # Add spacing between files
+            if i < len(all_files):
+                print()
+        
+        if pending is not None:
+            yield finish(*pending)
+    finally:
+        transcriber.background_writes = previous_mode
+        # Let any in-flight write finish (even if the caller stopped early) and retire the thread
+        transcriber.close()
+
+
+def process_directory(directory_path, transcriber, args, supported_formats):
+    """
+    Process all audio/video files in a directory.
+    
+    Args:
+        directory_path: Path to directory
+        transcriber: AudioTranscriber instance
+        args: Command-line arguments
+        supported_formats: List of supported file extensions
+    
+    Returns:
+        List of per-file status entries (see iter_process_directory)
+    """
+    results = []
+    successful = 0
+    for entry in iter_process_directory(directory_path, transcriber, args, supported_formats):
+        results.append(entry)
+        if entry['status'] == 'success':
+            successful += 1
+    
+    if not results:
+        return results
     
     # Summary
-    successful = sum(1 for r in results if r['status'] == 'success')
     failed = len(results) - successful
     
-    logger.info("=" * 80)
+    logger.info(_RULE)
     logger.info("BATCH PROCESSING SUMMARY")
-    logger.info("=" * 80)
+    logger.info(_RULE)
     logger.info(f"Total files: {len(results)}")
     logger.info(f"Successful: {successful}")
     logger.info(f"Failed: {failed}")
-    logger.info("=" * 80)
+    logger.info(_RULE)
     
     return results
 
 
+@functools.lru_cache(maxsize=1)
+def _probe_cuda():
+    """
+    Query CUDA device details once per process.
+    
+    Returns:
+        dict: device_count, device_name and memory (None if unavailable)
+    """
+    device_count = torch.cuda.device_count()
+    info = {
+        'device_count': device_count,
+        'device_name': torch.cuda.get_device_name(0) if device_count > 0 else None,
+    }
+    try:
+        info['memory'] = f"{torch.cuda.get_device_properties(0).total_memory / (1024**3):.1f} GB"
+    except Exception:
+        pass
+    return info
+
+
+@functools.lru_cache(maxsize=1)
+def _mps_available():
+    """Return True if this PyTorch build reports an MPS backend (checked once per process)."""
+    return hasattr(torch.backends, 'mps') and torch.backends.mps.is_available()
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_mps():
+    """
+    Validate once per process that MPS can run a basic tensor operation.
+    
+    Returns:
+        tuple: (mps_works, error_message) - error_message is None on success
+    """
+    try:
+        # Test basic tensor operations on MPS
+        test_tensor = torch.zeros(1, device='mps')
+        test_result = test_tensor + 1
+        # .item() copies the scalar to the host, which also waits for the operation to complete
+        value = test_result.item()
+        # Verify result is correct (NaN != NaN)
+        if value != 1.0:
+            return False, "MPS returned NaN values" if value != value else f"MPS returned {value} instead of 1.0"
+        return True, None
+    except Exception as e:
+        return False, str(e)
+
+
 def detect_device(preferred_device=None, debug=False):
     """
     Detect the best available compute device.
@@ -1075,31 +2160,19 @@ def detect_device(preferred_device=None, debug=False):
                     'type': 'NVIDIA GPU (CUDA)',
                     'reason': 'User selected CUDA',
                     'fp16_supported': True,
-                    'device_count': torch.cuda.device_count(),
-                    'device_name': torch.cuda.get_device_name(0) if torch.cuda.device_count() > 0 else None,
                 })
-                try:
-                    device_info['memory'] = f"{torch.cuda.get_device_properties(0).total_memory / (1024**3):.1f} GB"
-                except:
-                    pass
+                device_info.update(_probe_cuda())
                 return 'cuda', device_info
             else:
                 logger.warning("CUDA requested but not available. Falling back to auto-detection.")
         
         # Check MPS
         if preferred_device == 'mps':
-            if hasattr(torch.backends, 'mps') and torch.backends.mps.is_available():
-                # Validate MPS works with a test operation
-                mps_works = False
-                try:
-                    test_tensor = torch.zeros(1, device='mps')
-                    test_result = test_tensor + 1
-                    if hasattr(torch.mps, 'synchronize'):
-                        torch.mps.synchronize()
-                    if not torch.isnan(test_result).any():
-                        mps_works = True
-                except Exception as e:
-                    logger.warning(f"MPS validation failed: {e}")
+            if _mps_available():
+                # Validate MPS works with a test operation (cached after the first probe)
+                mps_works, mps_error = _probe_mps()
+                if mps_error:
+                    logger.warning(f"MPS validation failed: {mps_error}")
                 
                 if mps_works:
                     device_info.update({
@@ -1135,44 +2208,23 @@ def detect_device(preferred_device=None, debug=False):
             'type': 'NVIDIA GPU (CUDA)',
             'reason': 'Best available GPU detected',
             'fp16_supported': True,
-            'device_count': torch.cuda.device_count(),
-            'device_name': torch.cuda.get_device_name(0) if torch.cuda.device_count() > 0 else None,
         })
-        try:
-            device_info['memory'] = f"{torch.cuda.get_device_properties(0).total_memory / (1024**3):.1f} GB"
-        except:
-            pass
+        device_info.update(_probe_cuda())
         return 'cuda', device_info
     
     # Check MPS (Apple Silicon) - with validation test for M1/M2/M3 chips
-    if hasattr(torch.backends, 'mps') and torch.backends.mps.is_available():
+    if _mps_available():
         if debug:
             logger.debug("MPS (Apple Silicon GPU) reported as available, running validation test...")
         
         # Validate MPS actually works with a test operation
         # This catches cases where MPS reports available but operations fail
-        mps_works = False
-        mps_error = None
-        try:
-            # Test basic tensor operations on MPS
-            test_tensor = torch.zeros(1, device='mps')
-            test_result = test_tensor + 1
-            # Sync to ensure operation completes
-            if hasattr(torch.mps, 'synchronize'):
-                torch.mps.synchronize()
-            # Verify result is correct (not NaN)
-            if not torch.isnan(test_result).any():
-                mps_works = True
-                if debug:
-                    logger.debug("MPS validation test PASSED")
+        mps_works, mps_error = _probe_mps()
+        if debug:
+            if mps_works:
+                logger.debug("MPS validation test PASSED")
             else:
-                mps_error = "MPS returned NaN values"
-                if debug:
-                    logger.debug(f"MPS validation test FAILED: {mps_error}")
-        except Exception as e:
-            mps_error = str(e)
-            if debug:
-                logger.debug(f"MPS validation test FAILED with exception: {mps_error}")
+                logger.debug(f"MPS validation test FAILED: {mps_error}")
         
         if mps_works:
             device_info.update({
@@ -1198,21 +2250,347 @@ def detect_device(preferred_device=None, debug=False):
     return 'cpu', device_info
 
 
+def _clear_device_probes():
+    """Forget cached CUDA/MPS probe results so the next detect_device() call re-probes."""
+    _probe_cuda.cache_clear()
+    _mps_available.cache_clear()
+    _probe_mps.cache_clear()
+
+
+# Loaded Whisper models keyed by (model_name, device, int8), shared by all AudioTranscriber instances
+_whisper_models = {}
+
+
+def _quantize_int8(model):
+    """
+    Dynamically quantize a CPU Whisper model's linear layers to int8.
+    
+    Whisper's Linear subclass only differs from nn.Linear by casting its weights
+    to the input dtype (a no-op in FP32 on CPU), but quantize_dynamic only swaps
+    exact nn.Linear modules, so they are replaced by plain ones sharing the same
+    parameters first.
+    
+    Args:
+        model: Whisper model loaded on CPU
+    
+    Returns:
+        The quantized model
+    """
+    for module in list(model.modules()):
+        for name, child in module.named_children():
+            if isinstance(child, torch.nn.Linear) and type(child) is not torch.nn.Linear:
+                plain = torch.nn.Linear(child.in_features, child.out_features, bias=child.bias is not None)
+                plain.weight = child.weight
+                plain.bias = child.bias
+                setattr(module, name, plain)
+    return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def load_whisper_model(model_name, device, debug=False, int8=False):
+    """
+    Load a Whisper model, reusing one already loaded in this process for the same device.
+    
+    Args:
+        model_name: Whisper model to use (tiny, base, small, medium, large)
+        device: Device to load the model on (cpu, mps, or cuda)
+        debug: Enable debug output
+        int8: Quantize linear layers to int8 (CPU only; ignored on other devices)
+    
+    Returns:
+        Loaded Whisper model
+    """
+    int8 = int8 and device == 'cpu' and torch is not None
+    cache_key = (model_name, device, int8)
+    model = _whisper_models.get(cache_key)
+    if model is not None:
+        if debug:
+            logger.debug(f"Reusing cached Whisper model '{model_name}' on {device}")
+        return model
+    
+    # For MPS, we need to configure FP32 to avoid FP16 warning
+    if device == 'mps':
+        if debug:
+            logger.debug("Configuring model for MPS with FP32...")
+        
+        # Load model on CPU first, then move to MPS
+        # This ensures proper FP32 configuration
+        model = whisper.load_model(model_name, device='cpu')
+        
+        if TORCH_AVAILABLE and torch is not None:
+            # Convert model to FP32 explicitly
+            model = model.float()
+            # Move to MPS device
+            model = model.to('mps')
+            
+            if debug:
+                logger.debug("Model converted to FP32 and moved to MPS device")
+    else:
+        # For CUDA and CPU, use default loading
+        model = whisper.load_model(model_name, device=device)
+        
+        if device == 'cuda' and torch is not None:
+            # TF32 for the FP32 matmuls left outside FP16 decoding (Ampere+), and let
+            # cuDNN pick the fastest kernels for the encoder's fixed 30s input shape
+            torch.set_float32_matmul_precision('high')
+            torch.backends.cudnn.benchmark = True
+        
+        if int8:
+            model = _quantize_int8(model)
+            if debug:
+                logger.debug("Linear layers quantized to int8 for CPU inference")
+    
+    _whisper_models[cache_key] = model
+    return model
+
+
+@contextlib.contextmanager
+def _whisper_progress(callback):
+    """
+    Route Whisper's progress bar to callback(current_sec, total_sec) while active.
+    
+    whisper.transcribe drives a tqdm bar over mel frames as it decodes each
+    30-second window; this swaps in a bar that forwards those updates instead
+    of drawing to the console.
+    
+    Args:
+        callback: Callable taking (seconds decoded, total seconds), or None for no-op
+    """
+    transcribe_module = sys.modules.get('whisper.transcribe')
+    if callback is None or not hasattr(transcribe_module, 'tqdm'):
+        yield
+        return
+    
+    frames_per_second = getattr(getattr(whisper, 'audio', None), 'FRAMES_PER_SECOND', 100)
+    
+    class _ProgressBar:
+        def __init__(self, total=None, **kwargs):
+            self.total = total or 0
+            self.n = 0
+        
+        def __enter__(self):
+            return self
+        
+        def __exit__(self, *exc_info):
+            return False
+        
+        def update(self, n=1):
+            self.n += n
+            callback(self.n / frames_per_second, self.total / frames_per_second)
+    
+    real_tqdm = transcribe_module.tqdm
+    transcribe_module.tqdm = types.SimpleNamespace(tqdm=_ProgressBar)
+    try:
+        yield
+    finally:
+        transcribe_module.tqdm = real_tqdm
+
+
+# Segment and language-detection lines printed by whisper.transcribe when verbose=True
+_WHISPER_SEGMENT_LINE = re.compile(r'^\[[\d:.]+ --> [\d:.]+\] ?(.*)$')
+_WHISPER_LANGUAGE_LINE = re.compile(r'^Detected language: (.+)$')
+
+
+@contextlib.contextmanager
+def _whisper_segment_stream(callback, language_callback=None, echo=False):
+    """
+    Hand the segment text Whisper prints as each window is decoded to callback(text).
+    
+    Only whisper.transcribe's own print() is swapped while active. sys.stdout is
+    left alone: it is process-wide, and None under pythonw or the windowed build.
+    Whisper's other lines go to the real print(), which drops them when there
+    is no console. The caller turns on verbose for these lines, which would also
+    hide Whisper's tqdm progress bar, so unless segment lines are echoed the bar
+    is forced back on meanwhile. With both callbacks None this does nothing,
+    and the caller keeps verbose=False so nothing is printed.
+    
+    Args:
+        callback: Callable taking one segment's text, or None
+        language_callback: Callable taking the detected language code (None if it
+            cannot be mapped back from Whisper's language name), or None
+        echo: Also print the segment lines, as Whisper's own verbose output does
+    """
+    transcribe_module = sys.modules.get('whisper.transcribe')
+    if (callback is None and language_callback is None) or transcribe_module is None:
+        yield
+        return
+    
+    def segment_print(*args, **kwargs):
+        line = " ".join(map(str, args))
+        match = _WHISPER_SEGMENT_LINE.match(line)
+        if match:
+            if callback is not None:
+                callback(match.group(1))
+            if echo:
+                print(*args, **kwargs)
+            return
+        match = _WHISPER_LANGUAGE_LINE.match(line)
+        if match and language_callback is not None:
+            language_codes = getattr(sys.modules.get('whisper.tokenizer'), 'TO_LANGUAGE_CODE', {})
+            language_callback(language_codes.get(match.group(1).lower()))
+        print(*args, **kwargs)
+    
+    # Echoed segment lines stand in for the bar, as with Whisper's own verbose output
+    module_tqdm = None if echo else getattr(transcribe_module, 'tqdm', None)
+    
+    def visible_tqdm(*args, **kwargs):
+        # Whisper passes disable=verbose is not False; draw the bar as with verbose=False
+        kwargs['disable'] = False
+        return module_tqdm.tqdm(*args, **kwargs)
+    
+    module_print = getattr(transcribe_module, 'print', _MISSING)
+    transcribe_module.print = segment_print
+    if module_tqdm is not None:
+        transcribe_module.tqdm = types.SimpleNamespace(tqdm=visible_tqdm)
+    try:
+        yield
+    finally:
+        if module_print is _MISSING:
+            del transcribe_module.print
+        else:
+            transcribe_module.print = module_print
+        if module_tqdm is not None:
+            transcribe_module.tqdm = module_tqdm
+
+
+class _StreamingTranslation:
+    """
+    Translate transcript text on a worker thread while Whisper is still decoding.
+    
+    Segments are queued as Whisper emits them and translated in chunks of up to
+    max_length characters, so when transcription ends only the last chunk is
+    left. Each language event starts a transcription attempt and drops text from
+    an earlier one (after an MPS->CPU retry). Nothing is translated until the
+    language is known, and nothing at all for Romanian audio.
+    """
+    
+    _DONE = object()
+    
+    def __init__(self, transcriber, max_length=4500, max_retries=3):
+        self._transcriber = transcriber
+        self._max_length = max_length
+        self._max_retries = max_retries
+        self._queue = queue.Queue()
+        self._language = None
+        self._translated = None
+        self._chunk_count = 0
+        self._thread = threading.Thread(target=self._run, name='transcribe-translator', daemon=True)
+        self._thread.start()
+    
+    def set_language(self, language):
+        """language_callback for transcribe_audio()."""
+        self._queue.put(('language', language))
+    
+    def add_segment(self, text):
+        """segment_callback for transcribe_audio()."""
+        self._queue.put(('segment', text.strip()))
+    
+    def close(self):
+        """Tell the worker no more segments are coming (does not wait for it)."""
+        self._queue.put((self._DONE, None))
+    
+    def translation(self, language):
+        """
+        Wait for the worker and return the streamed translation.
+        
+        Args:
+            language: Language of the finished transcription
+        
+        Returns:
+            Translated text, or None if streaming did not cover this transcript
+            (worker failed, or no/other language was seen); the caller then
+            translates the full text itself
+        """
+        self.close()
+        self._thread.join()
+        if self._translated is None or self._language != language:
+            return None
+        if self._transcriber.debug:
+            logger.debug("Translation streamed in %d chunk(s) during transcription", self._chunk_count)
+        return self._translated
+    
+    def _run(self):
+        language, method = None, None
+        pending, pending_length, translated = [], 0, []
+        try:
+            while True:
+                kind, value = self._queue.get()
+                if kind is self._DONE:
+                    break
+                if kind == 'language':
+                    language, pending, pending_length, translated = value, [], 0, []
+                    self._chunk_count = 0
+                    continue
+                if not value or language in (None, 'ro'):
+                    continue
+                if pending and pending_length + len(value) + 1 > self._max_length:
+                    method = method or self._transcriber._select_translation_method()
+                    translated.append(self._translate(pending, language, method))
+                    pending, pending_length = [], 0
+                pending.append(value)
+                pending_length += len(value) + 1
+            
+            if language in (None, 'ro'):
+                return
+            if pending:
+                method = method or self._transcriber._select_translation_method()
+                translated.append(self._translate(pending, language, method))
+            self._language = language
+            self._translated = " ".join(t for t in translated if t)
+        except Exception as e:
+            # The caller falls back to translating the full text, with its own error handling
+            logger.warning("Streaming translation stopped (%s); translating after transcription instead", e)
+            if self._transcriber.debug:
+                logger.debug("Full traceback:", exc_info=True)
+    
+    def _translate(self, texts, language, method):
+        """Translate one chunk of segment texts, raising if it could not be translated."""
+        transcriber = self._transcriber
+        self._chunk_count += 1
+        if method == "online":
+            transcriber.translation_status = "Online"
+            chunk = " ".join(texts)
+            result = transcriber._translate_with_retry(chunk, language, self._max_retries)
+            if result == chunk:
+                raise RuntimeError("online translation returned the original text")
+            return result
+        if method == "offline":
+            transcriber.translation_status = "Offline"
+            return " ".join(t for t in transcriber.offline_translator.translate_batch(texts, source_lang=language) if t)
+        raise RuntimeError("no translation method available")
+
+
 class AudioTranscriber:
     """Main class for audio transcription and translation."""
     
-    def __init__(self, model_name="base", device="auto", verbose=True, debug=False, translation_mode="auto"):
+    # Explicit NaN value indicators: NaN as whole word, invalid values with tensor, found invalid values
+    _NAN_RE = re.compile(r'\bnan\b|invalid values.*tensor|found invalid values', re.IGNORECASE)
+    # Constraint-related errors (IndependentConstraint / Categorical) that also say "found invalid"
+    _CONSTRAINT_RE = re.compile(r'^(?=.*(?:independentconstraint|categorical))(?=.*found invalid)',
+                                re.IGNORECASE | re.DOTALL)
+    
+    def __init__(self, model_name="base", device="auto", verbose=False, debug=False, translation_mode="auto",
+                 hwaccel=None, int8=False, precision="auto", translation_cache=True):
         """
         Initialize the transcriber.
         
         Args:
             model_name: Whisper model to use (tiny, base, small, medium, large)
             device: Device to run on (auto, cpu, mps, or cuda)
-            verbose: Enable verbose logging
+            verbose: Print Whisper's per-segment transcript lines to the console as they
+                are decoded (off by default: each line is a blocking print, and there
+                is no console under pythonw)
             debug: Enable detailed debug output
             translation_mode: Translation mode (auto, online, offline)
+            hwaccel: Optional ffmpeg hardware decoder for video input (auto, cuda, qsv, videotoolbox, vaapi)
+            int8: Quantize the Whisper model to int8 whenever it runs on CPU
+            precision: Decoding precision (auto, fp16, fp32); auto uses FP16 on CUDA and MPS
+            translation_cache: Keep translations in the on-disk cache under ~/.cache/transcribe_ro;
+                False caches them in memory for this process only
         """
         self.model_name = model_name
+        self.hwaccel = hwaccel
+        self.int8 = int8
+        self.precision = precision
         self.model = None
         self.verbose = verbose
         self.debug = debug
@@ -1223,7 +2601,14 @@ class AudioTranscriber:
         self.offline_translator = None
         self.internet_available = None  # Will be checked when needed
         self.translation_status = "Unknown"  # Track current translation status
-        
+        self._translation_cache = get_translation_cache(translation_cache)  # Shared, persisted across runs
+        self.translate_concurrency = 8  # Parallel online requests for uncached chunks
+        self._google_translators = threading.local()  # Per-thread GoogleTranslator per source language
+        self.background_writes = False  # Write output files on a worker thread (see flush())
+        self._writer = None
+        self._pending_write = None
+        self._audio_buffer = SampleBuffer()  # float32 samples reused across extracted video files
+
         # Initialize offline translator if available
         if self.offline_translator_available:
             try:
@@ -1232,13 +2617,10 @@ class AudioTranscriber:
                 logger.warning(f"Failed to initialize offline translator: {e}")
                 self.offline_translator_available = False
         
-        if not verbose:
-            logger.setLevel(logging.WARNING)
-        
         if self.debug:
-            logger.debug("="*80)
+            logger.debug(_RULE)
             logger.debug("DEBUG MODE ENABLED - Detailed output will be shown")
-            logger.debug("="*80)
+            logger.debug(_RULE)
             logger.debug(f"Model name: {model_name}")
             logger.debug(f"Requested device: {device}")
             logger.debug(f"Translator available: {self.translator_available}")
@@ -1251,9 +2633,9 @@ class AudioTranscriber:
         self.device_info = device_info
         
         # Display device information
-        logger.info("="*80)
+        logger.info(_RULE)
         logger.info(f"🖥️  DEVICE CONFIGURATION")
-        logger.info("="*80)
+        logger.info(_RULE)
         logger.info(f"Selected Device: {device_info['type']}")
         logger.info(f"Reason: {device_info['reason']}")
         
@@ -1281,66 +2663,46 @@ class AudioTranscriber:
             logger.info("⚠️  Running on CPU - Consider using --device mps on Apple Silicon")
             logger.info("   or --device cuda on NVIDIA GPU for faster transcription")
         
-        logger.info("="*80)
+        logger.info(_RULE)
         
         if self.debug:
-            logger.debug("="*80)
+            logger.debug(_RULE)
             logger.debug("DETAILED DEVICE INFO")
-            logger.debug("="*80)
+            logger.debug(_RULE)
             for key, value in device_info.items():
                 logger.debug(f"  {key}: {value}")
-            logger.debug("="*80)
+            logger.debug(_RULE)
         
         logger.info(f"Loading Whisper model '{model_name}' on {self.device}...")
         
         if self.debug:
             start_time = time.time()
-            logger.debug(f"Starting model load at {datetime.now().isoformat()}")
+            logger.debug("Starting model load at %s", _NOW)
         
         try:
-            # For MPS, we need to configure FP32 to avoid FP16 warning
-            if self.device == 'mps':
-                if self.debug:
-                    logger.debug("Configuring model for MPS with FP32...")
-                
-                # Load model on CPU first, then move to MPS
-                # This ensures proper FP32 configuration
-                self.model = whisper.load_model(model_name, device='cpu')
-                
-                if TORCH_AVAILABLE and torch is not None:
-                    # Convert model to FP32 explicitly
-                    self.model = self.model.float()
-                    # Move to MPS device
-                    self.model = self.model.to('mps')
-                    
-                    if self.debug:
-                        logger.debug("Model converted to FP32 and moved to MPS device")
-            else:
-                # For CUDA and CPU, use default loading
-                self.model = whisper.load_model(model_name, device=self.device)
+            self.model = load_whisper_model(model_name, self.device, debug=self.debug, int8=self.int8)
             
             if self.debug:
                 load_time = time.time() - start_time
                 logger.debug(f"Model loaded in {load_time:.2f} seconds")
                 logger.debug(f"Model type: {type(self.model)}")
-                if TORCH_AVAILABLE and torch is not None and hasattr(self.model, 'device'):
-                    logger.debug(f"Model device: {self.model.device}")
+                model_device = getattr(self.model, 'device', None)
+                if model_device is not None:
+                    logger.debug(f"Model device: {model_device}")
             
             logger.info("✓ Model loaded successfully!")
             
         except Exception as e:
             logger.error(f"Error loading model: {e}")
             if self.debug:
-                import traceback
-                logger.debug("Full traceback:")
-                logger.debug(traceback.format_exc())
+                logger.debug("Full traceback:", exc_info=True)
             
             # If MPS fails, try falling back to CPU
             if self.device == 'mps':
                 logger.warning("MPS loading failed. Falling back to CPU...")
                 try:
                     self.device = 'cpu'
-                    self.model = whisper.load_model(model_name, device='cpu')
+                    self.model = load_whisper_model(model_name, 'cpu', debug=self.debug, int8=self.int8)
                     logger.info("✓ Model loaded successfully on CPU!")
                 except Exception as e2:
                     logger.error(f"CPU fallback also failed: {e2}")
@@ -1348,6 +2710,48 @@ class AudioTranscriber:
             else:
                 sys.exit(1)
     
+    def flush(self):
+        """
+        Wait for the last background output write to finish.
+        
+        Raises:
+            Exception: Whatever the background write raised
+        """
+        pending, self._pending_write = self._pending_write, None
+        if pending is not None:
+            pending.result()
+    
+    def close(self):
+        """
+        Let any in-flight background write finish and shut down the writer thread.
+        
+        Write errors stay on the futures returned by process_audio (see flush()).
+        The transcriber remains usable; the next background write starts a new thread.
+        """
+        self._pending_write = None
+        if self._writer is not None:
+            self._writer.shutdown(wait=True)
+            self._writer = None
+    
+    @classmethod
+    def clear_model_cache(cls):
+        """Drop all Whisper models cached by load_whisper_model and release their memory."""
+        _whisper_models.clear()
+        gc.collect()
+        # Hand freed GPU blocks back to the driver so a reload doesn't double peak memory
+        if TORCH_AVAILABLE and torch is not None:
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+            mps = getattr(torch, 'mps', None)
+            if mps is not None and hasattr(mps, 'empty_cache') and torch.backends.mps.is_available():
+                mps.empty_cache()
+    
+    def _use_fp16(self):
+        """Whether Whisper should decode in FP16 on the current device (never on CPU)."""
+        if self.device == 'cpu':
+            return False
+        return self.precision != 'fp32'
+    
     def _detect_nan_error(self, error_message):
         """
         Detect if an error is related to NaN values in MPS.
@@ -1358,63 +2762,67 @@ class AudioTranscriber:
         Returns:
             True if NaN error is detected, False otherwise
         """
-        error_str = str(error_message).lower()
-        
-        # Check for explicit NaN value indicators (use word boundaries)
-        import re
-        nan_patterns = [
-            r'\bnan\b',  # NaN as whole word
-            r'invalid values.*tensor',  # invalid values with tensor
-            r'found invalid values',  # found invalid values
-        ]
-        has_nan_pattern = any(re.search(pattern, error_str) for pattern in nan_patterns)
-        
-        # Check for constraint-related errors with "found invalid"
-        constraint_with_invalid = (
-            'independentconstraint' in error_str or 
-            'categorical' in error_str
-        ) and 'found invalid' in error_str
+        error_str = str(error_message)
         
         # True if we have NaN pattern, or constraint error with "found invalid"
-        return has_nan_pattern or constraint_with_invalid
+        return bool(self._NAN_RE.search(error_str) or self._CONSTRAINT_RE.search(error_str))
     
-    def transcribe_audio(self, audio_path, task="transcribe", retry_on_cpu=True):
+    def transcribe_audio(self, audio_path, task="transcribe", retry_on_cpu=True, progress_callback=None,
+                         segment_callback=None, language_callback=None):
         """
         Transcribe audio file using Whisper with automatic CPU fallback on NaN errors.
         
         Args:
-            audio_path: Path to audio file
+            audio_path: Path to audio file, or a float32 16kHz mono numpy array
             task: 'transcribe' or 'translate' (translate translates to English in Whisper)
             retry_on_cpu: Whether to retry on CPU if MPS fails with NaN errors
+            progress_callback: Optional callable(current_sec, total_sec), called as
+                each decoding window completes (replaces the console progress bar)
+            segment_callback: Optional callable(text), called with each segment's
+                text as soon as Whisper decodes it (before the full result returns)
+            language_callback: Optional callable(language_code), called once per
+                attempt before its segments (again if retried on CPU)
         
         Returns:
             Dictionary containing transcription results
         """
-        if not os.path.exists(audio_path):
+        is_file = isinstance(audio_path, (str, os.PathLike))
+        if is_file and not os.path.exists(audio_path):
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
         
         if self.debug:
-            logger.debug("="*80)
+            logger.debug(_RULE)
             logger.debug("STEP: AUDIO TRANSCRIPTION")
-            logger.debug("="*80)
-            logger.debug(f"Audio file: {audio_path}")
-            logger.debug(f"File size: {os.path.getsize(audio_path) / (1024*1024):.2f} MB")
+            logger.debug(_RULE)
+            if is_file:
+                logger.debug(f"Audio file: {audio_path}")
+                logger.debug(f"File size: {os.path.getsize(audio_path) / (1024*1024):.2f} MB")
+            else:
+                logger.debug(f"Audio array: {len(audio_path)} samples ({len(audio_path) / 16000:.1f}s)")
             logger.debug(f"Task mode: {task}")
             logger.debug(f"Current device: {self.device}")
         
-        logger.info(f"Transcribing: {audio_path}")
+        logger.info(f"Transcribing: {audio_path if is_file else 'in-memory audio'}")
         logger.info("This may take a few minutes depending on the file size...")
         
         if self.debug:
             start_time = time.time()
-            logger.debug(f"Transcription started at {datetime.now().isoformat()}")
+            logger.debug("Transcription started at %s", _NOW)
         
         try:
-            result = self.model.transcribe(
-                audio_path,
-                task=task,
-                verbose=False
-            )
+            # No gradients are ever needed here; inference_mode skips autograd bookkeeping
+            no_grad = torch.inference_mode() if torch is not None else contextlib.nullcontext()
+            if language_callback is not None and not getattr(self.model, 'is_multilingual', True):
+                # English-only models skip detection (and its printed line)
+                language_callback('en')
+            with no_grad, _whisper_progress(progress_callback), \
+                    _whisper_segment_stream(segment_callback, language_callback, echo=self.verbose):
+                result = self.model.transcribe(
+                    audio_path,
+                    task=task,
+                    verbose=self.verbose or segment_callback is not None or language_callback is not None,
+                    fp16=self._use_fp16()
+                )
             
             if self.debug:
                 transcribe_time = time.time() - start_time
@@ -1431,19 +2839,17 @@ class AudioTranscriber:
             logger.error(f"Error during transcription: {error_msg}")
             
             if self.debug:
-                import traceback
-                logger.debug("Full traceback:")
-                logger.debug(traceback.format_exc())
+                logger.debug("Full traceback:", exc_info=True)
             
             # Check if this is a NaN error on MPS and we can retry on CPU
             if self.device == 'mps' and retry_on_cpu and self._detect_nan_error(error_msg):
-                logger.warning("="*80)
+                logger.warning(_RULE)
                 logger.warning("⚠️  MPS NaN ERROR DETECTED")
-                logger.warning("="*80)
+                logger.warning(_RULE)
                 logger.warning("This is a known issue with Whisper on Apple Silicon GPUs.")
                 logger.warning("The model encountered numerical instability (NaN values).")
                 logger.warning("Automatically falling back to CPU for stable transcription...")
-                logger.warning("="*80)
+                logger.warning(_RULE)
                 
                 if self.debug:
                     logger.debug("Attempting CPU fallback...")
@@ -1452,7 +2858,7 @@ class AudioTranscriber:
                 # Reload model on CPU
                 try:
                     logger.info("Loading model on CPU device...")
-                    self.model = whisper.load_model(self.model_name, device='cpu')
+                    self.model = load_whisper_model(self.model_name, 'cpu', debug=self.debug, int8=self.int8)
                     self.device = 'cpu'
                     logger.info("✓ Model successfully reloaded on CPU!")
                     logger.info("Retrying transcription on CPU...")
@@ -1462,36 +2868,37 @@ class AudioTranscriber:
                         retry_start_time = time.time()
                     
                     # Retry transcription on CPU (without further retry to avoid infinite loop)
-                    result = self.transcribe_audio(audio_path, task=task, retry_on_cpu=False)
+                    result = self.transcribe_audio(audio_path, task=task, retry_on_cpu=False,
+                                                   progress_callback=progress_callback,
+                                                   segment_callback=segment_callback,
+                                                   language_callback=language_callback)
                     
                     if self.debug:
                         retry_time = time.time() - retry_start_time
                         logger.debug(f"CPU retry completed in {retry_time:.2f} seconds")
                     
-                    logger.info("="*80)
+                    logger.info(_RULE)
                     logger.info("✓ CPU FALLBACK SUCCESSFUL!")
-                    logger.info("="*80)
+                    logger.info(_RULE)
                     logger.info("Transcription completed using CPU after MPS encountered errors.")
                     logger.info("Note: Future transcriptions in this session will use CPU.")
-                    logger.info("="*80)
+                    logger.info(_RULE)
                     
                     return result
                     
                 except Exception as cpu_error:
-                    logger.error("="*80)
+                    logger.error(_RULE)
                     logger.error("❌ CPU FALLBACK FAILED")
-                    logger.error("="*80)
+                    logger.error(_RULE)
                     logger.error(f"CPU fallback also failed: {cpu_error}")
                     if self.debug:
-                        import traceback
-                        logger.debug("CPU fallback traceback:")
-                        logger.debug(traceback.format_exc())
+                        logger.debug("CPU fallback traceback:", exc_info=True)
                     raise Exception(f"Transcription failed on both MPS and CPU. Last error: {cpu_error}")
             
             # For other errors or if CPU fallback is disabled, raise the original error
             raise Exception(f"Error during transcription: {e}")
     
-    def translate_to_romanian(self, text, source_lang="auto", max_retries=3):
+    def translate_to_romanian(self, text, source_lang="auto", max_retries=3, segments=None):
         """
         Translate text to Romanian using online or offline translation with automatic fallback.
         
@@ -1499,30 +2906,32 @@ class AudioTranscriber:
             text: Text to translate
             source_lang: Source language code (default: auto-detect)
             max_retries: Maximum number of retry attempts for online translation
+            segments: Optional Whisper segments that make up text; offline translation
+                      batches these instead of feeding the model the whole transcript
         
         Returns:
             Translated text
         """
         if self.debug:
-            logger.debug("="*80)
+            logger.debug(_RULE)
             logger.debug("STEP: TRANSLATION TO ROMANIAN")
-            logger.debug("="*80)
-            logger.debug(f"Text length: {len(text)} characters")
-            logger.debug(f"Source language: {source_lang}")
-            logger.debug(f"Translation mode: {self.translation_mode}")
-            logger.debug(f"Max retries: {max_retries}")
-            logger.debug(f"Online translator available: {self.online_translator_available}")
-            logger.debug(f"Offline translator available: {self.offline_translator_available}")
+            logger.debug(_RULE)
+            logger.debug("Text length: %s characters", len(text))
+            logger.debug("Source language: %s", source_lang)
+            logger.debug("Translation mode: %s", self.translation_mode)
+            logger.debug("Max retries: %s", max_retries)
+            logger.debug("Online translator available: %s", self.online_translator_available)
+            logger.debug("Offline translator available: %s", self.offline_translator_available)
         
         if not self.translator_available:
-            logger.error("="*80)
+            logger.error(_RULE)
             logger.error("❌ NO TRANSLATION AVAILABLE")
-            logger.error("="*80)
+            logger.error(_RULE)
             logger.error("Neither online nor offline translation is available.")
             logger.error("Install dependencies:")
             logger.error("  Online:  pip install deep-translator")
             logger.error("  Offline: pip install transformers sentencepiece")
-            logger.error("="*80)
+            logger.error(_RULE)
             self.translation_status = "Failed - No translator available"
             if self.debug:
                 logger.debug("REASON: No translation modules found")
@@ -1531,73 +2940,139 @@ class AudioTranscriber:
         if not text or not text.strip():
             logger.warning("Empty text provided for translation")
             if self.debug:
-                logger.debug(f"Text is empty or whitespace only: '{text}'")
+                logger.debug("Text is empty or whitespace only: '%s'", text)
+            return text
+        
+        if _LANG_INDEPENDENT.fullmatch(text):
+            if self.debug:
+                logger.debug("Text has no words (digits/punctuation only), returning it unchanged")
             return text
         
         if self.debug:
-            logger.debug(f"Text sample (first 200 chars): {text[:200]!r}")
+            logger.debug("Text sample (first 200 chars): %r", text[:200])
+        
+        method = self._select_translation_method()
+        if method is None:
+            return text
         
-        # Determine which translation method to use
-        use_online = False
-        use_offline = False
+        # Execute translation
+        if method == "online":
+            return self._translate_online(text, source_lang, max_retries, segments=segments)
+        else:
+            return self._translate_offline(text, source_lang, segments=segments)
+    
+    def _select_translation_method(self):
+        """
+        Pick the translation backend for the current mode and connectivity.
         
+        Returns:
+            "online", "offline", or None if no usable method is available
+            (translation_status is updated with the reason)
+        """
         if self.translation_mode == "online":
             # Force online translation
             if not self.online_translator_available:
                 logger.error("Online translation requested but deep-translator not available!")
                 logger.error("Install with: pip install deep-translator")
                 self.translation_status = "Failed - Online translator not available"
-                return text
-            use_online = True
+                return None
             if self.debug:
                 logger.debug("DECISION: Using ONLINE translation (forced by mode)")
+            return "online"
         
-        elif self.translation_mode == "offline":
+        if self.translation_mode == "offline":
             # Force offline translation
             if not self.offline_translator_available:
                 logger.error("Offline translation requested but transformers not available!")
                 logger.error("Install with: pip install transformers sentencepiece")
                 self.translation_status = "Failed - Offline translator not available"
-                return text
-            use_offline = True
+                return None
             if self.debug:
                 logger.debug("DECISION: Using OFFLINE translation (forced by mode)")
+            return "offline"
         
-        else:  # auto mode
-            # Check internet connectivity first
-            if self.internet_available is None:
-                logger.info("Checking internet connectivity...")
-                self.internet_available = check_internet_connectivity()
-                if self.debug:
-                    logger.debug(f"Internet connectivity: {self.internet_available}")
-            
-            if self.internet_available and self.online_translator_available:
-                use_online = True
-                if self.debug:
-                    logger.debug("DECISION: Using ONLINE translation (internet available)")
-            elif self.offline_translator_available:
-                use_offline = True
-                logger.warning("No internet connection detected. Using OFFLINE translation.")
-                if self.debug:
-                    logger.debug("DECISION: Using OFFLINE translation (no internet)")
-            elif self.online_translator_available:
-                # Try online anyway even without confirmed internet
-                use_online = True
-                logger.warning("Internet status unknown. Attempting ONLINE translation...")
-                if self.debug:
-                    logger.debug("DECISION: Attempting ONLINE translation (internet check inconclusive)")
-            else:
-                logger.error("No translation method available!")
-                self.translation_status = "Failed - No method available"
-                return text
+        # auto mode: check internet connectivity first
+        if self.internet_available is None:
+            logger.info("Checking internet connectivity...")
+            self.internet_available = check_internet_connectivity()
+            if self.debug:
+                logger.debug("Internet connectivity: %s", self.internet_available)
         
-        # Execute translation
-        if use_online:
-            return self._translate_online(text, source_lang, max_retries)
-        else:
-            return self._translate_offline(text, source_lang)
+        if self.internet_available and self.online_translator_available:
+            if self.debug:
+                logger.debug("DECISION: Using ONLINE translation (internet available)")
+            return "online"
+        if self.offline_translator_available:
+            logger.warning("No internet connection detected. Using OFFLINE translation.")
+            if self.debug:
+                logger.debug("DECISION: Using OFFLINE translation (no internet)")
+            return "offline"
+        if self.online_translator_available:
+            # Try online anyway even without confirmed internet
+            logger.warning("Internet status unknown. Attempting ONLINE translation...")
+            if self.debug:
+                logger.debug("DECISION: Attempting ONLINE translation (internet check inconclusive)")
+            return "online"
+        
+        logger.error("No translation method available!")
+        self.translation_status = "Failed - No method available"
+        return None
+    
+    def translate_to_romanian_batch(self, texts, source_lang="auto", max_retries=3):
+        """
+        Translate many short texts (e.g. transcript segments) to Romanian.
+        
+        Online, each distinct uncached text is its own request (several run in parallel),
+        so a text that cannot be translated keeps its original without affecting the rest;
+        repeats and cached texts cost no request. Offline, they are translated in batched
+        MarianMT generate() calls. Empty and digit/punctuation-only texts are passed
+        through unchanged.
+        
+        Args:
+            texts: List of strings to translate
+            source_lang: Source language code (default: auto-detect)
+            max_retries: Maximum number of retry attempts for online translation
+        
+        Returns:
+            List of translated strings, in input order (originals where translation failed).
+            Failures are logged rather than raised, so callers need no fallback of their own.
+        """
+        results = list(texts)
+        pending = [i for i, t in enumerate(texts) if t and t.strip() and not _LANG_INDEPENDENT.fullmatch(t)]
+        if not pending or not self.translator_available:
+            return results
+        
+        method = self._select_translation_method()
+        if method is None:
+            return results
+        
+        pending_texts = [texts[i] for i in pending]
+        translated = None
+        
+        if method == "online":
+            self.translation_status = "Online"
+            try:
+                translated = self._translate_chunks_online(pending_texts, source_lang, max_retries)
+            except Exception as e:
+                if self.translation_mode == "auto" and self.offline_translator_available \
+                        and _NET_ERR_RE.search(str(e)):
+                    logger.warning(f"Online segment translation failed ({e}); falling back to offline")
+                    method = "offline"
+                else:
+                    logger.error(f"Segment translation failed: {e}")
+                    self.translation_status = "Failed - Translation error"
+                    return results
+        
+        if method == "offline":
+            self.translation_status = "Offline"
+            offline_lang = "en" if source_lang == "auto" else source_lang
+            translated = self.offline_translator.translate_batch(pending_texts, source_lang=offline_lang)
+        
+        for i, result in zip(pending, translated):
+            results[i] = result
+        return results
     
-    def _translate_online(self, text, source_lang, max_retries):
+    def _translate_online(self, text, source_lang, max_retries, segments=None):
         """
         Translate using online service (deep-translator).
         
@@ -1605,14 +3080,15 @@ class AudioTranscriber:
             text: Text to translate
             source_lang: Source language code
             max_retries: Maximum retry attempts
+            segments: Optional Whisper segments, passed on if falling back to offline
         
         Returns:
             Translated text
         """
         if self.debug:
-            logger.debug("="*80)
+            logger.debug(_RULE)
             logger.debug("ONLINE TRANSLATION METHOD")
-            logger.debug("="*80)
+            logger.debug(_RULE)
         
         logger.info("🌐 Using ONLINE translation (Google Translate)")
         self.translation_status = "Online"
@@ -1623,23 +3099,18 @@ class AudioTranscriber:
         try:
             if len(text) <= max_length:
                 if self.debug:
-                    logger.debug(f"Text length ({len(text)}) is within limit ({max_length})")
+                    logger.debug("Text length (%s) is within limit (%s)", len(text), max_length)
                     logger.debug("Using single-chunk translation")
                 return self._translate_with_retry(text, source_lang, max_retries)
             else:
                 if self.debug:
-                    logger.debug(f"Text length ({len(text)}) exceeds limit ({max_length})")
+                    logger.debug("Text length (%s) exceeds limit (%s)", len(text), max_length)
                     logger.debug("Using multi-chunk translation")
                 logger.info(f"Text length ({len(text)} chars) exceeds limit. Splitting into chunks...")
                 return self._translate_long_text(text, source_lang, max_retries)
         except Exception as e:
-            error_msg = str(e).lower()
-            
             # Check if it's a network error
-            is_network_error = any(keyword in error_msg for keyword in [
-                'connection', 'network', 'timeout', 'dns', 'resolve', 
-                'unreachable', 'nodename', 'servname', 'errno 8'
-            ])
+            is_network_error = _NET_ERR_RE.search(str(e)) is not None
             
             if is_network_error:
                 logger.error(f"Network error during online translation: {e}")
@@ -1647,17 +3118,17 @@ class AudioTranscriber:
                 
                 # Try offline fallback if in auto mode and offline is available
                 if self.translation_mode == "auto" and self.offline_translator_available:
-                    logger.warning("="*80)
+                    logger.warning(_RULE)
                     logger.warning("⚠️  AUTOMATIC FALLBACK TO OFFLINE TRANSLATION")
-                    logger.warning("="*80)
+                    logger.warning(_RULE)
                     logger.warning("Online translation failed due to network issues.")
                     logger.warning("Falling back to offline translation...")
-                    logger.warning("="*80)
+                    logger.warning(_RULE)
                     
                     if self.debug:
                         logger.debug("Attempting offline translation as fallback...")
                     
-                    return self._translate_offline(text, source_lang)
+                    return self._translate_offline(text, source_lang, segments=segments)
                 else:
                     logger.error("No fallback available. Returning original text.")
                     self.translation_status = "Failed - Network error"
@@ -1667,26 +3138,27 @@ class AudioTranscriber:
                 logger.error("Returning original text")
                 self.translation_status = "Failed - Translation error"
                 if self.debug:
-                    import traceback
-                    logger.debug("Full traceback:")
-                    logger.debug(traceback.format_exc())
+                    logger.debug("Full traceback:", exc_info=True)
                 return text
     
-    def _translate_offline(self, text, source_lang):
+    def _translate_offline(self, text, source_lang, segments=None):
         """
         Translate using offline models (MarianMT).
         
         Args:
             text: Text to translate
             source_lang: Source language code
+            segments: Optional Whisper segments making up text. When given, each
+                      segment is translated in batched generate() calls, which keeps
+                      every input well under MarianMT's 512-token limit
         
         Returns:
             Translated text
         """
         if self.debug:
-            logger.debug("="*80)
+            logger.debug(_RULE)
             logger.debug("OFFLINE TRANSLATION METHOD")
-            logger.debug("="*80)
+            logger.debug(_RULE)
         
         logger.info("💾 Using OFFLINE translation (MarianMT)")
         logger.info("Note: First time may take longer as model downloads...")
@@ -1702,9 +3174,22 @@ class AudioTranscriber:
                 if self.debug:
                     logger.debug("Auto-detection not available, using 'en' as source")
             
-            translated = self.offline_translator.translate(text, source_lang=source_lang, target_lang='ro')
+            cache_key = TranslationCache.make_key(text, source_lang, backend='offline')
+            translated = self._translation_cache.get(cache_key)
+            cached = translated is not None
+            if translated is None and segments:
+                segment_texts = [segment['text'].strip() for segment in segments]
+                translated = " ".join(
+                    t for t in self.offline_translator.translate_batch(segment_texts, source_lang=source_lang) if t
+                )
+            elif translated is None:
+                translated = self.offline_translator.translate(text, source_lang=source_lang, target_lang='ro')
+            elif self.debug:
+                logger.debug("Offline translation served from cache")
             
             if translated and translated != text:
+                if not cached:
+                    self._translation_cache.put(cache_key, translated)
                 logger.info(f"✓ Offline translation successful! ({len(text)} -> {len(translated)} chars)")
                 return translated
             else:
@@ -1715,11 +3200,34 @@ class AudioTranscriber:
             logger.error(f"Offline translation failed: {e}")
             self.translation_status = "Failed - Offline error"
             if self.debug:
-                import traceback
-                logger.debug("Full traceback:")
-                logger.debug(traceback.format_exc())
+                logger.debug("Full traceback:", exc_info=True)
             return text
     
+    def _google_translator(self, source_lang):
+        """
+        Return a reusable GoogleTranslator for source_lang -> Romanian.
+        
+        Instances are cached per thread, since GoogleTranslator keeps the text of
+        the current request on the instance.
+        
+        Args:
+            source_lang: Source language code ('auto' and 'en' both use auto-detection)
+        
+        Returns:
+            GoogleTranslator instance
+        """
+        translators = getattr(self._google_translators, 'by_source', None)
+        if translators is None:
+            translators = self._google_translators.by_source = {}
+        
+        source = 'auto' if source_lang == "auto" or source_lang == "en" else source_lang
+        translator = translators.get(source)
+        if translator is None:
+            if self.debug:
+                logger.debug("Creating GoogleTranslator(source='%s', target='ro')", source)
+            translator = translators[source] = GoogleTranslator(source=source, target='ro')
+        return translator
+    
     def _translate_with_retry(self, text, source_lang, max_retries):
         """
         Translate text with retry logic.
@@ -1733,57 +3241,58 @@ class AudioTranscriber:
             Translated text
         """
         if self.debug:
-            logger.debug(f"_translate_with_retry called with {len(text)} chars")
+            logger.debug("_translate_with_retry called with %s chars", len(text))
+        
+        cache_key = TranslationCache.make_key(text, source_lang)
+        hit = self._translation_cache.get(cache_key)
+        if hit is not None:
+            if self.debug:
+                logger.debug("Translation served from cache")
+            return hit
             
         for attempt in range(max_retries):
             try:
                 logger.info(f"Translation attempt {attempt + 1}/{max_retries}...")
                 
                 if self.debug:
-                    logger.debug(f"Attempt {attempt + 1} started at {datetime.now().isoformat()}")
-                    logger.debug(f"Source language: {source_lang}")
+                    logger.debug("Attempt %d started at %s", attempt + 1, _NOW)
+                    logger.debug("Source language: %s", source_lang)
                     attempt_start = time.time()
                 
-                # Create translator instance for this request
-                if source_lang == "auto" or source_lang == "en":
-                    if self.debug:
-                        logger.debug("Creating GoogleTranslator(source='auto', target='ro')")
-                    translator = GoogleTranslator(source='auto', target='ro')
-                else:
-                    if self.debug:
-                        logger.debug(f"Creating GoogleTranslator(source='{source_lang}', target='ro')")
-                    translator = GoogleTranslator(source=source_lang, target='ro')
+                translator = self._google_translator(source_lang)
                 
                 if self.debug:
-                    logger.debug(f"Calling translator.translate() with {len(text)} chars...")
+                    logger.debug("Calling translator.translate() with %s chars...", len(text))
                 
-                translated = translator.translate(text)
+                with _google_session():
+                    translated = translator.translate(text)
                 
                 if self.debug:
                     attempt_time = time.time() - attempt_start
-                    logger.debug(f"Translation call completed in {attempt_time:.2f} seconds")
-                    logger.debug(f"Result type: {type(translated)}")
-                    logger.debug(f"Result length: {len(translated) if translated else 0}")
+                    logger.debug("Translation call completed in %.2f seconds", attempt_time)
+                    logger.debug("Result type: %s", type(translated))
+                    logger.debug("Result length: %s", len(translated) if translated else 0)
                 
                 if translated and translated.strip():
                     logger.info(f"✓ Translation successful! ({len(text)} -> {len(translated)} chars)")
                     
                     if self.debug:
-                        logger.debug(f"Translation sample (first 200 chars): {translated[:200]!r}")
-                        logger.debug(f"Original != Translated: {text != translated}")
+                        logger.debug("Translation sample (first 200 chars): %r", translated[:200])
+                        logger.debug("Original != Translated: %s", text != translated)
                     
+                    self._translation_cache.put(cache_key, translated)
                     return translated
                 else:
                     logger.warning("Translation returned empty result")
                     
                     if self.debug:
-                        logger.debug(f"Empty result: translated='{translated}'")
+                        logger.debug("Empty result: translated='%s'", translated)
                     
                     if attempt < max_retries - 1:
-                        wait_time = 1 * (attempt + 1)
+                        wait_time = _retry_delay(attempt)
                         if self.debug:
-                            logger.debug(f"Waiting {wait_time}s before retry")
-                        time.sleep(wait_time)  # Exponential backoff
+                            logger.debug("Waiting %.1fs before retry", wait_time)
+                        time.sleep(wait_time)
                         continue
                     return text
                     
@@ -1791,18 +3300,20 @@ class AudioTranscriber:
                 logger.warning(f"Translation attempt {attempt + 1} failed: {str(e)}")
                 
                 if self.debug:
-                    logger.debug(f"Exception type: {type(e).__name__}")
-                    logger.debug(f"Exception details: {str(e)}")
-                    import traceback
-                    logger.debug("Full traceback:")
-                    logger.debug(traceback.format_exc())
+                    logger.debug("Exception type: %s", type(e).__name__)
+                    logger.debug("Exception details: %s", e)
+                    logger.debug("Full traceback:", exc_info=True)
+                
+                if _is_deterministic_error(e):
+                    logger.error("Translation error will not go away on retry, giving up")
+                    raise
                 
                 if attempt < max_retries - 1:
-                    wait_time = 2 * (attempt + 1)  # Exponential backoff: 2s, 4s, 6s
-                    logger.info(f"Retrying in {wait_time} seconds...")
+                    wait_time = _retry_delay(attempt)
+                    logger.info(f"Retrying in {wait_time:.1f} seconds...")
                     
                     if self.debug:
-                        logger.debug(f"Sleeping for {wait_time} seconds before retry {attempt + 2}")
+                        logger.debug("Sleeping for %.1f seconds before retry %s", wait_time, attempt + 2)
                     
                     time.sleep(wait_time)
                 else:
@@ -1813,55 +3324,164 @@ class AudioTranscriber:
         
         return text
     
+    def _translate_chunk_isolated(self, chunk, source_lang, max_retries):
+        """
+        Translate one chunk, keeping its original text if it alone cannot be translated.
+        
+        Errors that would hit every chunk the same way (network down, bad language
+        code) are raised, so callers can fall back or give up as a whole.
+        
+        Args:
+            chunk: Text chunk to translate
+            source_lang: Source language code
+            max_retries: Maximum number of retry attempts
+        
+        Returns:
+            Translated chunk, or the original chunk if its request kept failing
+        """
+        try:
+            return self._translate_with_retry(chunk, source_lang, max_retries)
+        except Exception as e:
+            if _NET_ERR_RE.search(str(e)) or _is_deterministic_error(e):
+                raise
+            logger.warning(f"Keeping the original text of a chunk that could not be translated: {e}")
+            return chunk
+    
+    def _translate_concurrently(self, chunks, source_lang, max_retries):
+        """
+        Translate chunks with up to translate_concurrency parallel requests, preserving order.
+        
+        Each chunk is its own request (see _translate_chunk_isolated). Near-limit
+        chunks halve the worker count to stay clear of request timeouts.
+        
+        Args:
+            chunks: List of text chunks to translate
+            source_lang: Source language code
+            max_retries: Maximum number of retry attempts per chunk
+        
+        Returns:
+            List of translated chunks, in the same order as the input
+        """
+        workers = self.translate_concurrency
+        if any(len(c) > 4000 for c in chunks):
+            workers //= 2
+        workers = max(1, min(workers, len(chunks)))
+        
+        if self.debug:
+            logger.debug("Translating %s chunks with %s worker(s)", len(chunks), workers)
+        
+        if workers == 1:
+            return [self._translate_chunk_isolated(chunk, source_lang, max_retries) for chunk in chunks]
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='transcribe-translate') as executor:
+            futures = [executor.submit(self._translate_chunk_isolated, chunk, source_lang, max_retries)
+                       for chunk in chunks]
+            try:
+                return [future.result() for future in futures]
+            except BaseException:
+                # The error would hit the chunks still queued as well; don't start them
+                for future in futures:
+                    future.cancel()
+                raise
+    
+    def _translate_chunks_online(self, chunks, source_lang, max_retries, passthrough=None):
+        """
+        Translate a list of chunks online, each distinct chunk at most once.
+        
+        Cached chunks are served from the translation cache; the rest go out one
+        request per chunk, in parallel, so a chunk that fails keeps its original text
+        without costing the others. Every chunk, repeats included, is mapped back through
+        the results.
+        
+        Args:
+            chunks: List of text chunks, each within the request size limit
+            source_lang: Source language code
+            max_retries: Maximum number of retry attempts
+            passthrough: Optional set of chunks to return untranslated
+        
+        Returns:
+            List of translated chunks, in the same order as the input
+        """
+        unique = list(dict.fromkeys(chunks))
+        cache = self._translation_cache
+        done = {chunk: chunk for chunk in passthrough or ()}
+        for chunk in unique:
+            if chunk not in done:
+                hit = cache.get(TranslationCache.make_key(chunk, source_lang))
+                if hit is not None:
+                    done[chunk] = hit
+        misses = [c for c in unique if c not in done]
+        
+        logger.info(f"Translating {len(misses)} of {len(unique)} distinct chunks "
+                    f"({len(chunks)} total, {len(unique) - len(misses)} cached or passed through)...")
+        
+        if misses:
+            # _translate_with_retry caches each translated chunk itself; chunks kept in their
+            # original text are not cached, so they get retried next time
+            translated = self._translate_concurrently(misses, source_lang, max_retries)
+            done.update(zip(misses, translated))
+        
+        return [done[c] for c in chunks]
+    
     def _translate_long_text(self, text, source_lang, max_retries):
         """
         Translate long text by splitting into manageable chunks.
         
+        Chunks already translated are served from the translation cache; the
+        remaining ones are requested in parallel, one request per chunk.
+        
         Args:
             text: Long text to translate
             source_lang: Source language code
-            max_retries: Maximum number of retry attempts per chunk
+            max_retries: Maximum number of retry attempts
         
         Returns:
             Translated text
         """
         max_length = 4500
         
-        # Split by sentences first
-        sentences = text.replace('! ', '!|').replace('? ', '?|').replace('. ', '.|').split('|')
-        
-        translated_chunks = []
-        current_chunk = ""
-        chunk_count = 0
-        
-        for i, sentence in enumerate(sentences):
-            sentence = sentence.strip()
-            if not sentence:
+        # Split by sentences first; stripping the ends means no sentence carries stray whitespace
+        sentences = _SENT_SPLIT.split(text.strip())
+        
+        # Pass 1: pack sentences into chunks below the request size limit
+        # Sentences are collected in a list with a running length (each counted with its
+        # joining space) rather than grown by string concatenation
+        chunks = []
+        buf = []
+        cur_len = 0
+        
+        passthrough = set()
+        
+        for sentence in sentences:
+            # Sentences with no words (numbers, timestamps, punctuation) stay as-is and
+            # become their own chunk, so they never reach the translation service
+            if _LANG_INDEPENDENT.fullmatch(sentence):
+                if buf:
+                    chunks.append(" ".join(buf))
+                    buf = []
+                    cur_len = 0
+                chunks.append(sentence)
+                passthrough.add(sentence)
                 continue
             
+            sentence_len = len(sentence) + 1
             # Check if adding this sentence would exceed the limit
-            if len(current_chunk) + len(sentence) + 1 < max_length:
-                current_chunk += sentence + " "
+            if cur_len + sentence_len < max_length:
+                buf.append(sentence)
+                cur_len += sentence_len
             else:
-                # Translate current chunk
-                if current_chunk:
-                    chunk_count += 1
-                    logger.info(f"Translating chunk {chunk_count} ({len(current_chunk)} chars)...")
-                    translated = self._translate_with_retry(current_chunk.strip(), source_lang, max_retries)
-                    translated_chunks.append(translated)
-                    time.sleep(0.5)  # Small delay between chunks
-                
-                current_chunk = sentence + " "
-        
-        # Translate remaining chunk
-        if current_chunk:
-            chunk_count += 1
-            logger.info(f"Translating final chunk {chunk_count} ({len(current_chunk)} chars)...")
-            translated = self._translate_with_retry(current_chunk.strip(), source_lang, max_retries)
-            translated_chunks.append(translated)
-        
-        result = " ".join(translated_chunks)
-        logger.info(f"✓ All {chunk_count} chunks translated successfully!")
+                if buf:
+                    chunks.append(" ".join(buf))
+                buf = [sentence]
+                cur_len = sentence_len
+        
+        if buf:
+            chunks.append(" ".join(buf))
+        
+        # Pass 2: translate each distinct chunk once, skipping ones we have seen before
+        translated = self._translate_chunks_online(chunks, source_lang, max_retries, passthrough)
+        result = " ".join(translated)
+        logger.info(f"✓ All {len(chunks)} chunks translated successfully!")
         return result
     
     def process_audio(
@@ -1913,14 +3533,17 @@ class AudioTranscriber:
             logger.info(msg)
         
         timing_print(f"\n{'='*60}")
-        timing_print(f"⏱️  PROCESSING: {Path(audio_path).name}")
+        # Parsed once; audio_path itself may later be swapped for extracted audio
+        input_path = Path(audio_path)
+        
+        timing_print(f"⏱️  PROCESSING: {input_path.name}")
         timing_print(f"{'='*60}")
         timing_print(f"{elapsed_str()} 🚀 Starting processing...")
         
         if self.debug:
-            logger.debug("="*80)
+            logger.debug(_RULE)
             logger.debug("STEP: PROCESS AUDIO/VIDEO")
-            logger.debug("="*80)
+            logger.debug(_RULE)
             logger.debug(f"Input path: {audio_path}")
             logger.debug(f"Output path: {output_path}")
             logger.debug(f"Translate: {translate}")
@@ -1935,14 +3558,22 @@ class AudioTranscriber:
             timing_print(f"{elapsed_str()} 🎬 Video file detected")
             timing_print(f"{elapsed_str()} 📤 Extracting audio from video...")
             extraction_start = time.time()
+            # Diarization reads audio from disk, so only stream straight into memory without it
+            needs_audio_file = bool(speaker_names and len(speaker_names) == 2)
             try:
-                audio_path, is_temp = extract_audio_from_video(audio_path, debug=self.debug)
+                audio_path, is_temp = extract_audio_from_video(
+                    audio_path,
+                    debug=self.debug,
+                    hwaccel=self.hwaccel,
+                    return_array=not needs_audio_file,
+                    buffer=self._audio_buffer
+                )
                 if is_temp:
                     temp_audio_file = audio_path  # Track temp file for cleanup
                 timing_data['audio_extraction'] = time.time() - extraction_start
                 timing_print(f"{elapsed_str()} ✅ Audio extracted ({timing_data['audio_extraction']:.1f}s)")
                 if self.debug:
-                    logger.debug(f"Extracted audio to: {audio_path}")
+                    logger.debug(f"Extracted audio to: {audio_path if is_temp else 'in-memory array'}")
             except RuntimeError as e:
                 logger.error(f"Failed to extract audio from video: {e}")
                 return {
@@ -1954,11 +3585,74 @@ class AudioTranscriber:
             # Transcribe audio
             timing_print(f"{elapsed_str()} 🎤 Starting transcription (Whisper {self.model_name})...")
             transcribe_start = time.time()
-            result = self.transcribe_audio(audio_path)
+            # Translate segments as Whisper emits them, so translation overlaps transcription
+            streamed = _StreamingTranslation(self) if translate and self.translator_available else None
+            try:
+                result = self.transcribe_audio(
+                    audio_path,
+                    segment_callback=streamed.add_segment if streamed else None,
+                    language_callback=streamed.set_language if streamed else None
+                )
+            except BaseException:
+                if streamed:
+                    streamed.close()
+                raise
             timing_data['transcription'] = time.time() - transcribe_start
             timing_print(f"{elapsed_str()} ✅ Transcription complete ({timing_data['transcription']:.1f}s)")
+            
+            # Extract information
+            detected_language = result.get('language', 'unknown')
+            transcribed_text = result.get('text', '').strip()
+            segments = result.get('segments', [])
+            
+            run_diarization = bool(speaker_names and len(speaker_names) == 2)
+            # Decided once: Romanian audio (or --no-translate) never touches the translation path
+            needs_translation = translate and detected_language != 'ro'
+            
+            # Whatever streaming left (the last chunk, or the whole text if streaming didn't
+            # cover it) runs in the background while diarization keeps the main thread busy.
+            # Without diarization there is nothing to overlap and it runs inline below.
+            translation_future = None
+            if streamed and not needs_translation:
+                streamed.close()
+            if needs_translation:
+                timing_print(f"{elapsed_str()} 🌍 Finishing translation to Romanian...")
+                
+                def timed_translation():
+                    translate_start = time.time()
+                    try:
+                        translated = streamed.translation(detected_language) if streamed else None
+                        if translated is None:
+                            translated = self.translate_to_romanian(
+                                transcribed_text, source_lang=detected_language, segments=segments
+                            )
+                        return translated
+                    finally:
+                        timing_data['translation'] = time.time() - translate_start
+                
+                if run_diarization:
+                    translation_executor = ThreadPoolExecutor(max_workers=1)
+                    translation_future = translation_executor.submit(timed_translation)
+                    translation_executor.shutdown(wait=False)
+            
+            # Perform speaker diarization if requested
+            speaker_timeline = None
+            if run_diarization:
+                timing_print(f"{elapsed_str()} 👥 Starting speaker diarization...")
+                diarization_start = time.time()
+                speaker_timeline, _ = perform_speaker_diarization(
+                    audio_path, 
+                    speaker_names=speaker_names, 
+                    debug=self.debug
+                )
+                timing_data['speaker_diarization'] = time.time() - diarization_start
+                timing_print(f"{elapsed_str()} ✅ Diarization complete ({timing_data['speaker_diarization']:.1f}s)")
+                
+                # Add speaker labels to segments
+                if speaker_timeline:
+                    label_segment_speakers(speaker_timeline, segments)
         finally:
-            # Clean up temporary audio file
+            # Clean up temporary audio file (after diarization, which still needs it)
             if temp_audio_file and os.path.exists(temp_audio_file):
                 try:
                     os.remove(temp_audio_file)
@@ -1967,35 +3661,10 @@ class AudioTranscriber:
                 except Exception as cleanup_err:
                     logger.warning(f"Failed to clean up temp file: {cleanup_err}")
         
-        # Extract information
-        detected_language = result.get('language', 'unknown')
-        transcribed_text = result.get('text', '').strip()
-        segments = result.get('segments', [])
-        
-        # Perform speaker diarization if requested
-        speaker_timeline = None
-        if speaker_names and len(speaker_names) == 2:
-            timing_print(f"{elapsed_str()} 👥 Starting speaker diarization...")
-            diarization_start = time.time()
-            speaker_timeline = perform_speaker_diarization(
-                audio_path, 
-                speaker_names=speaker_names, 
-                debug=self.debug
-            )
-            timing_data['speaker_diarization'] = time.time() - diarization_start
-            timing_print(f"{elapsed_str()} ✅ Diarization complete ({timing_data['speaker_diarization']:.1f}s)")
-            
-            # Add speaker labels to segments
-            if speaker_timeline:
-                for segment in segments:
-                    segment_mid = (segment['start'] + segment['end']) / 2
-                    speaker = get_speaker_for_timestamp(speaker_timeline, segment_mid)
-                    segment['speaker'] = speaker if speaker else "Unknown"
-        
         if self.debug:
-            logger.debug("="*80)
+            logger.debug(_RULE)
             logger.debug("STEP: LANGUAGE DETECTION RESULTS")
-            logger.debug("="*80)
+            logger.debug(_RULE)
             logger.debug(f"Detected language code: {detected_language}")
             logger.debug(f"Language name: {self._get_language_name(detected_language)}")
             
@@ -2009,30 +3678,27 @@ class AudioTranscriber:
             logger.debug(f"Total transcription length: {len(transcribed_text)} characters")
             logger.debug(f"Transcription sample (first 200 chars): {transcribed_text[:200]!r}")
         
-        timing_print(f"{elapsed_str()} ✅ Detected language: {detected_language}")
-        timing_print(f"{elapsed_str()} ✅ Transcription length: {len(transcribed_text)} characters")
+        stamp = elapsed_str()
+        timing_print(f"{stamp} ✅ Detected language: {detected_language}")
+        timing_print(f"{stamp} ✅ Transcription length: {len(transcribed_text)} characters")
         
         # Translate to Romanian if needed and requested
         translated_text = None
         
         if self.debug:
-            logger.debug("="*80)
+            logger.debug(_RULE)
             logger.debug("STEP: TRANSLATION DECISION")
-            logger.debug("="*80)
+            logger.debug(_RULE)
             logger.debug(f"Translate flag: {translate}")
             logger.debug(f"Detected language: {detected_language}")
             logger.debug(f"Is Romanian: {detected_language == 'ro'}")
         
-        if translate and detected_language != 'ro':
+        if needs_translation:
             if self.debug:
                 logger.debug("DECISION: Translation will be attempted")
                 logger.debug(f"REASON: translate={translate} and detected_language='{detected_language}' != 'ro'")
             
-            timing_print(f"{elapsed_str()} 🌍 Starting translation to Romanian...")
-            
-            translate_start = time.time()
-            translated_text = self.translate_to_romanian(transcribed_text, source_lang=detected_language)
-            timing_data['translation'] = time.time() - translate_start
+            translated_text = translation_future.result() if translation_future else timed_translation()
             
             if translated_text and translated_text != transcribed_text:
                 timing_print(f"{elapsed_str()} ✅ Translation complete ({timing_data['translation']:.1f}s)")
@@ -2043,7 +3709,7 @@ class AudioTranscriber:
                     logger.debug(f"Translated length: {len(translated_text)}")
                     logger.debug(f"Translated sample (first 200 chars): {translated_text[:200]!r}")
             else:
-                logger.warning(f"{elapsed_str()} Translation did not produce different text")
+                logger.warning("%s Translation did not produce different text", elapsed_str())
                 
                 if self.debug:
                     logger.debug(f"Translation result same as original: {translated_text == transcribed_text}")
@@ -2068,41 +3734,42 @@ class AudioTranscriber:
         
         # Prepare output paths
         if output_path is None:
-            audio_name = Path(audio_path).stem
-            output_path = Path(audio_path).parent / f"{audio_name}_transcription.{output_format}"
+            # Name outputs after the original input (audio_path may be a temp file or array)
+            output_path = input_path.parent / f"{input_path.stem}_transcription.{output_format}"
         else:
             output_path = Path(output_path)
+        output_dir = output_path.parent
         
         # Prepare translated output path if translation was performed
         translated_output_path = None
-        if translated_text and translated_text != transcribed_text:
+        if needs_translation and translated_text and translated_text != transcribed_text:
             # Create translated file path with "_translated_ro" suffix
             output_stem = output_path.stem
             # Remove "_transcription" suffix if present to avoid double suffixes
             if output_stem.endswith('_transcription'):
                 output_stem = output_stem[:-14]  # Remove "_transcription"
-            translated_output_path = output_path.parent / f"{output_stem}_translated_ro{output_path.suffix}"
+            translated_output_path = output_dir / f"{output_stem}_translated_ro{output_path.suffix}"
         
         if self.debug:
-            logger.debug("="*80)
+            logger.debug(_RULE)
             logger.debug("STEP: PREPARE OUTPUT")
-            logger.debug("="*80)
+            logger.debug(_RULE)
             logger.debug(f"Original output path: {output_path}")
             logger.debug(f"Original output path (absolute): {output_path.absolute()}")
             if translated_output_path:
                 logger.debug(f"Translated output path: {translated_output_path}")
                 logger.debug(f"Translated output path (absolute): {translated_output_path.absolute()}")
             logger.debug(f"Output format: {output_format}")
-            logger.debug(f"Output directory: {output_path.parent}")
-            logger.debug(f"Output directory exists: {output_path.parent.exists()}")
+            logger.debug(f"Output directory: {output_dir}")
+            logger.debug(f"Output directory exists: {output_dir.exists()}")
         
         # Generate metadata
         metadata = {
-            'source_file': str(audio_path),
+            'source_file': str(original_input_path),
             'detected_language': detected_language,
             'transcription_date': datetime.now().isoformat(),
             'model_used': self.model_name,
-            'translation_applied': translate and detected_language != 'ro'
+            'translation_applied': needs_translation
         }
         
         if self.debug:
@@ -2110,29 +3777,116 @@ class AudioTranscriber:
             for key, value in metadata.items():
                 logger.debug(f"  {key}: {value}")
         
-        # Write original transcription output
-        timing_print(f"{elapsed_str()} 📝 Writing output files...")
-        write_start = time.time()
+        # Translated text and subtitle files carry per-segment translations. They are made here,
+        # on this thread, so the (possibly background) writers only format and write.
+        segment_translations = None
+        if (translated_output_path and segments and self.translator_available
+                and (output_format in ('srt', 'vtt') or (output_format == 'txt' and include_timestamps))):
+            logger.info("Translating individual segments for timestamped output...")
+            translate_start = time.time()
+            segment_translations = self.translate_to_romanian_batch(segment_columns(segments).texts)
+            timing_data['translation'] += time.time() - translate_start
+        
+        # Write output files. In background mode (batch processing) the writes overlap the
+        # next file's transcription.
+        write_args = (output_path, translated_output_path, output_format, include_timestamps,
+                      transcribed_text, translated_text, segments, segment_translations, metadata,
+                      detected_language, timing_print, elapsed_str)
+        write_future = None
+        if self.background_writes:
+            if self._writer is None:
+                self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='transcribe-writer')
+            timing_print(f"{elapsed_str()} 📝 Writing output files in the background...")
+            write_future = self._pending_write = self._writer.submit(self._write_outputs, *write_args)
+        else:
+            timing_print(f"{elapsed_str()} 📝 Writing output files...")
+            write_start = time.time()
+            self._write_outputs(*write_args)
+            timing_data['file_writing'] = time.time() - write_start
+        
+        # ============================================================
+        # TIMING SUMMARY TABLE (Print to console for guaranteed visibility)
+        # ============================================================
+        total_time = time.time() - process_start_time
+        
+        # Build the summary table
+        summary = ["", "=" * 60, "⏱️  PERFORMANCE SUMMARY", "=" * 60,
+                   f"{'Step':<30} {'Time':>10} {'%':>8}", "-" * 60]
+        
+        # Only show steps that were actually performed (time > 0)
+        steps_to_show = [
+            ('Audio Extraction', timing_data['audio_extraction']),
+            ('Transcription (Whisper)', timing_data['transcription']),
+            ('Speaker Diarization', timing_data['speaker_diarization']),
+            ('Translation', timing_data['translation']),
+            ('File Writing', timing_data['file_writing']),
+        ]
+        
+        for step_name, step_time in steps_to_show:
+            if step_time > 0:
+                percentage = (step_time / total_time) * 100 if total_time > 0 else 0
+                summary.append(f"{step_name:<30} {step_time:>8.1f}s {percentage:>7.1f}%")
+        
+        summary += ["-" * 60, f"{'TOTAL':<30} {total_time:>8.1f}s {100.0:>7.1f}%", "=" * 60, ""]
+        # One print and one log record for the whole table
+        timing_print("\n".join(summary))
+        
+        return {
+            'output_file': str(output_path),
+            'translated_output_file': str(translated_output_path) if translated_output_path else None,
+            'detected_language': detected_language,
+            'transcribed_text': transcribed_text,
+            'translated_text': translated_text,
+            'metadata': metadata,
+            'timing': timing_data,
+            'total_time': total_time,
+            'write_future': write_future
+        }
+    
+    def _write_outputs(self, output_path, translated_output_path, output_format, include_timestamps,
+                       transcribed_text, translated_text, segments, segment_translations, metadata,
+                       detected_language, timing_print, elapsed_str):
+        """
+        Write the original transcription file and, if any, the Romanian translation file.
+        
+        Args:
+            output_path: Path of the original-language output file
+            translated_output_path: Path of the translated output file, or None
+            output_format: Output format (txt, json, srt, vtt)
+            include_timestamps: Whether to include timestamps in text output
+            transcribed_text: Original transcription
+            translated_text: Romanian translation (or None)
+            segments: Whisper segments
+            segment_translations: Romanian text per segment for the translated text/subtitle
+                file, or None if segments were not translated
+            metadata: Metadata dictionary for the original file
+            detected_language: Detected source language code
+            timing_print: Progress printer from process_audio
+            elapsed_str: Elapsed-time formatter from process_audio
+        """
+        if segments and output_format != 'json':
+            # Text and subtitle writers share one flattened copy (JSON keeps the segment dicts)
+            segments = segment_columns(segments)
         
         if self.debug:
-            logger.debug("="*80)
+            logger.debug(_RULE)
             logger.debug("STEP: WRITE ORIGINAL TRANSCRIPTION FILE")
-            logger.debug("="*80)
-            logger.debug(f"Writing to: {output_path}")
+            logger.debug(_RULE)
+            logger.debug("Writing to: %s", output_path)
         
         try:
             if output_format == 'json':
                 if self.debug:
                     logger.debug("Format: JSON")
-                self._write_json_output(output_path, transcribed_text, None, segments, metadata)
+                written = self._write_json_output(output_path, transcribed_text, None, segments, metadata)
             elif output_format in ['srt', 'vtt']:
                 if self.debug:
-                    logger.debug(f"Format: {output_format.upper()} subtitle")
-                self._write_subtitle_output(output_path, segments, False, output_format)
+                    logger.debug("Format: %s subtitle", output_format.upper())
+                written = self._write_subtitle_output(output_path, segments, False, output_format)
             else:  # txt format
                 if self.debug:
                     logger.debug("Format: Text")
-                self._write_text_output(
+                written = self._write_text_output(
                     output_path,
                     transcribed_text,
                     None,  # No translation in original file
@@ -2141,292 +3895,272 @@ class AudioTranscriber:
                 )
             
             if self.debug:
-                logger.debug(f"File size: {os.path.getsize(output_path) / 1024:.2f} KB")
-                logger.debug(f"File exists: {output_path.exists()}")
+                logger.debug("File size: %.2f KB", written / 1024)
             
             timing_print(f"{elapsed_str()} ✅ Original transcription saved")
             
         except Exception as e:
-            logger.error(f"Failed to write original transcription file: {e}")
+            logger.error("Failed to write original transcription file: %s", e)
             if self.debug:
-                import traceback
-                logger.debug("Full traceback:")
-                logger.debug(traceback.format_exc())
+                logger.debug("Full traceback:", exc_info=True)
             raise
         
         # Write translated output if translation was performed
         if translated_output_path:
             if self.debug:
-                logger.debug("="*80)
+                logger.debug(_RULE)
                 logger.debug("STEP: WRITE TRANSLATED FILE")
-                logger.debug("="*80)
-                logger.debug(f"Writing to: {translated_output_path}")
+                logger.debug(_RULE)
+                logger.debug("Writing to: %s", translated_output_path)
             
             try:
-                # Update metadata for translated file
-                translated_metadata = metadata.copy()
-                translated_metadata['file_type'] = 'romanian_translation'
-                translated_metadata['original_language'] = detected_language
+                # Layer the translated-file fields over the shared metadata instead of copying it
+                translated_metadata = ChainMap(
+                    {'file_type': 'romanian_translation', 'original_language': detected_language},
+                    metadata
+                )
                 
                 if output_format == 'json':
                     if self.debug:
                         logger.debug("Format: JSON")
-                    self._write_json_output(translated_output_path, translated_text, None, segments, translated_metadata)
+                    # JSON encoders only accept real dicts
+                    written = self._write_json_output(translated_output_path, translated_text, None, segments,
+                                            dict(translated_metadata))
                 elif output_format in ['srt', 'vtt']:
                     if self.debug:
-                        logger.debug(f"Format: {output_format.upper()} subtitle")
+                        logger.debug("Format: %s subtitle", output_format.upper())
                     # For subtitles, we need to translate segments
-                    self._write_translated_subtitle_output(translated_output_path, segments, output_format)
+                    written = self._write_translated_subtitle_output(
+                        translated_output_path, segments, segment_translations, output_format
+                    )
                 else:  # txt format
                     if self.debug:
                         logger.debug("Format: Text")
-                    self._write_translated_text_output(
+                    written = self._write_translated_text_output(
                         translated_output_path,
                         translated_text,
                         segments if include_timestamps else None,
+                        segment_translations,
                         translated_metadata
                     )
                 
                 if self.debug:
-                    logger.debug(f"File size: {os.path.getsize(translated_output_path) / 1024:.2f} KB")
-                    logger.debug(f"File exists: {translated_output_path.exists()}")
+                    logger.debug("File size: %.2f KB", written / 1024)
                 
                 timing_print(f"{elapsed_str()} ✅ Romanian translation saved")
                 
             except Exception as e:
-                logger.error(f"Failed to write translated file: {e}")
+                logger.error("Failed to write translated file: %s", e)
                 if self.debug:
-                    import traceback
-                    logger.debug("Full traceback:")
-                    logger.debug(traceback.format_exc())
+                    logger.debug("Full traceback:", exc_info=True)
                 raise
+    
+    def _write_text_output(self, output_path, transcription, translation, segments, metadata):
+        """Write transcription to text file (original language only); returns the bytes written."""
+        # Header
+        parts = [_RULE_LINE, "TRANSCRIPTION RESULTS (ORIGINAL LANGUAGE)\n", _RULE_LINE, "\n"]
         
-        timing_data['file_writing'] = time.time() - write_start
-        
-        # ============================================================
-        # TIMING SUMMARY TABLE (Print to console for guaranteed visibility)
-        # ============================================================
-        total_time = time.time() - process_start_time
-        
-        # Build and print the summary table
-        print("", flush=True)
-        print("=" * 60, flush=True)
-        print("⏱️  PERFORMANCE SUMMARY", flush=True)
-        print("=" * 60, flush=True)
-        print(f"{'Step':<30} {'Time':>10} {'%':>8}", flush=True)
-        print("-" * 60, flush=True)
-        
-        # Only show steps that were actually performed (time > 0)
-        steps_to_show = [
-            ('Audio Extraction', timing_data['audio_extraction']),
-            ('Transcription (Whisper)', timing_data['transcription']),
-            ('Speaker Diarization', timing_data['speaker_diarization']),
-            ('Translation', timing_data['translation']),
-            ('File Writing', timing_data['file_writing']),
-        ]
+        # Metadata
+        parts += ["METADATA:\n", _SUBRULE_LINE, _metadata_block(metadata), "\n"]
         
-        for step_name, step_time in steps_to_show:
-            if step_time > 0:
-                percentage = (step_time / total_time) * 100 if total_time > 0 else 0
-                print(f"{step_name:<30} {step_time:>8.1f}s {percentage:>7.1f}%", flush=True)
+        # Original transcription
+        parts += ["TRANSCRIPTION:\n", _SUBRULE_LINE, transcription, "\n\n"]
         
-        print("-" * 60, flush=True)
-        print(f"{'TOTAL':<30} {total_time:>8.1f}s {100.0:>7.1f}%", flush=True)
-        print("=" * 60, flush=True)
-        print("", flush=True)
+        # Timestamps if available
+        if segments:
+            columns = segment_columns(segments)
+            parts += ["TIMESTAMPS:\n", _SUBRULE_LINE]
+            parts += self._timestamped_lines(columns, columns.texts)
+            parts.append("\n")
         
-        return {
-            'output_file': str(output_path),
-            'translated_output_file': str(translated_output_path) if translated_output_path else None,
-            'detected_language': detected_language,
-            'transcribed_text': transcribed_text,
-            'translated_text': translated_text,
-            'metadata': metadata,
-            'timing': timing_data,
-            'total_time': total_time
-        }
-    
-    def _write_text_output(self, output_path, transcription, translation, segments, metadata):
-        """Write transcription to text file (original language only)."""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            # Write header
-            f.write("="*80 + "\n")
-            f.write("TRANSCRIPTION RESULTS (ORIGINAL LANGUAGE)\n")
-            f.write("="*80 + "\n\n")
-            
-            # Write metadata
-            f.write("METADATA:\n")
-            f.write("-" * 40 + "\n")
-            for key, value in metadata.items():
-                f.write(f"{key.replace('_', ' ').title()}: {value}\n")
-            f.write("\n")
-            
-            # Write original transcription
-            f.write("TRANSCRIPTION:\n")
-            f.write("-" * 40 + "\n")
-            f.write(transcription + "\n\n")
-            
-            # Write timestamps if available
-            if segments:
-                f.write("TIMESTAMPS:\n")
-                f.write("-" * 40 + "\n")
-                for segment in segments:
-                    start_time = self._format_timestamp(segment['start'])
-                    end_time = self._format_timestamp(segment['end'])
-                    text = segment['text'].strip()
-                    speaker = segment.get('speaker')
-                    if speaker:
-                        f.write(f"[{start_time} -> {end_time}] [{speaker}] {text}\n")
-                    else:
-                        f.write(f"[{start_time} -> {end_time}] {text}\n")
-                f.write("\n")
-            
-            f.write("="*80 + "\n")
-            f.write("End of transcription\n")
-            f.write("="*80 + "\n")
+        parts += [_RULE_LINE, "End of transcription\n", _RULE_LINE]
+        return _write_utf8(output_path, "".join(parts))
     
     def _write_json_output(self, output_path, transcription, translation, segments, metadata):
-        """Write transcription to JSON file."""
+        """Write transcription to JSON file; returns the bytes written."""
         data = {
             'metadata': metadata,
             'transcription': transcription,
             'translation': translation,
             'segments': segments
         }
-        with open(output_path, 'w', encoding='utf-8') as f:
+        if orjson is not None:
+            try:
+                return self._stream_json_output(output_path, data)
+            except TypeError as e:
+                # The json fallback below reopens (and truncates) the file
+                if self.debug:
+                    logger.debug(f"orjson could not encode output, using json module: {e}")
+        
+        with open(output_path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
+            return f.tell()
+    
+    def _stream_json_output(self, output_path, data):
+        """
+        Write the JSON output with orjson, encoding one segment at a time.
+        
+        Long recordings produce tens of thousands of segments; encoding them
+        individually keeps only one segment's bytes in memory instead of the
+        whole document. The layout matches json.dump(..., indent=2).
+        
+        Args:
+            output_path: Destination file
+            data: Output document; 'segments' must be its last key
+        
+        Returns:
+            int: Bytes written
+        
+        Raises:
+            TypeError: If orjson cannot encode a value
+        """
+        # orjson emits UTF-8 bytes directly (non-ASCII unescaped, like ensure_ascii=False)
+        option = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        segments = data['segments']
+        
+        with open(output_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            if not segments:
+                f.write(orjson.dumps(data, option=option))
+                return f.tell()
+            
+            head = orjson.dumps({key: value for key, value in data.items() if key != 'segments'},
+                                option=option)
+            f.write(head[:-2])  # Drop the closing "\n}"
+            f.write(b',\n  "segments": [\n    ')
+            for i, segment in enumerate(segments):
+                if i:
+                    f.write(b',\n    ')
+                # Re-indent to sit two levels deep; encoded strings never contain raw newlines
+                f.write(orjson.dumps(segment, option=option).replace(b'\n', b'\n    '))
+            f.write(b'\n  ]\n}')
+            return f.tell()
     
     def _write_subtitle_output(self, output_path, segments, translate, format_type):
-        """Write transcription to subtitle file (SRT or VTT) - original language."""
+        """Write transcription to subtitle file (SRT or VTT) - original language; returns the bytes written."""
         logger.info(f"Generating {format_type.upper()} subtitle file...")
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            if format_type == 'vtt':
-                f.write("WEBVTT\n\n")
-            
-            for i, segment in enumerate(segments, 1):
-                start_time = self._format_timestamp(segment['start'], format_type)
-                end_time = self._format_timestamp(segment['end'], format_type)
-                text = segment['text'].strip()
-                speaker = segment.get('speaker')
-                
-                # Add speaker label if available
-                if speaker:
-                    text = f"[{speaker}] {text}"
-                
-                # Note: translate parameter is kept for backward compatibility but not used
-                # Translation is now handled in separate file
-                
-                if format_type == 'srt':
-                    f.write(f"{i}\n")
-                    f.write(f"{start_time} --> {end_time}\n")
-                    f.write(f"{text}\n\n")
-                else:  # vtt
-                    f.write(f"{start_time} --> {end_time}\n")
-                    f.write(f"{text}\n\n")
-        
-        logger.info(f"✓ Subtitle file created with {len(segments)} segments")
-    
-    def _write_translated_text_output(self, output_path, translation, segments, metadata):
-        """Write Romanian translation to text file with timestamped segments."""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            # Write header
-            f.write("="*80 + "\n")
-            f.write("ROMANIAN TRANSLATION\n")
-            f.write("="*80 + "\n\n")
-            
-            # Write metadata
-            f.write("METADATA:\n")
-            f.write("-" * 40 + "\n")
-            for key, value in metadata.items():
-                f.write(f"{key.replace('_', ' ').title()}: {value}\n")
-            f.write("\n")
+        # Note: translate parameter is kept for backward compatibility but not used
+        # Translation is now handled in separate file
+        columns = segment_columns(segments)
+        body = self._build_subtitle_body(columns, columns.texts, format_type)
+        
+        written = _write_utf8(output_path, body)
+        
+        logger.info(f"✓ Subtitle file created with {len(columns.texts)} segments")
+        return written
+    
+    def _write_translated_text_output(self, output_path, translation, segments, segment_translations, metadata):
+        """
+        Write Romanian translation to text file with timestamped segments; returns the bytes written.
+        
+        segment_translations holds the translated text of each segment; when it is None the
+        timestamps section lists the original segments instead.
+        """
+        # Header
+        parts = [_RULE_LINE, "ROMANIAN TRANSLATION\n", _RULE_LINE, "\n"]
+        
+        # Metadata
+        parts += ["METADATA:\n", _SUBRULE_LINE, _metadata_block(metadata), "\n"]
+        
+        # Translated text
+        parts += ["TRANSLATED TEXT:\n", _SUBRULE_LINE, translation, "\n\n"]
+        
+        # Timestamps with translated segments if available
+        if segments and segment_translations is not None:
+            columns = segment_columns(segments)
+            original_texts = columns.texts
+            translated_texts = segment_translations
             
-            # Write translated text
-            f.write("TRANSLATED TEXT:\n")
-            f.write("-" * 40 + "\n")
-            f.write(translation + "\n\n")
+            parts += ["TIMESTAMPS WITH TRANSLATED SEGMENTS:\n", _SUBRULE_LINE]
+            parts += self._timestamped_lines(columns, translated_texts)
+            parts.append("\n")
             
-            # Write timestamps with translated segments if available
-            if segments and self.translator_available:
-                f.write("TIMESTAMPS WITH TRANSLATED SEGMENTS:\n")
-                f.write("-" * 40 + "\n")
-                logger.info("Translating individual segments for timestamped output...")
-                
-                for i, segment in enumerate(segments, 1):
-                    start_time = self._format_timestamp(segment['start'])
-                    end_time = self._format_timestamp(segment['end'])
-                    original_text = segment['text'].strip()
-                    speaker = segment.get('speaker')
-                    
-                    # Translate each segment
-                    try:
-                        translated_segment = self.translate_to_romanian(original_text)
-                        if speaker:
-                            f.write(f"[{start_time} -> {end_time}] [{speaker}] {translated_segment}\n")
-                        else:
-                            f.write(f"[{start_time} -> {end_time}] {translated_segment}\n")
-                        
-                        if self.debug and i <= 3:  # Show first 3 for debug
-                            logger.debug(f"Segment {i}: '{original_text}' -> '{translated_segment}'")
-                    except Exception as e:
-                        logger.warning(f"Failed to translate segment {i}: {e}")
-                        if speaker:
-                            f.write(f"[{start_time} -> {end_time}] [{speaker}] {original_text}\n")
-                        else:
-                            f.write(f"[{start_time} -> {end_time}] {original_text}\n")
-                
-                logger.info(f"✓ Translated {len(segments)} segments with timestamps")
-                f.write("\n")
-            elif segments:
-                f.write("TIMESTAMPS (Translation unavailable):\n")
-                f.write("-" * 40 + "\n")
-                for segment in segments:
-                    start_time = self._format_timestamp(segment['start'])
-                    end_time = self._format_timestamp(segment['end'])
-                    text = segment['text'].strip()
-                    f.write(f"[{start_time} -> {end_time}] {text}\n")
-                f.write("\n")
+            if self.debug:
+                for i, (original_text, translated_segment) in enumerate(
+                        zip(original_texts[:3], translated_texts[:3]), 1):  # Show first 3 for debug
+                    logger.debug(f"Segment {i}: '{original_text}' -> '{translated_segment}'")
             
-            f.write("="*80 + "\n")
-            f.write("End of translation\n")
-            f.write("="*80 + "\n")
+            logger.info(f"✓ Wrote {len(original_texts)} translated segments with timestamps")
+        elif segments:
+            columns = segment_columns(segments)
+            parts += ["TIMESTAMPS (Translation unavailable):\n", _SUBRULE_LINE]
+            parts += self._timestamped_lines(columns, columns.texts, include_speakers=False)
+            parts.append("\n")
+        
+        parts += [_RULE_LINE, "End of translation\n", _RULE_LINE]
+        return _write_utf8(output_path, "".join(parts))
+    
+    def _timestamped_lines(self, columns, texts, include_speakers=True):
+        """
+        Build the "[start -> end] text" lines of a text output file.
+        
+        Args:
+            columns: SegmentColumns (timing and optional speaker)
+            texts: Line text for each segment, parallel to columns
+            include_speakers: Prefix "[speaker] " when a segment has one
+        
+        Returns:
+            list: Newline-terminated lines; callers add them to the file's parts list,
+                  which is joined and encoded once by _write_utf8()
+        """
+        starts, ends = self._segment_timestamps(columns)
+        speakers = columns.speakers if include_speakers else [None] * len(texts)
+        lines = []
+        append = lines.append
+        for start_time, end_time, text, speaker in zip(starts, ends, texts, speakers):
+            if speaker:
+                append(f"[{start_time} -> {end_time}] [{speaker}] {text}\n")
+            else:
+                append(f"[{start_time} -> {end_time}] {text}\n")
+        return lines
     
-    def _write_translated_subtitle_output(self, output_path, segments, format_type):
-        """Write Romanian translation to subtitle file (SRT or VTT)."""
+    def _write_translated_subtitle_output(self, output_path, segments, texts, format_type):
+        """
+        Write Romanian translation to subtitle file (SRT or VTT); returns the bytes written.
+        
+        texts holds the translated cue text of each segment; when it is None the file
+        carries the original-language cues.
+        """
+        if texts is None:
+            return self._write_subtitle_output(output_path, segments, False, format_type)
+        
         logger.info(f"Generating translated {format_type.upper()} subtitle file...")
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            if format_type == 'vtt':
-                f.write("WEBVTT\n\n")
+        columns = segment_columns(segments)
+        
+        body = self._build_subtitle_body(columns, texts, format_type)
+        
+        written = _write_utf8(output_path, body)
+        
+        logger.info(f"✓ Translated subtitle file created with {len(texts)} segments")
+        return written
+    
+    def _build_subtitle_body(self, columns, texts, format_type):
+        """
+        Build the full contents of an SRT or VTT file in memory.
+        
+        Args:
+            columns: SegmentColumns (timing and optional speaker)
+            texts: Cue text for each segment, parallel to columns
+            format_type: 'srt' or 'vtt'
+        
+        Returns:
+            str: File contents, written by the caller in a single write()
+        """
+        starts, ends = self._segment_timestamps(columns, format_type)
+        parts = [None] * len(texts)
+        for i, (text, start_time, end_time, speaker) in enumerate(zip(texts, starts, ends, columns.speakers)):
+            # Add speaker label if available
+            if speaker:
+                text = f"[{speaker}] {text}"
             
-            for i, segment in enumerate(segments, 1):
-                start_time = self._format_timestamp(segment['start'], format_type)
-                end_time = self._format_timestamp(segment['end'], format_type)
-                text = segment['text'].strip()
-                speaker = segment.get('speaker')
-                
-                # Translate each segment
-                if self.translator_available:
-                    try:
-                        text = self.translate_to_romanian(text)
-                    except Exception as e:
-                        logger.warning(f"Failed to translate segment {i}: {e}")
-                        # Keep original if translation fails
-                
-                # Add speaker label if available
-                if speaker:
-                    text = f"[{speaker}] {text}"
-                
-                if format_type == 'srt':
-                    f.write(f"{i}\n")
-                    f.write(f"{start_time} --> {end_time}\n")
-                    f.write(f"{text}\n\n")
-                else:  # vtt
-                    f.write(f"{start_time} --> {end_time}\n")
-                    f.write(f"{text}\n\n")
+            if format_type == 'srt':
+                parts[i] = f"{i + 1}\n{start_time} --> {end_time}\n{text}\n\n"
+            else:  # vtt
+                parts[i] = f"{start_time} --> {end_time}\n{text}\n\n"
         
-        logger.info(f"✓ Translated subtitle file created with {len(segments)} segments")
+        body = "".join(parts)
+        return "WEBVTT\n\n" + body if format_type == 'vtt' else body
     
     @staticmethod
     def _format_timestamp(seconds, format_type='txt'):
@@ -2437,11 +4171,44 @@ class AudioTranscriber:
         millis = int((seconds % 1) * 1000)
         
         if format_type == 'srt':
-            return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+            return "%02d:%02d:%02d,%03d" % (hours, minutes, secs, millis)
         elif format_type == 'vtt':
-            return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
+            return "%02d:%02d:%02d.%03d" % (hours, minutes, secs, millis)
         else:  # txt
-            return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+            return "%02d:%02d:%02d" % (hours, minutes, secs)
+    
+    @staticmethod
+    def _format_timestamps_bulk(seconds, format_type='txt'):
+        """
+        Format many timestamps at once; same output as _format_timestamp.
+        
+        The hour/minute/second/millisecond split is done with NumPy array
+        arithmetic (mirroring the scalar float ops so values round identically),
+        leaving only the string formatting per element.
+        
+        Args:
+            seconds: Sequence of timestamps in seconds
+            format_type: 'srt', 'vtt' or 'txt'
+        
+        Returns:
+            list: Formatted timestamp strings
+        """
+        seconds = np.asarray(seconds, dtype=np.float64)
+        hours = (seconds // 3600).astype(np.int64).tolist()
+        minutes = ((seconds % 3600) // 60).astype(np.int64).tolist()
+        secs = (seconds % 60).astype(np.int64).tolist()
+        
+        if format_type == 'txt':
+            return ["%02d:%02d:%02d" % hms for hms in zip(hours, minutes, secs)]
+        
+        millis = ((seconds % 1) * 1000).astype(np.int64).tolist()
+        template = "%02d:%02d:%02d,%03d" if format_type == 'srt' else "%02d:%02d:%02d.%03d"
+        return [template % hmsm for hmsm in zip(hours, minutes, secs, millis)]
+    
+    def _segment_timestamps(self, columns, format_type='txt'):
+        """Return (start_strings, end_strings) for all SegmentColumns rows, formatted in bulk."""
+        return (self._format_timestamps_bulk(columns.starts, format_type),
+                self._format_timestamps_bulk(columns.ends, format_type))
     
     @staticmethod
     def _get_language_name(lang_code):
@@ -2471,6 +4238,11 @@ class AudioTranscriber:
         return lang_names.get(lang_code, f"Unknown ({lang_code})")
 
 
+def _speaker_list(value):
+    """argparse type for --speakers: split "John, Mary" once into ['John', 'Mary'] (None if empty)."""
+    return [name.strip() for name in value.split(',') if name.strip()] or None
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -2569,6 +4341,35 @@ Examples:
         help='Force CPU usage, bypassing GPU acceleration. Useful to avoid MPS/CUDA issues.'
     )
     
+    parser.add_argument(
+        '--int8',
+        action='store_true',
+        help='Quantize the Whisper model to int8 when running on CPU (faster, smaller, slightly less accurate).'
+    )
+    
+    parser.add_argument(
+        '--precision',
+        type=str,
+        choices=['auto', 'fp16', 'fp32'],
+        default='auto',
+        help='Decoding precision on GPU (default: auto = FP16 on CUDA/MPS). Use fp32 if MPS produces NaN errors.'
+    )
+    
+    parser.add_argument(
+        '--no-translation-cache',
+        action='store_true',
+        help='Do not read or write the persistent translation cache in ~/.cache/transcribe_ro '
+             '(also: TRANSCRIBE_NO_TRANSLATION_CACHE=1).'
+    )
+    
+    parser.add_argument(
+        '--hwaccel',
+        type=str,
+        choices=['auto'] + list(HWACCEL_BACKENDS),
+        default=None,
+        help='Use ffmpeg hardware decoding when extracting audio from video files (default: CPU decode).'
+    )
+    
     parser.add_argument(
         '--translation-mode',
         type=str,
@@ -2592,7 +4393,7 @@ Examples:
     
     parser.add_argument(
         '--speakers',
-        type=str,
+        type=_speaker_list,
         default=None,
         help='Enable speaker diarization with two speaker names separated by comma (e.g., "John,Mary")'
     )
@@ -2652,9 +4453,9 @@ Examples:
             logger.info(f"Video file detected ({file_ext}). Audio will be extracted automatically.")
     
     # Print banner
-    print("\n" + "="*80)
+    print("\n" + _RULE)
     print("TRANSCRIBE RO - Audio Transcription & Translation Tool")
-    print("="*80 + "\n")
+    print(_RULE + "\n")
     
     # Preload model to ensure it's downloaded
     logger.info(f"Checking/downloading Whisper model '{args.model}'...")
@@ -2663,9 +4464,9 @@ Examples:
     
     try:
         if args.debug:
-            logger.debug("="*80)
+            logger.debug(_RULE)
             logger.debug("STARTING TRANSCRIPTION PROCESS")
-            logger.debug("="*80)
+            logger.debug(_RULE)
             logger.debug(f"Command line arguments:")
             for arg, value in vars(args).items():
                 logger.debug(f"  {arg}: {value}")
@@ -2684,7 +4485,11 @@ Examples:
             model_name=args.model,
             device=device_to_use,
             debug=args.debug,
-            translation_mode=args.translation_mode
+            translation_mode=args.translation_mode,
+            hwaccel=args.hwaccel,
+            int8=args.int8,
+            precision=args.precision,
+            translation_cache=not args.no_translation_cache
         )
         
         # Process audio - either single file or batch directory
@@ -2711,14 +4516,14 @@ Examples:
                 translate=not args.no_translate,
                 include_timestamps=not args.no_timestamps,
                 output_format=args.format,
-                speaker_names=args.speakers.split(',') if args.speakers else None
+                speaker_names=args.speakers
             )
         
         if args.debug and result:
             total_time = time.time() - process_start
-            logger.debug("="*80)
+            logger.debug(_RULE)
             logger.debug("PROCESSING SUMMARY")
-            logger.debug("="*80)
+            logger.debug(_RULE)
             logger.debug(f"Total processing time: {total_time:.2f} seconds")
             logger.debug(f"Detected language: {result['detected_language']}")
             logger.debug(f"Original transcription file: {result['output_file']}")
@@ -2729,9 +4534,9 @@ Examples:
                 logger.debug(f"Translation length: {len(result['translated_text'])} chars")
                 logger.debug(f"Translation different from original: {result['translated_text'] != result['transcribed_text']}")
         
-        print("\n" + "="*80)
+        print("\n" + _RULE)
         print("PROCESSING COMPLETED SUCCESSFULLY!")
-        print("="*80)
+        print(_RULE)
         
         if result:  # Single file mode
             logger.info(f"Detected language: {result['detected_language']}")
@@ -2750,11 +4555,10 @@ Examples:
     except Exception as e:
         logger.error(f"\nError: {e}")
         if args.debug:
-            logger.debug("="*80)
+            logger.debug(_RULE)
             logger.debug("FULL EXCEPTION DETAILS")
-            logger.debug("="*80)
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug(_RULE)
+            logger.debug("Full traceback:", exc_info=True)
         else:
             logger.info("Run with --debug flag for detailed error information")
         sys.exit(1)
@@ -19,6 +19,8 @@ License: MIT
 import os
 import sys
 import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 from pathlib import Path
@@ -44,8 +46,10 @@ try:
         AudioTranscriber, 
         setup_logging, 
         perform_speaker_diarization, 
-        get_speaker_for_timestamp,
+        label_segment_speakers,
         check_diarization_requirements,
+        decode_audio,
+        SampleBuffer,
         DIARIZATION_AVAILABLE,
         # Video support
         is_video_file,
@@ -60,6 +64,23 @@ except ImportError:
     sys.exit(1)
 
 
+class RunSettings(namedtuple('RunSettings', ['files', 'debug_enabled', 'diarization_enabled', 'speaker_names'])):
+    """
+    Snapshot of the form taken on the Tk thread when processing starts.
+    
+    The worker thread reads this instead of calling .get() on Tk variables,
+    which is not thread-safe and crosses into Tcl on every call.
+    
+    Fields:
+        files: Paths to process, in order
+        debug_enabled: Debug mode checkbox state
+        diarization_enabled: Speaker diarization checkbox state
+        speaker_names: Non-empty custom speaker names from the visible entries
+    """
+    
+    __slots__ = ()
+
+
 class TranscribeROGUI:
     """Main GUI application class for Transcribe RO."""
     
@@ -95,6 +116,18 @@ class TranscribeROGUI:
         
         # Variables
         self.selected_file = tk.StringVar()
+        self.selected_files = []  # All selected files when several are picked at once
+        
+        # Partial transcript text streamed from the worker, flushed to the widget in batches
+        self._partial_text = []
+        self._partial_lock = threading.Lock()
+        self._partial_flush_id = None
+        
+        # Two sample buffers reused across runs: one file is decoded while the previous one is transcribed
+        self._audio_buffers = (SampleBuffer(), SampleBuffer())
+        
+        # Cached (is_available, error) from check_diarization_requirements; reset when settings change
+        self._diarization_cache = None
         self.source_language = tk.StringVar(value="ro")  # Romanian as default
         self.translation_status = tk.StringVar(value="Neînceput (Not started)")
         
@@ -121,6 +154,10 @@ class TranscribeROGUI:
         self.detected_language = tk.StringVar(value="")  # Store detected language for display
         self.processing = False
         self.transcriber = None
+        # Transcribers (and their loaded models) reused across runs, keyed by
+        # (model_size, device, translation_mode, debug)
+        self._transcriber_cache = {}
+        self._transcriber_lock = threading.Lock()
         self.current_result = None  # Store the transcription result with segments
         self.diarization_segments = None  # Store segments with speaker info for later use
         self.speaker_timeline = None  # Store diarization timeline
@@ -160,6 +197,14 @@ class TranscribeROGUI:
         
         # Center window on screen
         self.center_window()
+        
+        # Load the default model in the background so the first run starts warm
+        settings = self._transcription_settings()
+        threading.Thread(
+            target=self._warm_up_transcriber,
+            args=settings[:3] + (self.debug_mode.get(), settings[5]),
+            daemon=True
+        ).start()
     
     def center_window(self):
         """Center the window on the screen."""
@@ -288,16 +333,23 @@ class TranscribeROGUI:
             self.debug_mode.set(debug_enabled)
             self.toggle_debug_mode()  # This will reinitialize logging
         
-        # Update speaker recognition status
+        # Update speaker recognition status (the token may have changed)
+        self._diarization_cache = None
         self._update_speaker_status()
     
+    def _check_diarization_cached(self):
+        """Return check_diarization_requirements(), re-checked only after settings are saved."""
+        if self._diarization_cache is None:
+            self._diarization_cache = check_diarization_requirements()
+        return self._diarization_cache
+    
     def _update_speaker_status(self):
         """Update the speaker recognition status indicator."""
         if not hasattr(self, 'speaker_status_label'):
             return
         
         # Re-check diarization requirements (which will now include the new HF_TOKEN)
-        is_available, error_msg = check_diarization_requirements()
+        is_available, error_msg = self._check_diarization_cached()
         
         if is_available:
             # Check if token was loaded from settings vs manually set
@@ -343,6 +395,9 @@ class TranscribeROGUI:
         main_frame.columnconfigure(0, weight=1)
         main_frame.columnconfigure(1, weight=1)
         
+        # Don't resize the container as each section is gridded; one pass at the end
+        main_frame.grid_propagate(False)
+        
         # Header
         self.create_header(main_frame)
         
@@ -363,6 +418,8 @@ class TranscribeROGUI:
         
         # Results section (two side-by-side panels) - expanded
         self.create_results_section(main_frame)
+        
+        main_frame.grid_propagate(True)
     
     def create_header(self, parent):
         """Create the header section."""
@@ -511,7 +568,7 @@ class TranscribeROGUI:
         status_row.grid(row=1, column=0, sticky=tk.W, pady=(5, 0))
         
         # Check diarization availability and show appropriate status
-        is_available, error_msg = check_diarization_requirements()
+        is_available, error_msg = self._check_diarization_cached()
         
         if is_available:
             # Check if token was loaded from settings vs manually set
@@ -686,6 +743,15 @@ class TranscribeROGUI:
             width=20
         )
         self.stop_btn.grid(row=0, column=1, padx=5)
+        
+        # Reload button: drops cached models (e.g. after changing model files or to free memory)
+        self.reload_btn = ttk.Button(
+            button_frame,
+            text="🔄 Reîncarcă Modelul (Reload Model)",
+            command=self.reload_model,
+            width=30
+        )
+        self.reload_btn.grid(row=0, column=2, padx=5)
     
     def create_progress_bar(self, parent):
         """Create progress bar."""
@@ -693,9 +759,11 @@ class TranscribeROGUI:
         progress_frame.grid(row=4, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
         progress_frame.columnconfigure(0, weight=1)
         
+        # Determinate: advanced from Whisper's decoding progress (no repaint timer)
         self.progress = ttk.Progressbar(
             progress_frame,
-            mode='indeterminate',
+            mode='determinate',
+            maximum=100,
             length=300
         )
         self.progress.grid(row=0, column=0, sticky=(tk.W, tk.E))
@@ -852,19 +920,25 @@ class TranscribeROGUI:
             self.results_frame.columnconfigure(1, weight=0)
     
     def browse_file(self):
-        """Open file browser to select audio file."""
-        filename = filedialog.askopenfilename(
-            title="Selectați Fișier Audio (Select Audio File)",
+        """Open file browser to select one or more audio files."""
+        filenames = filedialog.askopenfilenames(
+            title="Selectați Fișier(e) Audio (Select Audio File(s))",
             filetypes=self.audio_formats
         )
         
-        if filename:
-            self.selected_file.set(filename)
-            self.update_status(f"Selectat (Selected): {Path(filename).name}", "blue")
+        if filenames:
+            # Several files are processed back to back with the same loaded model
+            self.selected_files = list(filenames)
+            self.selected_file.set(filenames[0])
+            if len(filenames) == 1:
+                self.update_status(f"Selectat (Selected): {Path(filenames[0]).name}", "blue")
+            else:
+                self.update_status(f"Selectate (Selected): {len(filenames)} fișiere (files)", "blue")
     
     def clear_file(self):
         """Clear selected file."""
         self.selected_file.set("")
+        self.selected_files = []
         # Clear stored diarization data
         self.diarization_segments = None
         self.speaker_timeline = None
@@ -874,7 +948,6 @@ class TranscribeROGUI:
     def update_status(self, message, color="black"):
         """Update status message."""
         self.status_label.config(text=message, foreground=color)
-        self.root.update_idletasks()
     
     def start_processing(self):
         """Start the transcription process."""
@@ -883,8 +956,9 @@ class TranscribeROGUI:
             messagebox.showerror("Eroare (Error)", "Vă rugăm să selectați mai întâi un fișier audio. (Please select an audio file first.)")
             return
         
-        if not os.path.exists(self.selected_file.get()):
-            messagebox.showerror("Eroare (Error)", "Fișierul selectat nu există. (Selected file does not exist.)")
+        missing = [path for path in self.selected_files or [self.selected_file.get()] if not os.path.exists(path)]
+        if missing:
+            messagebox.showerror("Eroare (Error)", f"Fișierul selectat nu există. (Selected file does not exist.)\n\n{missing[0]}")
             return
         
         # Clear previous results and diarization data
@@ -898,12 +972,20 @@ class TranscribeROGUI:
         self.processing = True
         self.process_btn.config(state="disabled")
         self.stop_btn.config(state="normal")
-        self.progress.start(10)
+        self.progress.config(value=0)
         
         self.update_status("Se încarcă modelul și se pregătește transcrierea... (Loading model and preparing transcription...)", "orange")
         
+        run = RunSettings(
+            files=tuple(self.selected_files or [self.selected_file.get()]),
+            debug_enabled=self.debug_mode.get(),
+            diarization_enabled=self.enable_diarization.get(),
+            speaker_names=tuple(name for name in (self.speaker_names[i].get().strip()
+                                                  for i in range(self.visible_speakers)) if name)
+        )
+        
         # Start processing in a separate thread to avoid UI freeze
-        processing_thread = threading.Thread(target=self.process_audio, daemon=True)
+        processing_thread = threading.Thread(target=self.process_audio, args=(run,), daemon=True)
         processing_thread.start()
     
     def stop_processing(self):
@@ -913,257 +995,411 @@ class TranscribeROGUI:
             self.update_status("Procesare oprită de utilizator. (Processing stopped by user.)", "red")
             self.reset_ui_state()
     
-    def process_audio(self):
-        """Process the audio file (runs in separate thread)."""
+    def _transcription_settings(self):
+        """
+        Read transcription settings from preferences (defaults when unavailable).
+        
+        Returns:
+            tuple: (model_size, device_to_use, translation_mode, source_language, precision,
+                   translation_cache, print_segments), where device_to_use already accounts
+                   for the force-CPU option
+        """
+        model_size = "base"
+        device_type = "auto"
+        force_cpu = False
+        translation_mode = "auto"
+        source_language = "auto"
+        precision = "auto"
+        translation_cache = True
+        print_segments = False
+        
+        if self.settings_manager:
+            model_size = self.settings_manager.get("transcription", "default_model_size", "base")
+            device_type = self.settings_manager.get("transcription", "default_device", "auto")
+            force_cpu = self.settings_manager.get("transcription", "force_cpu", False)
+            translation_mode = self.settings_manager.get("transcription", "default_translation_mode", "auto")
+            source_language = self.settings_manager.get("transcription", "default_source_language", "auto")
+            precision = self.settings_manager.get("transcription", "precision", "auto")
+            translation_cache = self.settings_manager.get("transcription", "translation_cache", True)
+            print_segments = self.settings_manager.get("transcription", "print_segments", False)
+            self.logger.info(f"Loaded settings from preferences: model={model_size}, device={device_type}, force_cpu={force_cpu}, translation={translation_mode}, source_lang={source_language}, precision={precision}, translation_cache={translation_cache}")
+        
+        # Handle force CPU option (an int8 CPU choice already runs on CPU)
+        device_to_use = 'cpu' if force_cpu and device_type != 'cpu-int8' else device_type
+        if force_cpu:
+            self.logger.info("Force CPU option enabled: GPU acceleration disabled")
+        
+        return (model_size, device_to_use, translation_mode, source_language, precision, translation_cache,
+                print_segments)
+    
+    def _get_transcriber(self, model_size, device_to_use, translation_mode, debug_enabled, translation_cache=True):
+        """
+        Return a transcriber for these settings, creating it only on first use.
+        
+        Reusing the transcriber keeps its Whisper model and offline translation
+        models loaded between runs.
+        """
+        key = (model_size, device_to_use, translation_mode, debug_enabled, translation_cache)
+        with self._transcriber_lock:
+            transcriber = self._transcriber_cache.get(key)
+            if transcriber is None:
+                int8 = device_to_use == 'cpu-int8'
+                transcriber = AudioTranscriber(
+                    model_name=model_size,
+                    device='cpu' if int8 else device_to_use,
+                    verbose=False,  # Set per run from the print-segments preference
+                    debug=debug_enabled,
+                    translation_mode=translation_mode,
+                    int8=int8,
+                    translation_cache=translation_cache
+                )
+                self._transcriber_cache[key] = transcriber
+            else:
+                self.logger.info(f"Reusing loaded model '{model_size}' ({device_to_use})")
+        return transcriber
+    
+    def _warm_up_transcriber(self, model_size, device_to_use, translation_mode, debug_enabled, translation_cache):
+        """Preload the default transcriber (runs in a background thread at startup)."""
+        try:
+            self._get_transcriber(model_size, device_to_use, translation_mode, debug_enabled, translation_cache)
+            self.logger.info(f"Model '{model_size}' preloaded")
+        except Exception as e:
+            # Not fatal: the model is loaded (and any error reported) on the first run instead
+            self.logger.warning(f"Model preload failed: {e}")
+    
+    def reload_model(self):
+        """Drop cached transcribers and models so the next run loads them fresh."""
+        if self.processing:
+            messagebox.showwarning("Atenție (Warning)", "Așteptați finalizarea procesării. (Wait for processing to finish.)")
+            return
+        
+        # Don't block the UI behind the startup preload; it holds the lock while loading
+        if not self._transcriber_lock.acquire(blocking=False):
+            self.update_status("Modelul încă se încarcă... (Model is still loading...)", "orange")
+            return
+        try:
+            self._transcriber_cache.clear()
+            self.transcriber = None
+            AudioTranscriber.clear_model_cache()
+        finally:
+            self._transcriber_lock.release()
+        
+        self.logger.info("Model cache cleared")
+        self.update_status("Modelul va fi reîncărcat la următoarea rulare. (Model will be reloaded on the next run.)", "blue")
+    
+    def process_audio(self, run):
+        """
+        Process the selected audio files (runs in separate thread).
+        
+        Args:
+            run: RunSettings captured by start_processing
+        """
         try:
             # Initialize transcriber
             self.root.after(0, lambda: self.update_status("Se încarcă modelul Whisper... (Loading Whisper model...)", "orange"))
             
             # Load settings from preferences
-            model_size = "base"
-            device_type = "auto"
-            force_cpu = False
-            translation_mode = "auto"
-            source_language = "auto"
-            
-            if self.settings_manager:
-                model_size = self.settings_manager.get("transcription", "default_model_size", "base")
-                device_type = self.settings_manager.get("transcription", "default_device", "auto")
-                force_cpu = self.settings_manager.get("transcription", "force_cpu", False)
-                translation_mode = self.settings_manager.get("transcription", "default_translation_mode", "auto")
-                source_language = self.settings_manager.get("transcription", "default_source_language", "auto")
-                self.logger.info(f"Loaded settings from preferences: model={model_size}, device={device_type}, force_cpu={force_cpu}, translation={translation_mode}, source_lang={source_language}")
-            
-            # Handle force CPU option
-            device_to_use = 'cpu' if force_cpu else device_type
-            if force_cpu:
-                self.logger.info("Force CPU option enabled: GPU acceleration disabled")
-            
-            # Get current debug mode from checkbox
-            debug_enabled = self.debug_mode.get()
-            
-            self.transcriber = AudioTranscriber(
-                model_name=model_size,
-                device=device_to_use,
-                verbose=True,
-                debug=debug_enabled,
-                translation_mode=translation_mode
-            )
-            
-            if not self.processing:
-                return
-            
-            # Transcribe audio
-            self.root.after(0, lambda: self.update_status("Se transcrie audio... Poate dura câteva minute. (Transcribing audio... This may take a few minutes.)", "orange"))
-            
-            result = self.transcriber.transcribe_audio(self.selected_file.get())
-            
-            if not self.processing:
-                return
-            
-            detected_language = result.get('language', 'unknown')
-            transcribed_text = result.get('text', '').strip()
-            segments = result.get('segments', [])
+            (model_size, device_to_use, translation_mode, source_language, precision,
+             translation_cache, print_segments) = self._transcription_settings()
             
-            # Update detected language display in GUI
-            lang_name = self.languages.get(detected_language, detected_language.upper())
-            self.root.after(0, lambda ln=lang_name: self.detected_language.set(f"— Detectat (Detected): {ln}"))
+            files = run.files
+            # Decode audio on a side thread: the first file while the model loads,
+            # each following file while the previous one is transcribed
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix='audio-decode') as decoder:
+                pending_audio = decoder.submit(decode_audio, files[0], self._audio_buffers[0])
+                
+                self.transcriber = self._get_transcriber(model_size, device_to_use, translation_mode,
+                                                         run.debug_enabled, translation_cache)
+                # Precision and segment printing only affect decoding, so a cached transcriber picks them up per run
+                self.transcriber.precision = precision
+                self.transcriber.verbose = print_segments
+                
+                if not self.processing:
+                    return
+                
+                for index, file_path in enumerate(files, 1):
+                    audio = pending_audio.result()
+                    if index < len(files):
+                        # Reuses the buffer of the file before this one, which has been fully processed
+                        pending_audio = decoder.submit(decode_audio, files[index], self._audio_buffers[index % 2])
+                    
+                    header = ""
+                    if len(files) > 1:
+                        separator = "\n\n" if index > 1 else ""
+                        header = f"{separator}=== {Path(file_path).name} ({index}/{len(files)}) ===\n\n"
+                    if not self._process_file(file_path, audio, run, header):
+                        return
             
-            # Store the result for later use
-            self.current_result = result
+            if len(files) > 1:
+                # Speaker assignment re-labels a single transcript
+                self.diarization_segments = None
             
-            # Perform speaker diarization if enabled via checkbox
-            speaker_timeline = None
-            diarization_status = None
+            # Show success message
+            self.root.after(0, lambda: messagebox.showinfo(
+                "Succes (Success)",
+                "Transcriere completată cu succes! Rezultatele sunt afișate în panourile de mai jos.\n\n"
+                "(Transcription completed successfully! Results are displayed in the panels below.)"
+            ))
             
-            # Get all non-empty speaker names (optional - for custom labels)
-            speaker_names_list = [self.speaker_names[i].get().strip() for i in range(self.visible_speakers) 
-                                  if self.speaker_names[i].get().strip()]
+        except Exception as e:
+            error_msg = f"Eroare în timpul procesării (Error during processing): {str(e)}"
+            self.logger.error(error_msg)
+            self.root.after(0, lambda: self.update_status(error_msg, "red"))
+            self.root.after(0, lambda: messagebox.showerror("Eroare (Error)", error_msg))
+        
+        finally:
+            # Reset UI state
+            self.root.after(0, self.reset_ui_state)
+    
+    def _process_file(self, file_path, audio, run, header=""):
+        """
+        Transcribe (and translate) one file, appending its results to the panels.
+        
+        Args:
+            file_path: Audio/video file to process
+            audio: Decoded samples of file_path (see decode_audio)
+            run: RunSettings captured by start_processing
+            header: Text placed above this file's results (used when several files are selected)
+        
+        Returns:
+            bool: False if processing was stopped by the user
+        """
+        # Transcribe audio
+        self.root.after(0, lambda: self.update_status("Se transcrie audio... Poate dura câteva minute. (Transcribing audio... This may take a few minutes.)", "orange"))
+        
+        self.root.after(0, self._begin_partial_transcript, header)
+        result = self.transcriber.transcribe_audio(
+            audio,
+            progress_callback=self._report_progress,
+            segment_callback=self._queue_partial_text
+        )
+        
+        if not self.processing:
+            return False
+        
+        detected_language = result.get('language', 'unknown')
+        transcribed_text = result.get('text', '').strip()
+        segments = result.get('segments', [])
+        
+        # Update detected language display in GUI
+        lang_name = self.languages.get(detected_language, detected_language.upper())
+        self.root.after(0, lambda ln=lang_name: self.detected_language.set(f"— Detectat (Detected): {ln}"))
+        
+        # Store the result for later use
+        self.current_result = result
+        
+        # Perform speaker diarization if enabled via checkbox
+        speaker_timeline = None
+        diarization_status = None
+        
+        # Get all non-empty speaker names (optional - for custom labels)
+        speaker_names_list = list(run.speaker_names)
+        
+        # Check if diarization is enabled via checkbox
+        diarization_enabled = run.diarization_enabled
+        
+        if diarization_enabled:
+            self.logger.info(f"Diarization enabled. Custom speaker names: {speaker_names_list if speaker_names_list else 'None (will use default labels)'}")
             
-            # Check if diarization is enabled via checkbox
-            diarization_enabled = self.enable_diarization.get()
+            # Pre-check diarization requirements before attempting
+            is_available, prereq_error = self._check_diarization_cached()
             
-            if diarization_enabled:
-                self.logger.info(f"Diarization enabled. Custom speaker names: {speaker_names_list if speaker_names_list else 'None (will use default labels)'}")
+            if not is_available:
+                # Show warning to user about missing requirements
+                self.logger.warning(f"Speaker diarization unavailable: {prereq_error}")
+                diarization_status = prereq_error
                 
-                # Pre-check diarization requirements before attempting
-                is_available, prereq_error = check_diarization_requirements()
+                # Update GUI with clear error message
+                error_display = f"⚠️ Speaker recognition unavailable: {prereq_error}"
+                self.root.after(0, lambda msg=error_display: self.update_status(msg, "orange"))
                 
-                if not is_available:
-                    # Show warning to user about missing requirements
-                    self.logger.warning(f"Speaker diarization unavailable: {prereq_error}")
-                    diarization_status = prereq_error
-                    
-                    # Update GUI with clear error message
-                    error_display = f"⚠️ Speaker recognition unavailable: {prereq_error}"
-                    self.root.after(0, lambda msg=error_display: self.update_status(msg, "orange"))
-                    
-                    # Show message box with instructions
-                    if "HF_TOKEN" in prereq_error:
-                        self.root.after(0, lambda: messagebox.showwarning(
-                            "Speaker Recognition - Token Required",
-                            "Speaker recognition requires a HuggingFace token.\n\n"
-                            "To enable speaker recognition:\n"
-                            "1. Create a free account at huggingface.co\n"
-                            "2. Get your token at: https://huggingface.co/settings/tokens\n"
-                            "3. Go to ⚙️ Preferences and enter your token\n"
-                            "4. Restart the application\n\n"
-                            "Transcription will continue without speaker labels."
-                        ))
-                    elif "pyannote" in prereq_error:
-                        self.root.after(0, lambda: messagebox.showwarning(
-                            "Speaker Recognition - Not Installed",
-                            "Speaker recognition requires pyannote.audio.\n\n"
-                            "Install with: pip install pyannote.audio\n\n"
-                            "Transcription will continue without speaker labels."
-                        ))
-                else:
-                    # Requirements met, proceed with diarization
-                    self.root.after(0, lambda: self.update_status(
-                        "🎤 Se efectuează diarizarea vorbitorilor... (Performing speaker diarization...)", 
-                        "orange"
+                # Show message box with instructions
+                if "HF_TOKEN" in prereq_error:
+                    self.root.after(0, lambda: messagebox.showwarning(
+                        "Speaker Recognition - Token Required",
+                        "Speaker recognition requires a HuggingFace token.\n\n"
+                        "To enable speaker recognition:\n"
+                        "1. Create a free account at huggingface.co\n"
+                        "2. Get your token at: https://huggingface.co/settings/tokens\n"
+                        "3. Go to ⚙️ Preferences and enter your token\n"
+                        "4. Restart the application\n\n"
+                        "Transcription will continue without speaker labels."
+                    ))
+                elif "pyannote" in prereq_error:
+                    self.root.after(0, lambda: messagebox.showwarning(
+                        "Speaker Recognition - Not Installed",
+                        "Speaker recognition requires pyannote.audio.\n\n"
+                        "Install with: pip install pyannote.audio\n\n"
+                        "Transcription will continue without speaker labels."
                     ))
-                    self.logger.info("Starting speaker diarization...")
-                    
-                    # Call diarization - pass custom names if provided, otherwise use defaults
-                    # The diarization function will use "Speaker 1", "Speaker 2" etc. if no names provided
-                    speaker_timeline, diarization_status = perform_speaker_diarization(
-                        self.selected_file.get(),
-                        speaker_names=speaker_names_list if speaker_names_list else None,
-                        debug=debug_enabled
-                    )
-                    
-                    # Add speaker labels to segments if diarization succeeded
-                    if speaker_timeline:
-                        self.logger.info(f"✓ {diarization_status}")
-                        self.root.after(0, lambda msg=f"✓ {diarization_status}": self.update_status(msg, "green"))
-                        
-                        # Store the speaker timeline for later use
-                        self.speaker_timeline = speaker_timeline
-                        
-                        for segment in segments:
-                            segment_mid = (segment['start'] + segment['end']) / 2
-                            speaker = get_speaker_for_timestamp(speaker_timeline, segment_mid)
-                            segment['speaker'] = speaker if speaker else "Unknown"
-                        
-                        self.logger.info(f"Speaker labels assigned to {len(segments)} segments (stored for later display)")
-                    else:
-                        # Diarization failed after passing pre-checks
-                        self.logger.warning(f"Speaker diarization failed: {diarization_status}")
-                        self.root.after(0, lambda msg=f"⚠️ {diarization_status}": self.update_status(msg, "orange"))
-                        self.root.after(0, lambda: messagebox.showwarning(
-                            "Speaker Recognition Failed",
-                            f"Speaker recognition encountered an error:\n\n{diarization_status}\n\n"
-                            "Transcription will continue without speaker labels."
-                        ))
-            
-            # Format original transcript with timestamps (NO speaker labels initially)
-            # Speaker labels will only be shown when user clicks "Assign Speakers"
-            formatted_transcript = self._format_text_with_timestamps(segments, speaker_timeline, include_speakers=False)
-            
-            # Store segments for later speaker assignment (if diarization was performed)
-            if speaker_timeline:
-                self.diarization_segments = {'original': segments, 'translated': None}
-            else:
-                self.diarization_segments = None
-            
-            # Display original transcript with timestamps
-            self.root.after(0, lambda: self.original_text.insert(1.0, formatted_transcript))
-            
-            # Check if translation is needed
-            if detected_language == 'ro':
-                # Audio is already in Romanian - show the same formatted transcript
-                self.root.after(0, lambda: self.translation_text.insert(
-                    1.0,
-                    "✓ Audio-ul sursă este deja în română.\n\n"
-                    "Nu este necesară traducerea. Transcrierea cu marcaje de timp este afișată în panoul stâng.\n\n"
-                    "(Source audio is already in Romanian. No translation needed. "
-                    "The timestamped transcript is displayed in the left panel.)"
-                ))
-                self.root.after(0, lambda: self.translation_status.set("Nu e necesară (deja română / Not needed)"))
-                self.root.after(0, lambda: self.update_status(
-                    f"✓ Transcriere completă! Limbă detectată: Română (fără traducere / Transcription complete! Detected language: Romanian, no translation needed)",
-                    "green"
-                ))
             else:
-                # Translate to Romanian - segment by segment to preserve timestamps
-                if not self.processing:
-                    return
-                
+                # Requirements met, proceed with diarization
                 self.root.after(0, lambda: self.update_status(
-                    f"Limbă detectată (Detected language): {detected_language}. Se traduce în română... (Translating to Romanian...)",
+                    "🎤 Se efectuează diarizarea vorbitorilor... (Performing speaker diarization...)", 
                     "orange"
                 ))
-                self.root.after(0, lambda: self.translation_status.set("În curs (In progress...)"))
+                self.logger.info("Starting speaker diarization...")
                 
-                # Translate each segment individually to preserve timestamps and speaker labels
-                translated_segments = []
-                total_segments = len(segments)
+                # Call diarization - pass custom names if provided, otherwise use defaults
+                # The diarization function will use "Speaker 1", "Speaker 2" etc. if no names provided
+                speaker_timeline, diarization_status = perform_speaker_diarization(
+                    file_path,
+                    speaker_names=speaker_names_list if speaker_names_list else None,
+                    debug=run.debug_enabled
+                )
                 
-                for idx, segment in enumerate(segments):
-                    if not self.processing:
-                        return
-                    
-                    # Update progress
-                    progress_msg = f"Se traduce segmentul {idx + 1}/{total_segments}... (Translating segment {idx + 1}/{total_segments}...)"
-                    self.root.after(0, lambda msg=progress_msg: self.update_status(msg, "orange"))
+                # Add speaker labels to segments if diarization succeeded
+                if speaker_timeline:
+                    self.logger.info(f"✓ {diarization_status}")
+                    self.root.after(0, lambda msg=f"✓ {diarization_status}": self.update_status(msg, "green"))
                     
-                    # Get segment text
-                    segment_text = segment['text'].strip()
+                    # Store the speaker timeline for later use
+                    self.speaker_timeline = speaker_timeline
                     
-                    # Translate individual segment
-                    if segment_text:
-                        translated_text = self.transcriber.translate_to_romanian(
-                            segment_text,
-                            source_lang=detected_language
-                        )
-                    else:
-                        translated_text = ""
+                    label_segment_speakers(speaker_timeline, segments)
                     
-                    # Store translated segment with original timing and speaker info
-                    translated_segments.append({
-                        'start': segment['start'],
-                        'end': segment['end'],
-                        'text': translated_text,
-                        'speaker': segment.get('speaker')
-                    })
-                
+                    self.logger.info(f"Speaker labels assigned to {len(segments)} segments (stored for later display)")
+                else:
+                    # Diarization failed after passing pre-checks
+                    self.logger.warning(f"Speaker diarization failed: {diarization_status}")
+                    self.root.after(0, lambda msg=f"⚠️ {diarization_status}": self.update_status(msg, "orange"))
+                    self.root.after(0, lambda: messagebox.showwarning(
+                        "Speaker Recognition Failed",
+                        f"Speaker recognition encountered an error:\n\n{diarization_status}\n\n"
+                        "Transcription will continue without speaker labels."
+                    ))
+        
+        # Format original transcript with timestamps (NO speaker labels initially)
+        # Speaker labels will only be shown when user clicks "Assign Speakers"
+        formatted_transcript = self._format_text_with_timestamps(segments, speaker_timeline, include_speakers=False)
+        
+        # Store segments for later speaker assignment (if diarization was performed)
+        if speaker_timeline:
+            self.diarization_segments = {'original': segments, 'translated': None}
+        else:
+            self.diarization_segments = None
+        
+        # Display original transcript with timestamps (replacing the streamed preview)
+        self.root.after(0, lambda: self._end_partial_transcript(formatted_transcript))
+        
+        # Check if translation is needed
+        if detected_language == 'ro':
+            # Audio is already in Romanian - show the same formatted transcript
+            self.root.after(0, lambda: self.translation_text.insert(
+                tk.END,
+                header +
+                "✓ Audio-ul sursă este deja în română.\n\n"
+                "Nu este necesară traducerea. Transcrierea cu marcaje de timp este afișată în panoul stâng.\n\n"
+                "(Source audio is already in Romanian. No translation needed. "
+                "The timestamped transcript is displayed in the left panel.)"
+            ))
+            self.root.after(0, lambda: self.translation_status.set("Nu e necesară (deja română / Not needed)"))
+            self.root.after(0, lambda: self.update_status(
+                f"✓ Transcriere completă! Limbă detectată: Română (fără traducere / Transcription complete! Detected language: Romanian, no translation needed)",
+                "green"
+            ))
+        else:
+            # Translate to Romanian - segment by segment to preserve timestamps
+            if not self.processing:
+                return False
+            
+            self.root.after(0, lambda: self.update_status(
+                f"Limbă detectată (Detected language): {detected_language}. Se traduce în română... (Translating to Romanian...)",
+                "orange"
+            ))
+            self.root.after(0, lambda: self.translation_status.set("În curs (In progress...)"))
+            
+            # Translate each segment individually to preserve timestamps and speaker labels
+            translated_segments = []
+            total_segments = len(segments)
+            
+            for idx, segment in enumerate(segments):
                 if not self.processing:
-                    return
+                    return False
                 
-                # Update translation status based on result
-                translation_status = getattr(self.transcriber, 'translation_status', 'Unknown')
-                self.root.after(0, lambda: self.translation_status.set(translation_status))
+                # Update progress
+                progress_msg = f"Se traduce segmentul {idx + 1}/{total_segments}... (Translating segment {idx + 1}/{total_segments}...)"
+                self.root.after(0, lambda msg=progress_msg: self.update_status(msg, "orange"))
                 
-                # Store translated segments for later speaker assignment
-                if self.diarization_segments:
-                    self.diarization_segments['translated'] = translated_segments
+                # Get segment text
+                segment_text = segment['text'].strip()
                 
-                # Format translated segments with timestamps (NO speaker labels initially)
-                formatted_translation = self._format_text_with_timestamps(translated_segments, speaker_timeline, include_speakers=False)
-                
-                # Display translation
-                self.root.after(0, lambda: self.translation_text.insert(1.0, formatted_translation))
+                # Translate individual segment
+                if segment_text:
+                    translated_text = self.transcriber.translate_to_romanian(
+                        segment_text,
+                        source_lang=detected_language
+                    )
+                else:
+                    translated_text = ""
                 
-                status_msg = f"✓ Transcriere și traducere complete! (Transcription and translation complete!) Limbă detectată (Detected language): {detected_language} | Traducere (Translation): {translation_status}"
-                self.root.after(0, lambda: self.update_status(status_msg, "green"))
+                # Store translated segment with original timing and speaker info
+                translated_segments.append({
+                    'start': segment['start'],
+                    'end': segment['end'],
+                    'text': translated_text,
+                    'speaker': segment.get('speaker')
+                })
             
-            # Show success message
-            self.root.after(0, lambda: messagebox.showinfo(
-                "Succes (Success)",
-                "Transcriere completată cu succes! Rezultatele sunt afișate în panourile de mai jos.\n\n"
-                "(Transcription completed successfully! Results are displayed in the panels below.)"
-            ))
+            if not self.processing:
+                return False
             
-        except Exception as e:
-            error_msg = f"Eroare în timpul procesării (Error during processing): {str(e)}"
-            self.logger.error(error_msg)
-            self.root.after(0, lambda: self.update_status(error_msg, "red"))
-            self.root.after(0, lambda: messagebox.showerror("Eroare (Error)", error_msg))
+            # Update translation status based on result
+            translation_status = getattr(self.transcriber, 'translation_status', 'Unknown')
+            self.root.after(0, lambda: self.translation_status.set(translation_status))
+            
+            # Store translated segments for later speaker assignment
+            if self.diarization_segments:
+                self.diarization_segments['translated'] = translated_segments
+            
+            # Format translated segments with timestamps (NO speaker labels initially)
+            formatted_translation = self._format_text_with_timestamps(translated_segments, speaker_timeline, include_speakers=False)
+            
+            # Display translation
+            self.root.after(0, lambda: self.translation_text.insert(tk.END, header + formatted_translation))
+            
+            status_msg = f"✓ Transcriere și traducere complete! (Transcription and translation complete!) Limbă detectată (Detected language): {detected_language} | Traducere (Translation): {translation_status}"
+            self.root.after(0, lambda: self.update_status(status_msg, "green"))
         
-        finally:
-            # Reset UI state
-            self.root.after(0, self.reset_ui_state)
+        return True
+    
+    def _report_progress(self, current_sec, total_sec):
+        """Forward Whisper decoding progress to the progress bar (called from the worker thread)."""
+        percent = min(100.0, 100.0 * current_sec / total_sec) if total_sec else 0.0
+        self.root.after(0, lambda: self.progress.config(value=percent))
+    
+    def _begin_partial_transcript(self, header):
+        """Write this file's header and mark where its streamed preview starts."""
+        self.original_text.insert(tk.END, header)
+        self.original_text.mark_set("partial_start", "end-1c")
+        self.original_text.mark_gravity("partial_start", tk.LEFT)
+    
+    def _queue_partial_text(self, text):
+        """Buffer a decoded segment's text (called from the worker thread)."""
+        with self._partial_lock:
+            self._partial_text.append(text.strip())
+            if self._partial_flush_id is None:
+                # Coalesce segments arriving within 100 ms into one widget insert
+                self._partial_flush_id = self.root.after(100, self._flush_partial_text)
+    
+    def _flush_partial_text(self):
+        """Append buffered segment text to the original-text panel."""
+        with self._partial_lock:
+            chunk, self._partial_text = self._partial_text, []
+            self._partial_flush_id = None
+        if chunk:
+            self.original_text.insert(tk.END, " ".join(chunk) + " ")
+            self.original_text.see(tk.END)
+    
+    def _end_partial_transcript(self, final_text):
+        """Replace the streamed preview with the final formatted transcript."""
+        with self._partial_lock:
+            self._partial_text = []
+            flush_id, self._partial_flush_id = self._partial_flush_id, None
+        if flush_id is not None:
+            self.root.after_cancel(flush_id)
+        self.original_text.delete("partial_start", tk.END)
+        self.original_text.insert(tk.END, final_text)
     
     def reset_ui_state(self):
         """Reset UI state after processing."""
@@ -1186,7 +1422,7 @@ class TranscribeROGUI:
         
         Args:
             segments: List of transcription segments from Whisper
-            speaker_timeline: Optional dictionary mapping time ranges to speakers (deprecated, kept for compatibility)
+            speaker_timeline: Optional SpeakerTimeline from diarization (deprecated, kept for compatibility)
             include_speakers: Whether to include speaker labels in the output
         
         Returns: